@@ -11,7 +11,7 @@ import datetime as dt
 from operator import itemgetter
 from collections import defaultdict, Counter
 from itertools import chain
-from functools import reduce
+from functools import reduce, partial
 
 import param
 import numpy as np
@@ -29,6 +29,10 @@ ALIASES = {'key_dimensions': 'kdims', 'value_dimensions': 'vdims',
 
 title_format = "{name}: {val}{unit}"
 
+# strftime formats which can be rendered by np.datetime_as_string
+# mapping to the datetime unit and the width of the formatted string
+_dt64_formats = {'%Y-%m-%d %H:%M:%S': ('s', 19), '%Y-%m-%d': ('D', 10)}
+
 def param_aliases(d):
     """
     Called from __setstate__ in LabelledData in order to load
@@ -125,6 +129,15 @@ def process_dimensions(kdims, vdims):
     return dimensions
 
 
+def _map_item(map_fn, specs, clone, obj):
+    """
+    Applies LabelledData.map to an item of a container. Defined at the
+    module level so it may be pickled when mapping using a process
+    pool.
+    """
+    return obj.map(map_fn, specs, clone)
+
+
 class redim(object):
     """
     Utility that supports re-dimensioning any HoloViews object via the
@@ -492,7 +505,8 @@ class Dimension(param.Parameterized):
         Compatibility for pickles before alias attribute was introduced.
         """
         super(Dimension, self).__setstate__(d)
-        self.label = self.name
+        if '_label_param_value' not in d:
+            self.label = self.name
 
     def __eq__(self, other):
         "Implements equals operator including sanitized comparison."
@@ -563,6 +577,54 @@ class Dimension(param.Parameterized):
                     return formatter % value
         return unicode(bytes_to_unicode(value))
 
+    def pprint_values(self, values):
+        """Applies the applicable formatter to an array of values.
+
+        Equivalent to calling pprint_value on each value but formats
+        each unique value only once and broadcasts the results, while
+        datetime arrays without a formatter are formatted by NumPy.
+
+        Args:
+            values: Array or list of dimension values to format
+
+        Returns:
+            Array of formatted dimension values
+        """
+        values = np.asarray(values)
+        if values.ndim != 1:
+            return np.array([self.pprint_value(v) for v in values])
+        elif values.dtype.kind == 'M' and self.type is None:
+            formatter = (self.value_format if self.value_format
+                         else self.type_formatters.get(np.datetime64))
+            if not formatter:
+                return np.datetime_as_string(values)
+            elif (isinstance(formatter, basestring) and formatter in _dt64_formats
+                  and len(values)):
+                unit, width = _dt64_formats[formatter]
+                strings = np.datetime_as_string(values, unit=unit)
+                chars = strings.view('U1').reshape(len(strings), -1)
+                # Fall back if any year does not fit into four digits
+                if chars.shape[1] == width or (chars[:, width] == '').all():
+                    chars = np.array(chars[:, :width])
+                    if unit != 'D':
+                        # Replace ISO separator between date and time
+                        chars[~np.isnat(values), 10] = ' '
+                    return chars.view('U%d' % width)[:, 0]
+        try:
+            if values.dtype.kind == 'O' and util.pd:
+                codes, unique = util.pd.factorize(values)
+            else:
+                unique, codes = np.unique(values, return_inverse=True)
+        except TypeError:
+            unique = None
+        if unique is None or (values.dtype.kind == 'O' and not
+                              (all(isinstance(v, basestring) for v in unique)
+                               and (codes >= 0).all())):
+            # Mixed objects may compare equal (e.g. 1 and 1.0) and
+            # missing values are not assigned a code
+            return np.array([self.pprint_value(v) for v in values])
+        return np.array([self.pprint_value(v) for v in unique])[codes]
+
     def pprint_value_string(self, value):
         """Pretty print the dimension value and unit.
 
@@ -790,7 +852,8 @@ class LabelledData(param.Parameterized):
         return accumulator
 
 
-    def map(self, map_fn, specs=None, clone=True):
+    def map(self, map_fn, specs=None, clone=True, executor=None,
+            workers=None, chunksize=None):
         """Map a function to all objects matching the specs
 
         Recursively replaces elements using a map function when the
@@ -806,6 +869,13 @@ class LabelledData(param.Parameterized):
                 to select objects to return, by default applies to all
                 objects.
             clone: Whether to clone the object or transform inplace
+            executor (optional): Execution backend for the items
+                Whether to map the items of a container concurrently
+                on a pool of 'threads' or 'processes', by default the
+                items are processed sequentially. When using processes
+                the map_fn and objects must be picklable.
+            workers (int, optional): Number of executor workers
+            chunksize (int, optional): Items submitted to a worker at once
 
         Returns:
             Returns the object after the map_fn has been applied
@@ -816,8 +886,11 @@ class LabelledData(param.Parameterized):
 
         if self._deep_indexable:
             deep_mapped = self.clone(shared_data=False) if clone else self
-            for k, v in self.items():
-                new_val = v.map(map_fn, specs, clone)
+            items = list(self.items())
+            mapped = util.parallel_map(partial(_map_item, map_fn, specs, clone),
+                                       [v for _, v in items], executor,
+                                       workers, chunksize)
+            for (k, _), new_val in zip(items, mapped):
                 if new_val is not None:
                     deep_mapped[k] = new_val
             if applies: deep_mapped = map_fn(deep_mapped)
@@ -829,6 +902,7 @@ class LabelledData(param.Parameterized):
     def __getstate__(self):
         "Ensures pickles save options applied to this objects."
         obj_dict = self.__dict__.copy()
+        obj_dict.pop('_dim_lookup', None)
         try:
             if Store.save_option_state and (obj_dict.get('id', None) is not None):
                 custom_key = '_custom_option_%d' % obj_dict['id']
@@ -965,6 +1039,7 @@ class Dimensioned(LabelledData):
         self.ndims = len(self.kdims)
         cdims = [(d.name, val) for d, val in self.cdims.items()]
         self._cached_constants = OrderedDict(cdims)
+        self._dim_lookup = None
         self._settings = None
         self.redim = redim(self)
 
@@ -1022,14 +1097,21 @@ class Dimensioned(LabelledData):
         elif label:
             raise ValueError("label needs to be one of True, False, 'name' or 'label'")
 
+        lookup = self._dimension_lookup()
+        groups = tuple(selection) if isinstance(selection, list) else (selection,)
+        cache_key = (groups, label)
+        cacheable = not self._deep_indexable and 'constant' not in groups
+        if cacheable and cache_key in lookup['selections']:
+            return list(lookup['selections'][cache_key])
+
         lambdas = {'k': (lambda x: x.kdims, {'full_breadth': False}),
                    'v': (lambda x: x.vdims, {}),
                    'c': (lambda x: x.cdims, {})}
         aliases = {'key': 'k', 'value': 'v', 'constant': 'c'}
         if selection in ['all', 'ranges']:
-            groups = [d for d in self._dim_groups if d != 'cdims']
-            dims = [dim for group in groups
-                    for dim in getattr(self, group)]
+            ddims = self.ddims
+            cacheable = cacheable and not ddims
+            dims = lookup['dims'] + ddims
         elif isinstance(selection, list):
             dims =  [dim for group in selection
                      for dim in getattr(self, '%sdims' % aliases.get(group))]
@@ -1041,8 +1123,46 @@ class Dimensioned(LabelledData):
         else:
             raise KeyError("Invalid selection %r, valid selections include"
                            "'all', 'value' and 'key' dimensions" % repr(selection))
-        return [(dim.label if label == 'long' else dim.name)
+        dims = [(dim.label if label == 'long' else dim.name)
                 if label else dim for dim in dims]
+        if cacheable:
+            lookup['selections'][cache_key] = dims
+            dims = list(dims)
+        return dims
+
+
+    def _dimension_lookup(self):
+        """Returns lookup tables for the key and value dimensions.
+
+        The tables map each Dimension, name, label and sanitized name
+        to the corresponding Dimension and index. They are rebuilt
+        only when the kdims or vdims are replaced or modified, e.g.
+        when setting new dimensions or after a redim.
+
+        Returns:
+            Dictionary containing the list of dimensions ('dims'), a
+            map to the Dimension objects ('names'), a map to the
+            dimension indexes ('indexes') and a cache of
+            dimension selections ('selections')
+        """
+        kdims, vdims = self.kdims, self.vdims
+        signature = (tuple(map(id, kdims)), tuple(map(id, vdims)))
+        lookup = getattr(self, '_dim_lookup', None)
+        if lookup is not None and lookup['signature'] == signature:
+            return lookup
+
+        dims = kdims+vdims
+        name_map = {dim.name: dim for dim in dims}
+        name_map.update({dim.label: dim for dim in dims})
+        name_map.update({util.dimension_sanitizer(dim.name): dim for dim in dims})
+        indexes = {}
+        for i, dim in enumerate(dims):
+            for key in (dim.name, dim.label, util.dimension_sanitizer(dim.name)):
+                indexes.setdefault(key, i)
+        self._dim_lookup = lookup = dict(
+            signature=signature, dims=dims, names=name_map,
+            indexes=indexes, selections={})
+        return lookup
 
 
     def get_dimension(self, dimension, default=None, strict=False):
@@ -1060,8 +1180,10 @@ class Dimensioned(LabelledData):
             raise TypeError('Dimension lookup supports int, string, '
                             'and Dimension instances, cannot lookup '
                             'Dimensions using %s type.' % type(dimension).__name__)
-        all_dims = self.dimensions()
+        lookup = self._dimension_lookup()
+        ddims = self.ddims
         if isinstance(dimension, int):
+            all_dims = lookup['dims'] + ddims if ddims else lookup['dims']
             if 0 <= dimension < len(all_dims):
                 return all_dims[dimension]
             elif strict:
@@ -1069,9 +1191,13 @@ class Dimensioned(LabelledData):
             else:
                 return default
         dimension = dimension_name(dimension)
-        name_map = {dim.name: dim for dim in all_dims}
-        name_map.update({dim.label: dim for dim in all_dims})
-        name_map.update({util.dimension_sanitizer(dim.name): dim for dim in all_dims})
+        if ddims:
+            all_dims = lookup['dims'] + ddims
+            name_map = {dim.name: dim for dim in all_dims}
+            name_map.update({dim.label: dim for dim in all_dims})
+            name_map.update({util.dimension_sanitizer(dim.name): dim for dim in all_dims})
+        else:
+            name_map = lookup['names']
         if strict and dimension not in name_map:
             raise KeyError("Dimension %r not found." % dimension)
         else:
@@ -1094,12 +1220,11 @@ class Dimensioned(LabelledData):
             else:
                 return IndexError('Dimension index out of bounds')
         dim = dimension_name(dimension)
-        try:
-            dimensions = self.kdims+self.vdims
-            return [i for i, d in enumerate(dimensions) if d == dim][0]
-        except IndexError:
+        index = self._dimension_lookup()['indexes'].get(dim)
+        if index is None:
             raise Exception("Dimension %s not found in %s." %
                             (dim, self.__class__.__name__))
+        return index
 
 
     def get_dimension_type(self, dim):
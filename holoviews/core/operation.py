@@ -3,6 +3,7 @@ Operations manipulate Elements, HoloMaps and Layouts, typically for
 the purposes of analysis or visualization.
 """
 import param
+from . import util
 from .dimension import ViewableElement
 from .element import Element, HoloMap, GridSpace, NdLayout
 from .layout import Layout
@@ -61,6 +62,24 @@ class Operation(param.ParameterizedFunction):
         List of streams that are applied if dynamic=True, allowing
         for dynamic interaction with the plot.""")
 
+    executor = param.ObjectSelector(default=None, allow_None=True,
+                                    objects=[None, 'threads', 'processes'], doc="""
+       Execution backend used to process the frames of a HoloMap. By
+       default frames are processed sequentially, 'threads' and
+       'processes' process independent frames concurrently on a pool
+       of threads or processes and reassemble the results in order.
+       When using processes the operation and elements must be
+       picklable.""")
+
+    workers = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+       The number of workers used by the executor, defaults to the
+       number of CPUs.""")
+
+    chunksize = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+       The number of frames submitted to each worker at once, by
+       default the chunksize is chosen based on the number of frames
+       and workers.""")
+
     # Hooks to allow external libraries to extend existing operations.
     # Preprocessor hooks should accept the operation and input element
     # and return a dictionary of data which will be made available to
@@ -169,15 +188,35 @@ class Operation(param.ParameterizedFunction):
             samples = tuple(d.values for d in element.kdims)
             processed = self(element[samples], **params)
         elif isinstance(element, HoloMap):
-            mapped_items = [(k, self._apply(el, key=k))
-                            for k, el in element.items()]
-            processed = element.clone(mapped_items)
+            if self.p.executor == 'processes':
+                # Pickle a plain instance rather than the ParamOverrides
+                params = dict(self.get_param_values(), **self.p)
+                operation = self.instance(**params)
+            else:
+                operation = self
+            items = [(operation, k, el) for k, el in element.items()]
+            mapped = util.parallel_map(_apply_operation, items, self.p.executor,
+                                       self.p.workers, self.p.chunksize)
+            processed = element.clone(list(zip(element.keys(), mapped)))
         else:
             raise ValueError("Cannot process type %r" % type(element).__name__)
         return processed
 
 
 
+def _apply_operation(args):
+    """
+    Applies an operation to an element given a tuple of the operation,
+    key and element. Defined at the module level so it may be pickled
+    when processing HoloMap frames using a process pool.
+    """
+    operation, key, element = args
+    if getattr(operation, 'p', None) is None:
+        operation.p = param.ParamOverrides(operation, {})
+    return operation._apply(element, key=key)
+
+
+
 class OperationCallable(Callable):
     """
     OperationCallable allows wrapping an Operation and the objects it is
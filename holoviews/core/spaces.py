@@ -1,4 +1,5 @@
 import itertools
+import time
 import types
 import inspect
 
@@ -7,6 +8,7 @@ from itertools import groupby
 from functools import partial
 from collections import defaultdict
 from contextlib import contextmanager
+from threading import Event, Lock, Thread
 
 import numpy as np
 import param
@@ -669,6 +671,11 @@ class Callable(param.Parameterized):
         return self.argspec == noargs
 
 
+    def _resolve(self, ret):
+        "Runs coroutines returned by async def callbacks to completion"
+        return util.run_coroutine(ret) if util.iscoroutine(ret) else ret
+
+
     def clone(self, callable=None, **overrides):
         """Clones the Callable optionally with new settings
 
@@ -702,7 +709,8 @@ class Callable(param.Parameterized):
         # Nothing to do for callbacks that accept no arguments
         kwarg_hash = kwargs.pop('_memoization_hash_', ())
         (self.args, self.kwargs) = (args, kwargs)
-        if not args and not kwargs and not any(kwarg_hash): return self.callable()
+        if not args and not kwargs and not any(kwarg_hash):
+            return self._resolve(self.callable())
         inputs = [i for i in self.inputs if isinstance(i, DynamicMap)]
         streams = []
         for stream in [s for i in inputs for s in get_nested_streams(i)]:
@@ -732,8 +740,8 @@ class Callable(param.Parameterized):
             args, kwargs = (), dict(pos_kwargs, **kwargs)
 
         try:
-            ret = self.callable(*args, **kwargs)
-        except KeyError:
+            ret = self._resolve(self.callable(*args, **kwargs))
+        except (KeyError, util.CallbackCancelled):
             # KeyError is caught separately because it is used to signal
             # invalid keys on DynamicMap and should not warn
             raise
@@ -913,6 +921,45 @@ class DynamicMap(HoloMap):
        cache where the least recently used item is overwritten once
        the cache is full.""")
 
+    executor = param.ObjectSelector(default=None, allow_None=True,
+                                    objects=[None, 'threads'], doc="""
+       Execution mode for callbacks triggered by stream events when
+       the DynamicMap is displayed on a bokeh server. By default the
+       callback is executed synchronously, blocking the server until
+       the updated plot is rendered. If set to 'threads' the callback
+       is executed on a background thread, callbacks superseded by
+       newer events are dropped (or cancelled in the case of async def
+       callbacks) and only the latest result is applied to the
+       plot.""")
+
+    max_rate = param.Number(default=None, bounds=(0, None), doc="""
+       Maximum number of updates per second triggered by stream
+       events. When set, events on streams with this DynamicMap as
+       their source (the default for streams without an explicit
+       source) which do not declare their own trigger_policy are
+       throttled and coalesced into a single update.""")
+
+    prefetch = param.Integer(default=0, bounds=(0, None), doc="""
+       Number of neighboring keys along each key dimension to compute
+       speculatively in the background after a key has been
+       evaluated, e.g. when scrubbing a slider. Neighbors are
+       determined from the Dimension values or, for numeric dimensions
+       with a bounded range, from the Dimension step. Disabled by
+       default.""")
+
+    prefetch_workers = param.Integer(default=1, bounds=(1, None), doc="""
+       Maximum number of background threads used to prefetch keys
+       concurrently.""")
+
+    prefetch_frames = param.Integer(default=20, bounds=(1, None), doc="""
+       Maximum number of prefetched frames which have not been
+       requested yet to hold in memory. Once the budget is exhausted
+       the least recently prefetched frames are discarded.""")
+
+    # Guards the executor results and latency metrics, which may be
+    # updated from worker threads
+    _results_lock = Lock()
+
     def __init__(self, callback, initial_items=None, streams=None, **params):
         streams = (streams or [])
 
@@ -958,6 +1005,38 @@ class DynamicMap(HoloMap):
                 stream.source = self
         self.redim = redim(self, mode='dynamic')
         self.periodic = periodic(self)
+        self._latency = dict(calls=0, total=0., last=None, max=None, superseded=0)
+        self._results = {}
+
+    @property
+    def latency(self):
+        """
+        Returns latency metrics for the callback, including the number
+        of calls and the last, mean and maximum time in seconds taken
+        to compute a frame. When using an executor the latency is
+        measured from the stream event to the time the result is
+        applied and the number of superseded (i.e. dropped or
+        cancelled) callbacks is also recorded.
+        """
+        stats = self._latency
+        calls = stats['calls']
+        return dict(calls=calls, last=stats['last'], max=stats['max'],
+                    mean=(stats['total']/calls) if calls else None,
+                    superseded=stats['superseded'])
+
+    def _record_latency(self, latency):
+        "Records the latency of a callback in the metrics"
+        with self._results_lock:
+            stats = self._latency
+            stats['calls'] += 1
+            stats['total'] += latency
+            stats['last'] = latency
+            stats['max'] = latency if stats['max'] is None else max(stats['max'], latency)
+
+    def _record_superseded(self):
+        "Records a superseded executor callback in the metrics"
+        with self._results_lock:
+            self._latency['superseded'] += 1
 
     @property
     def unbounded(self):
@@ -1065,6 +1144,141 @@ class DynamicMap(HoloMap):
         Stream.trigger(streams)
 
 
+    def __getstate__(self):
+        "Drops the prefetching state which cannot be pickled."
+        obj_dict = super(DynamicMap, self).__getstate__()
+        obj_dict.pop('_prefetcher', None)
+        return obj_dict
+
+
+    def _prefetch_state(self):
+        "Returns the prefetching state, initializing it if required."
+        state = getattr(self, '_prefetcher', None)
+        if state is None:
+            state = dict(lock=Lock(), queue=[], frames=OrderedDict(),
+                         pending={}, threads=0, generation=0)
+            self._prefetcher = state
+        return state
+
+
+    def _prefetch_keys(self, key):
+        """
+        Returns the keys neighboring the supplied key along each key
+        dimension in order of increasing distance, preferring keys
+        ahead of the current key.
+        """
+        stream_params = set(util.stream_parameters(self.streams))
+        neighbors = []
+        for i in range(1, self.prefetch+1):
+            for d, (kdim, value) in enumerate(zip(self.kdims, key)):
+                if kdim.name in stream_params:
+                    continue
+                values = None
+                if kdim.values:
+                    values = list(kdim.values)
+                    if value not in values:
+                        continue
+                    idx = values.index(value)
+                    candidates = [values[idx+i] if idx+i < len(values) else None,
+                                  values[idx-i] if idx-i >= 0 else None]
+                elif kdim.step is not None and util.isnumeric(value):
+                    low, high = util.max_range([kdim.range, kdim.soft_range])
+                    if not (util.isfinite(low) and util.isfinite(high)):
+                        continue
+                    candidates = [value+i*kdim.step, value-i*kdim.step]
+                    candidates = [c if low <= c <= high else None
+                                  for c in candidates]
+                else:
+                    continue
+                for candidate in candidates:
+                    if candidate is None:
+                        continue
+                    neighbor = key[:d] + (candidate,) + key[d+1:]
+                    if neighbor not in neighbors:
+                        neighbors.append(neighbor)
+        return neighbors
+
+
+    def _prefetch(self, key):
+        """
+        Queues the keys neighboring the supplied key for evaluation on
+        background threads, replacing any previously queued keys which
+        have not been started yet.
+        """
+        state = self._prefetch_state()
+        memoize = not any(s.transient and s._triggering for s in self.streams)
+        queue = []
+        for neighbor in self._prefetch_keys(key):
+            if neighbor in self.data or neighbor in state['frames']:
+                continue
+            try:
+                args, kwargs = self._callback_arguments(*neighbor)
+            except KeyError:
+                continue
+            queue.append((neighbor, args, kwargs, memoize))
+        with state['lock']:
+            state['queue'] = queue
+            nthreads = min(len(queue), self.prefetch_workers-state['threads'])
+            state['threads'] += max(nthreads, 0)
+        for _ in range(nthreads):
+            thread = Thread(target=self._prefetch_worker, args=(state,))
+            thread.daemon = True
+            thread.start()
+
+
+    def _prefetch_worker(self, state):
+        """
+        Evaluates queued keys until the prefetch queue is exhausted.
+        Keys are evaluated on a clone of the callback so the arguments
+        and memoized state of the callback used by the main thread are
+        not modified.
+        """
+        callback = self.callback.clone()
+        while True:
+            with state['lock']:
+                queue = [q for q in state['queue'] if q[0] not in state['pending']]
+                if not queue:
+                    state['threads'] -= 1
+                    return
+                key, args, kwargs, memoize = queue[0]
+                state['queue'] = queue[1:]
+                done = state['pending'][key] = Event()
+                generation = state['generation']
+            try:
+                start = time.time()
+                callback._stream_memoization = callback.memoize and memoize
+                retval = self._style(callback(*args, **kwargs))
+                self._record_latency(time.time()-start)
+            except Exception:
+                # Failed keys are evaluated (and raise) on request
+                retval = None
+            with state['lock']:
+                # Discard results of keys queued before a reset
+                if retval is not None and generation == state['generation']:
+                    frames = state['frames']
+                    frames[key] = retval
+                    while len(frames) > self.prefetch_frames:
+                        frames.pop(next(iter(frames)))
+                if state['pending'].get(key) is done:
+                    state['pending'].pop(key)
+                done.set()
+
+
+    def _prefetched(self, key):
+        """
+        Returns the prefetched frame for the supplied key, waiting for
+        the evaluation to complete if it is in progress, or None if
+        the key has not been prefetched.
+        """
+        state = self._prefetch_state()
+        with state['lock']:
+            done = state['pending'].get(key)
+        if done is not None:
+            done.wait()
+        with state['lock']:
+            return state['frames'].pop(key, None)
+
+
     def _style(self, retval):
         "Applies custom option tree to values return by the callback."
         if self.id not in Store.custom_options():
@@ -1073,8 +1287,11 @@ class DynamicMap(HoloMap):
         return retval.opts(spec)
 
 
-    def _execute_callback(self, *args):
-        "Executes the callback with the appropriate args and kwargs"
+    def _callback_arguments(self, *args):
+        """
+        Returns the args and kwargs to call the callback with given a
+        key, capturing the current state of the streams.
+        """
         self._validate_key(args)      # Validate input key
 
         # Additional validation needed to ensure kwargs don't clash
@@ -1091,9 +1308,20 @@ class DynamicMap(HoloMap):
             kwargs = dict(flattened)
         if not isinstance(self.callback, Generator):
             kwargs['_memoization_hash_'] = hash_items
+        return args, kwargs
+
 
+    def _execute_callback(self, *args):
+        "Executes the callback with the appropriate args and kwargs"
+        with self._results_lock:
+            if args in self._results:
+                # Result computed by an executor
+                return self._results.pop(args)
+        cb_args, cb_kwargs = self._callback_arguments(*args)
+        start = time.time()
         with dynamicmap_memoization(self.callback, self.streams):
-            retval = self.callback(*args, **kwargs)
+            retval = self.callback(*cb_args, **cb_kwargs)
+        self._record_latency(time.time()-start)
         return self._style(retval)
 
 
@@ -1236,6 +1464,12 @@ class DynamicMap(HoloMap):
     def reset(self):
         "Clear the DynamicMap cache"
         self.data = OrderedDict()
+        state = self._prefetch_state()
+        with state['lock']:
+            state['queue'] = []
+            state['frames'].clear()
+            state['pending'].clear()
+            state['generation'] += 1
         return self
 
 
@@ -1374,12 +1608,21 @@ class DynamicMap(HoloMap):
         if product is not None:
             return product
 
+        prefetch = self.prefetch and not (dimensionless or empty)
+        if cache is not None:
+            if prefetch:
+                self._prefetch(tuple_key)
+            return cache
+
         # Not a cross product and nothing cached so compute element.
-        if cache is not None: return cache
-        val = self._execute_callback(*tuple_key)
+        val = self._prefetched(tuple_key) if prefetch else None
+        if val is None:
+            val = self._execute_callback(*tuple_key)
         if data_slice:
             val = self._dataslice(val, data_slice)
         self._cache(tuple_key, val)
+        if prefetch:
+            self._prefetch(tuple_key)
         return val
 
 
@@ -12,7 +12,7 @@ from functools import partial
 from contextlib import contextmanager
 from distutils.version import LooseVersion as _LooseVersion
 
-from threading import Thread, Event
+from threading import Thread, Event, local
 import numpy as np
 import param
 
@@ -287,6 +287,166 @@ class periodic(Thread):
 
 
 
+def parallel_map(fn, items, executor=None, workers=None, chunksize=None):
+    """
+    Applies the function to each of the supplied items, optionally
+    executing the calls concurrently on a pool of threads or
+    processes. Results are always returned in the order of the
+    supplied items.
+
+    Args:
+        fn: Function to apply to each item
+        items: Iterable of items to apply the function to
+        executor: Execution backend, one of None (sequential),
+            'threads' or 'processes'. When using processes the
+            function and items must be picklable.
+        workers: Number of workers (defaults to the number of CPUs)
+        chunksize: Number of items submitted to a worker at once
+
+    Returns:
+        List of results in the order of the supplied items
+    """
+    items = list(items)
+    if executor is None or len(items) < 2:
+        return [fn(item) for item in items]
+    elif executor == 'threads':
+        from multiprocessing.pool import ThreadPool as Pool
+    elif executor == 'processes':
+        from multiprocessing import Pool
+    else:
+        raise ValueError("Executor %r not recognized, must be one of "
+                         "None, 'threads' or 'processes'." % executor)
+    if workers is None:
+        from multiprocessing import cpu_count
+        workers = cpu_count()
+    pool = Pool(max(1, min(workers, len(items))))
+    try:
+        return pool.map(fn, items, chunksize)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def tree_reduce(fn, items, executor=None, workers=None):
+    """
+    Reduces the supplied items using a binary function by combining
+    adjacent pairs of items until a single item remains. The pairs at
+    each level of the tree may be combined concurrently using the
+    executor and workers accepted by parallel_map. The function should
+    be associative since the order of pairwise combinations differs
+    from a sequential reduction.
+
+    Args:
+        fn: Binary function combining two items
+        items: Iterable of items to reduce
+        executor: Execution backend, one of None (sequential),
+            'threads' or 'processes'.
+        workers: Number of workers (defaults to the number of CPUs)
+
+    Returns:
+        The reduced item
+    """
+    items = list(items)
+    if not items:
+        raise ValueError('Cannot reduce an empty sequence of items.')
+    while len(items) > 1:
+        pairs = list(zip(items[::2], items[1::2]))
+        reduced = parallel_map(_apply_pair, [(fn, pair) for pair in pairs],
+                               executor, workers)
+        items = reduced + items[len(pairs)*2:]
+    return items[0]
+
+
+def _apply_pair(args):
+    fn, (item1, item2) = args
+    return fn(item1, item2)
+
+
+# Thread-local state used to declare when an executing coroutine
+# callback has been superseded and should be cancelled
+_coroutine_state = local()
+
+
+class CallbackCancelled(Exception):
+    "Raised when a coroutine callback is cancelled before completing."
+
+
+def iscoroutine(obj):
+    """
+    Whether the object is a coroutine, e.g. as returned by calling an
+    async def function.
+    """
+    return getattr(inspect, 'iscoroutine', lambda x: False)(obj)
+
+
+@contextmanager
+def cancel_when(predicate):
+    """
+    Context manager which declares a predicate, which when it returns
+    True cancels any coroutine executed with run_coroutine in the
+    current thread.
+    """
+    previous = getattr(_coroutine_state, 'cancelled', None)
+    _coroutine_state.cancelled = predicate
+    try:
+        yield
+    finally:
+        _coroutine_state.cancelled = previous
+
+
+def run_coroutine(coro, poll=0.01):
+    """
+    Runs the coroutine to completion on a new event loop and returns
+    the result. If an event loop is already running in the current
+    thread the coroutine is executed on a separate thread. If a
+    cancellation predicate was declared using cancel_when the
+    predicate is polled and the coroutine is cancelled as soon as it
+    returns True, raising a CallbackCancelled exception.
+    """
+    import asyncio
+    cancelled = getattr(_coroutine_state, 'cancelled', None)
+
+    def run():
+        loop = asyncio.new_event_loop()
+        task = loop.create_task(coro)
+        def check():
+            if task.done():
+                return
+            elif cancelled():
+                task.cancel()
+            else:
+                loop.call_later(poll, check)
+        if cancelled is not None:
+            loop.call_later(poll, check)
+        try:
+            return loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            raise CallbackCancelled('Coroutine callback was cancelled')
+        finally:
+            loop.close()
+
+    try:
+        running = asyncio.get_event_loop().is_running()
+    except RuntimeError:
+        running = False
+    if not running:
+        return run()
+
+    result = {}
+    def target():
+        try:
+            result['value'] = run()
+        except Exception as e:
+            result['error'] = e
+    thread = Thread(target=target)
+    thread.start()
+    thread.join()
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+
+
 def deephash(obj):
     """
     Given an object, return a hash using HashableJSON. This hash is not
@@ -816,6 +816,7 @@ class QuadMesh(Dataset, Element2D):
     _binned = True
 
     def __init__(self, data, kdims=None, vdims=None, **params):
+        self._triangulation = None
         super(QuadMesh, self).__init__(data, kdims, vdims, **params)
         if not self.interface.gridded:
             raise DataError("%s type expects gridded data, %s is columnar."
@@ -839,10 +840,15 @@ class QuadMesh(Dataset, Element2D):
         super(Dataset, self).__setstate__(state)
 
 
-    def trimesh(self):
+    def _triangulate(self):
         """
-        Converts a QuadMesh into a TriMesh.
+        Computes the vertices and triangle simplices of the mesh. Since
+        these only depend on the coordinates they are computed once and
+        cached on the element.
         """
+        if getattr(self, '_triangulation', None) is not None:
+            return self._triangulation
+
         # Generate vertices
         xs = self.interface.coords(self, 0, edges=True)
         ys = self.interface.coords(self, 1, edges=True)
@@ -870,7 +876,15 @@ class QuadMesh(Dataset, Element2D):
         t1 = np.concatenate([t1s, t6s])
         t2 = np.concatenate([t2s, t5s])
         t3 = np.concatenate([t3s, t4s])
-        ts = (t1, t2, t3)
+        self._triangulation = (vertices, (t1, t2, t3))
+        return self._triangulation
+
+
+    def trimesh(self):
+        """
+        Converts a QuadMesh into a TriMesh.
+        """
+        vertices, ts = self._triangulate()
         for vd in self.vdims:
             zs = self.dimension_values(vd)
             ts = ts + (np.concatenate([zs, zs]),)
@@ -1,4 +1,5 @@
 import itertools
+import warnings
 
 import param
 import numpy as np
@@ -89,6 +90,29 @@ def compute_slice_bounds(slices, scs, shape):
     return BoundingBox(points=((l, b), (r, t)))
 
 
+def downsample_2d(array, reduction='mean'):
+    """
+    Downsamples a 2D array by a factor of two along both axes using
+    the supplied reduction, which may be one of 'mean', 'max', 'min'
+    or 'nearest'. Axes of odd length are padded by repeating the last
+    row or column.
+    """
+    if reduction == 'nearest':
+        return array[::2, ::2]
+    h, w = array.shape
+    if h % 2 or w % 2:
+        array = np.pad(array, ((0, h % 2), (0, w % 2)), mode='edge')
+    blocks = array.reshape(array.shape[0]//2, 2, array.shape[1]//2, 2)
+    if array.dtype.kind == 'f':
+        fn = {'mean': np.nanmean, 'max': np.nanmax, 'min': np.nanmin}[reduction]
+        with warnings.catch_warnings():
+            # Blocks consisting only of NaNs are expected
+            warnings.filterwarnings('ignore', r'All-NaN|Mean of empty')
+            return fn(blocks, axis=(1, 3))
+    fn = {'mean': np.mean, 'max': np.max, 'min': np.min}[reduction]
+    return fn(blocks, axis=(1, 3)).astype(array.dtype)
+
+
 def reduce_fn(x):
     """
     Aggregation function to get the first non-zero value.
@@ -246,49 +270,72 @@ def quadratic_bezier(start, end, c0=(0, 0), c1=(0, 0), steps=50):
     return np.column_stack([xs, ys])
 
 
-def connect_edges_pd(graph):
+def _lookup_nodes(index, values, drop_missing=True):
     """
-    Given a Graph element containing abstract edges compute edge
-    segments directly connecting the source and target nodes. This
-    operation depends on pandas and is a lot faster than the pure
-    NumPy equivalent.
+    Returns the integer positions of the supplied node indices within
+    the index array, using a hash lookup if pandas is available and a
+    sorted search otherwise. The first occurrence of a duplicated node
+    index is used. Edges referencing missing nodes are assigned a
+    position of -1 if drop_missing is enabled, otherwise a ValueError
+    is raised.
     """
-    edges = graph.dframe()
-    edges.index.name = 'graph_edge_index'
-    edges = edges.reset_index()
-    nodes = graph.nodes.dframe()
-    src, tgt = graph.kdims
-    x, y, idx = graph.nodes.kdims[:3]
-
-    df = pd.merge(edges, nodes, left_on=[src.name], right_on=[idx.name])
-    df = df.rename(columns={x.name: 'src_x', y.name: 'src_y'})
+    if pd is not None:
+        index = pd.Index(index)
+        if not index.is_unique:
+            positions = np.arange(len(index))[~index.duplicated()]
+            found = index[positions].get_indexer(values)
+            found = np.where(found < 0, -1, positions[found])
+        else:
+            found = index.get_indexer(values)
+    elif not len(index):
+        found = np.full(len(values), -1, dtype=int)
+    else:
+        sorter = np.argsort(index, kind='mergesort')
+        sorted_index = index[sorter]
+        found = np.searchsorted(sorted_index, values, side='left')
+        clipped = np.clip(found, 0, max(len(index)-1, 0))
+        match = (found < len(index)) & (sorted_index[clipped] == values)
+        found = np.where(match, sorter[clipped], -1)
+    if not drop_missing and (found < 0).any():
+        raise ValueError('Could not find node positions for all edges')
+    return found
+
+
+def edge_segments(graph, drop_missing=True):
+    """
+    Given a Graph element containing abstract edges compute an array
+    of shape (N, 2, 2) holding the start and end coordinates of the
+    segments directly connecting the source and target nodes of the N
+    edges. Node positions are looked up in a single vectorized pass
+    rather than per edge. Edges referencing nodes which are not
+    present are dropped unless drop_missing is disabled, in which
+    case a ValueError is raised.
+    """
+    src, tgt = (graph.dimension_values(i) for i in range(2))
+    index = graph.nodes.dimension_values(2)
+    src_idx = _lookup_nodes(index, src, drop_missing)
+    tgt_idx = _lookup_nodes(index, tgt, drop_missing)
+    if drop_missing:
+        found = (src_idx >= 0) & (tgt_idx >= 0)
+        if not found.all():
+            src_idx, tgt_idx = src_idx[found], tgt_idx[found]
+    positions = graph.nodes.array(graph.nodes.kdims[:2])
+    return np.stack([positions[src_idx], positions[tgt_idx]], axis=1)
 
-    df = pd.merge(df, nodes, left_on=[tgt.name], right_on=[idx.name])
-    df = df.rename(columns={x.name: 'dst_x', y.name: 'dst_y'})
-    df = df.sort_values('graph_edge_index').drop(['graph_edge_index'], axis=1)
 
-    edge_segments = []
-    for i, edge in df.iterrows():
-        start = edge['src_x'], edge['src_y']
-        end = edge['dst_x'], edge['dst_y']
-        edge_segments.append(np.array([start, end]))
-    return edge_segments
+def connect_edges_pd(graph):
+    """
+    Given a Graph element containing abstract edges compute edge
+    segments directly connecting the source and target nodes. Edges
+    which reference nodes that are not present are dropped.
+    """
+    return list(edge_segments(graph))
 
 
 def connect_edges(graph):
     """
     Given a Graph element containing abstract edges compute edge
-    segments directly connecting the source and target nodes.  This
-    operation just uses internal HoloViews operations and will be a
-    lot slower than the pandas equivalent.
+    segments directly connecting the source and target nodes, raising
+    a ValueError if the position of any node cannot be found.
     """
-    paths = []
-    for start, end in graph.array(graph.kdims):
-        start_ds = graph.nodes[:, :, start]
-        end_ds = graph.nodes[:, :, end]
-        if not len(start_ds) or not len(end_ds):
-            raise ValueError('Could not find node positions for all edges')
-        start = start_ds.array(start_ds.kdims[:2])
-        end = end_ds.array(end_ds.kdims[:2])
-        paths.append(np.array([start[0], end[0]]))
-    return paths
+    return list(edge_segments(graph, drop_missing=False))
@@ -1,7 +1,12 @@
 from __future__ import absolute_import, division
 
 from collections import Callable, Iterable
+import hashlib
+import itertools
+import json
+import threading
 import warnings
+import weakref
 
 import param
 import numpy as np
@@ -11,7 +16,6 @@ import datashader as ds
 import datashader.reductions as rd
 import datashader.transfer_functions as tf
 import dask.dataframe as dd
-from param.parameterized import bothmethod
 
 try:
     from datashader.bundling import (directly_connect_edges as connect_edges,
@@ -23,13 +27,436 @@ from ..core import (Operation, Element, Dimension, NdOverlay,
                     CompositeOverlay, Dataset, Overlay)
 from ..core.data import PandasInterface, XArrayInterface
 from ..core.sheetcoords import BoundingBox
-from ..core.util import LooseVersion, get_param_values, basestring, datetime_types, dt_to_int
+from ..core.util import (LooseVersion, OrderedDict, get_param_values, basestring,
+                         datetime_types, dt_to_int, parallel_map, tree_reduce)
 from ..element import (Image, Path, Curve, RGB, Graph, TriMesh, QuadMesh, Contours)
+from ..element.util import edge_segments
 from ..streams import RangeXY, PlotSize
 
 ds_version = LooseVersion(ds.__version__)
 
 
+class PrecomputeCache(param.Parameterized):
+    """
+    Process-wide least-recently-used cache of the inputs prepared by
+    the datashader operations, e.g. the DataFrame an element is
+    converted to before aggregation or the mesh computed for a
+    TriMesh. Entries are keyed on a fingerprint of the element data
+    so that multiple operations over the same data share one entry,
+    and are evicted once the number of entries or their estimated
+    memory footprint exceeds the configured limits.
+    """
+
+    max_entries = param.Integer(default=32, bounds=(0, None), doc="""
+        Maximum number of precomputed entries to hold.""")
+
+    max_bytes = param.Integer(default=512*1024**2, bounds=(0, None), doc="""
+        Maximum estimated number of bytes held by the cache entries.""")
+
+    def __init__(self, **params):
+        super(PrecomputeCache, self).__init__(**params)
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self._fingerprints = weakref.WeakKeyDictionary()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def stats(self):
+        """
+        Summary of the cache usage since it was last cleared.
+        """
+        return {'entries': len(self._entries), 'nbytes': self._nbytes,
+                'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def key(self, element, *args):
+        """
+        Returns the cache key for an element and any additional
+        arguments the precomputed value depends on. Elements whose
+        data cannot be fingerprinted are keyed on their plot id.
+        """
+        try:
+            fingerprint = self._fingerprints[element]
+        except (KeyError, TypeError):
+            fingerprint = self.fingerprint(element)
+            try:
+                self._fingerprints[element] = fingerprint
+            except TypeError:
+                pass
+        if fingerprint is None:
+            fingerprint = ('plot_id', element._plot_id)
+        return (fingerprint,) + args
+
+    @classmethod
+    def fingerprint(cls, obj):
+        """
+        Computes a fingerprint of the data held by an element, returns
+        None if the data cannot be fingerprinted.
+        """
+        if isinstance(obj, CompositeOverlay):
+            items = tuple((k, cls.fingerprint(el)) for k, el in obj.data.items())
+            if any(fp is None for _, fp in items):
+                return None
+            return (type(obj).__name__, items)
+        elif isinstance(obj, Element):
+            fingerprint = cls._data_fingerprint(obj.data)
+            if fingerprint is None:
+                return None
+            dims = tuple(d.name for d in obj.dimensions())
+            if isinstance(obj, (Graph, TriMesh)):
+                nodes = cls.fingerprint(obj.nodes)
+                if nodes is None:
+                    return None
+                fingerprint = (fingerprint, nodes)
+            return (type(obj).__name__, dims, fingerprint)
+        return cls._data_fingerprint(obj)
+
+    @classmethod
+    def _data_fingerprint(cls, data):
+        if isinstance(data, dd.DataFrame):
+            return ('dask', data._name)
+        elif isinstance(data, pd.DataFrame):
+            try:
+                hashes = pd.util.hash_pandas_object(data, index=False).values
+            except TypeError:
+                return None
+            return ('DataFrame', tuple(data.columns), hashlib.sha1(hashes).hexdigest())
+        elif isinstance(data, np.ndarray):
+            if data.dtype.kind == 'O':
+                return None
+            data = np.ascontiguousarray(data)
+            return (data.dtype.str, data.shape, hashlib.sha1(data.view(np.uint8)).hexdigest())
+        elif isinstance(data, xr.Dataset):
+            return cls._data_fingerprint(OrderedDict(
+                (k, v.data) for k, v in data.variables.items()))
+        elif hasattr(data, 'dask') and hasattr(data, 'name'):
+            return ('dask', data.name)
+        elif isinstance(data, dict):
+            keys, values = tuple(data.keys()), list(data.values())
+        elif isinstance(data, (list, tuple)):
+            keys, values = None, list(data)
+        else:
+            return None
+        fingerprints = tuple(cls._data_fingerprint(v) for v in values)
+        if any(fp is None for fp in fingerprints):
+            return None
+        return (type(data).__name__, keys, fingerprints)
+
+    @classmethod
+    def nbytes(cls, value):
+        """
+        Estimates the number of bytes held in memory by a precomputed
+        value, data held out-of-core by dask is not counted.
+        """
+        if isinstance(value, dd.DataFrame):
+            return 0
+        elif isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(index=True).sum())
+        elif isinstance(value, (np.ndarray, xr.DataArray, xr.Dataset)):
+            return value.nbytes
+        elif isinstance(value, Element):
+            return cls.nbytes(value.data)
+        elif isinstance(value, dict):
+            return sum(cls.nbytes(v) for v in value.values())
+        elif isinstance(value, (list, tuple)):
+            return sum(cls.nbytes(v) for v in value)
+        return 0
+
+    def get(self, key):
+        """
+        Returns the precomputed value for the key, or None on a miss.
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self.hits += 1
+            value, nbytes = self._entries.pop(key)
+            self._entries[key] = (value, nbytes)
+        return value
+
+    def set(self, key, value):
+        """
+        Stores a precomputed value, evicting the least recently used
+        entries until the cache is within its limits. Values larger
+        than the memory budget are not stored.
+        """
+        nbytes = self.nbytes(value)
+        with self._lock:
+            if key in self._entries:
+                self._nbytes -= self._entries.pop(key)[1]
+            if nbytes > self.max_bytes or not self.max_entries:
+                return
+            self._entries[key] = (value, nbytes)
+            self._nbytes += nbytes
+            while (len(self._entries) > self.max_entries or
+                   self._nbytes > self.max_bytes):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._nbytes -= evicted
+                self.evictions += 1
+
+
+precompute_cache = PrecomputeCache()
+
+
+class AggregateCache(PrecomputeCache):
+    """
+    Cache of the aggregates computed for a viewport, keyed on the data
+    fingerprint, the aggregator and the viewport snapped to the pixel
+    grid of the zoom level. Additionally records the last viewport
+    aggregated at each zoom level, which allows reusing the overlap
+    with a new viewport when panning.
+    """
+
+    max_entries = param.Integer(default=64, bounds=(0, None), doc="""
+        Maximum number of cached aggregates.""")
+
+    max_bytes = param.Integer(default=256*1024**2, bounds=(0, None), doc="""
+        Maximum estimated number of bytes held by the cached aggregates.""")
+
+    def __init__(self, **params):
+        super(AggregateCache, self).__init__(**params)
+        self._viewports = OrderedDict()
+        self.partial_hits = 0
+
+    @property
+    def stats(self):
+        stats = super(AggregateCache, self).stats
+        stats['partial_hits'] = self.partial_hits
+        return stats
+
+    def clear(self):
+        with self._lock:
+            super(AggregateCache, self).clear()
+            self._viewports.clear()
+            self.partial_hits = 0
+
+    def last_viewport(self, zoom_key):
+        """
+        Returns the pixel offsets and the aggregate of the viewport
+        last aggregated at a zoom level, or None if it was evicted.
+        """
+        with self._lock:
+            offsets = self._viewports.get(zoom_key)
+            entry = None if offsets is None else self._entries.get(zoom_key+offsets)
+        return None if entry is None else offsets + (entry[0],)
+
+    def set_viewport(self, zoom_key, offsets, agg):
+        """
+        Stores the aggregate of the viewport at the given pixel offsets
+        of a zoom level.
+        """
+        with self._lock:
+            self.set(zoom_key+offsets, agg)
+            self._viewports.pop(zoom_key, None)
+            self._viewports[zoom_key] = offsets
+            while len(self._viewports) > self.max_entries:
+                self._viewports.popitem(last=False)
+
+
+aggregate_cache = AggregateCache()
+
+
+class AggregatePyramid(param.Parameterized):
+    """
+    Multi-resolution pyramid of pre-aggregated tiles for a static
+    points dataset. The finest level is aggregated once from the raw
+    data and each coarser level combines 2x2 blocks of the level
+    below, which requires a combinable count, sum, min or max
+    reduction. Levels are stored as a quadtree of square tiles, with
+    empty tiles omitted.
+
+    Pass the pyramid to the pyramid parameter of aggregate or rasterize
+    to answer requests from the tiles. Each request is answered from
+    the coarsest level that still has at least the requested
+    resolution. Tile cells are assigned to output pixels by their
+    centers, so results are accurate to within one cell of that level.
+    A viewport that needs more detail than the finest level returns
+    None, and the operation then aggregates the raw data.
+
+    Use save and load to persist a pyramid to disk as a compressed
+    npz file.
+    """
+
+    aggregator = param.ClassSelector(default=ds.count(), class_=(rd.count, rd.sum, rd.min, rd.max), doc="""
+        Combinable datashader reduction to pre-aggregate the data with.""")
+
+    levels = param.Integer(default=5, bounds=(1, None), doc="""
+        Number of resolution levels, the finest level has
+        tile_size*2**(levels-1) pixels along each axis.""")
+
+    tile_size = param.Integer(default=256, bounds=(1, None), doc="""
+        Number of pixels along each axis of a tile.""")
+
+    # Counter identifying the tiles of each built or loaded pyramid
+    _versions = itertools.count()
+
+    def __init__(self, element=None, **params):
+        super(AggregatePyramid, self).__init__(**params)
+        self.tiles = {}
+        self.dims = None
+        self.extent = None
+        self.version = next(self._versions)
+        if element is not None:
+            self.build(element)
+
+    def _combine(self, blocks):
+        agg = self.aggregator
+        if isinstance(agg, rd.count):
+            return blocks.sum(axis=(1, 3))
+        elif isinstance(agg, rd.sum):
+            combined = np.nansum(blocks, axis=(1, 3))
+            combined[np.isnan(blocks).all(axis=(1, 3))] = np.NaN
+            return combined
+        ufunc = np.fmin if isinstance(agg, rd.min) else np.fmax
+        return ufunc.reduce(ufunc.reduce(blocks, axis=3), axis=1)
+
+    def _empty(self, array):
+        if isinstance(self.aggregator, rd.count):
+            return not array.any()
+        return np.isnan(array).all()
+
+    def build(self, element):
+        """
+        Aggregates the points held by the element into the pyramid.
+        """
+        x, y, data, glyph = aggregate.get_agg_data(element)
+        if glyph != 'points':
+            raise ValueError('AggregatePyramid only supports points data, '
+                             'found %s element.' % type(element).__name__)
+        agg = self.aggregator
+        if agg.column is None and not isinstance(agg, rd.count):
+            if not data.vdims:
+                raise ValueError('Could not determine dimension to aggregate, '
+                                 'declare the column on the aggregator.')
+            self.aggregator = agg = type(agg)(data.vdims[0].name)
+
+        extent = []
+        for d in (x, y):
+            lower, upper = data.range(d)
+            if lower == upper:
+                lower, upper = lower-0.5, upper+0.5
+            extent.append((float(lower), float(upper)))
+        size = self.tile_size*2**(self.levels-1)
+        cvs = ds.Canvas(plot_width=size, plot_height=size,
+                        x_range=extent[0], y_range=extent[1])
+        array = cvs.points(PandasInterface.as_dframe(data), x.name, y.name, agg).data
+
+        self.tiles = {}
+        self.dims = (x.name, y.name)
+        self.extent = tuple(extent)
+        self.version = next(self._versions)
+        tile = self.tile_size
+        for level in range(self.levels-1, -1, -1):
+            ntiles = 2**level
+            for tj in range(ntiles):
+                for ti in range(ntiles):
+                    arr = array[tj*tile:(tj+1)*tile, ti*tile:(ti+1)*tile]
+                    if not self._empty(arr):
+                        self.tiles[(level, ti, tj)] = arr.copy()
+            if level:
+                n = array.shape[0]//2
+                array = self._combine(array.reshape(n, 2, n, 2))
+        return self
+
+    def query(self, x_range, y_range, width, height):
+        """
+        Aggregates the viewport from the tiles of the coarsest level
+        with at least the requested resolution. Returns None if no
+        level has sufficient resolution.
+        """
+        (ex0, ex1), (ey0, ey1) = self.extent
+        (x0, x1), (y0, y1) = x_range, y_range
+        xunit, yunit = (x1-x0)/float(width), (y1-y0)/float(height)
+        for level in range(self.levels):
+            n = self.tile_size*2**level
+            lxunit, lyunit = (ex1-ex0)/float(n), (ey1-ey0)/float(n)
+            if lxunit <= xunit and lyunit <= yunit:
+                break
+        else:
+            return None
+
+        # Gather the non-empty cells of all tiles overlapping the viewport
+        tile = self.tile_size
+        ti0, ti1 = [int(np.clip(np.floor((v-ex0)/lxunit/tile), 0, 2**level-1))
+                    for v in (x0, x1)]
+        tj0, tj1 = [int(np.clip(np.floor((v-ey0)/lyunit/tile), 0, 2**level-1))
+                    for v in (y0, y1)]
+        xs, ys, vs = [], [], []
+        for tj in range(tj0, tj1+1):
+            for ti in range(ti0, ti1+1):
+                arr = self.tiles.get((level, ti, tj))
+                if arr is None:
+                    continue
+                rows, cols = (arr != 0 if isinstance(self.aggregator, rd.count)
+                              else ~np.isnan(arr)).nonzero()
+                xs.append(ex0+(ti*tile+cols+0.5)*lxunit)
+                ys.append(ey0+(tj*tile+rows+0.5)*lyunit)
+                vs.append(arr[rows, cols])
+        xdim, ydim = self.dims
+        concat = lambda arrs, dtype: np.concatenate(arrs) if arrs else np.array([], dtype=dtype)
+        df = pd.DataFrame({xdim: concat(xs, 'float64'), ydim: concat(ys, 'float64'),
+                           '__value__': concat(vs, 'float64').astype('float64')})
+
+        cvs = ds.Canvas(plot_width=width, plot_height=height,
+                        x_range=x_range, y_range=y_range)
+        if isinstance(self.aggregator, (rd.count, rd.sum)):
+            combined = rd.sum('__value__')
+        else:
+            combined = type(self.aggregator)('__value__')
+        agg = cvs.points(df, xdim, ydim, combined)
+        if isinstance(self.aggregator, rd.count):
+            agg = agg.fillna(0).astype('int32')
+        return agg
+
+    def matches(self, agg_fn, x, y):
+        """
+        Whether the pyramid can answer requests for the aggregator and
+        x- and y-dimensions.
+        """
+        agg = self.aggregator
+        return (self.dims == (x.name, y.name) and type(agg_fn) is type(agg)
+                and agg_fn.column == agg.column)
+
+    def save(self, filename):
+        """
+        Saves the pyramid to a compressed npz file.
+        """
+        metadata = dict(aggregator=type(self.aggregator).__name__,
+                        column=self.aggregator.column, levels=self.levels,
+                        tile_size=self.tile_size, dims=self.dims,
+                        extent=self.extent)
+        arrays = {'tile_%d_%d_%d' % key: arr for key, arr in self.tiles.items()}
+        np.savez_compressed(filename, metadata=np.array(json.dumps(metadata)), **arrays)
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Loads a pyramid previously saved to a npz file.
+        """
+        with np.load(filename) as f:
+            metadata = json.loads(str(f['metadata']))
+            agg = AggregationOperation._agg_methods[metadata['aggregator']]
+            column = metadata['column']
+            pyramid = cls(aggregator=agg(column) if column else agg(),
+                          levels=metadata['levels'], tile_size=metadata['tile_size'])
+            pyramid.dims = tuple(metadata['dims'])
+            pyramid.extent = tuple(tuple(e) for e in metadata['extent'])
+            pyramid.tiles = {tuple(int(i) for i in k.split('_')[1:]): f[k]
+                             for k in f.files if k.startswith('tile_')}
+            pyramid.version = next(cls._versions)
+        return pyramid
+
+
 class LinkableOperation(Operation):
     """
     Abstract baseclass for operations supporting linked inputs.
@@ -102,13 +529,9 @@ class ResamplingOperation(LinkableOperation):
         recomputation if the supplied element does not change between
         calls. The cost of enabling this option is that the memory
         used to represent this internal state is not freed between
-        calls.""")
-
-    @bothmethod
-    def instance(self_or_cls,**params):
-        inst = super(ResamplingOperation, self_or_cls).instance(**params)
-        inst._precomputed = {}
-        return inst
+        calls. Precomputed state is held in the bounded, process-wide
+        precompute_cache and shared between operations applied to
+        the same data.""")
 
     def _get_sampling(self, element, x, y):
         target = self.p.target
@@ -186,6 +609,20 @@ class AggregationOperation(ResamplingOperation):
     aggregator parameter used to define a datashader Reduction.
     """
 
+    pyramid = param.ClassSelector(class_=AggregatePyramid, default=None, doc="""
+        Pre-aggregated AggregatePyramid of the points data to answer
+        requests from. Points are only aggregated from the raw data if
+        the pyramid does not match the aggregator or does not have
+        sufficient resolution for the requested viewport.""")
+
+    cache_aggregates = param.Boolean(default=False, doc="""
+        Whether to cache the aggregates computed for each viewport in
+        the process-wide aggregate_cache. The viewport is snapped to
+        the pixel grid of the current zoom level, so returning to a
+        previous view reuses its aggregate and panning only aggregates
+        the newly exposed regions. The regrid operation caches the
+        result for each viewport without snapping it.""")
+
     aggregator = param.ClassSelector(class_=(ds.reductions.Reduction, basestring),
                                      default=ds.count(), doc="""
         Datashader reduction function used for aggregating the data.
@@ -207,6 +644,98 @@ class AggregationOperation(ResamplingOperation):
         'max':   rd.max
     }
 
+    def _snap_to_grid(self, x_range, y_range, width, height):
+        """
+        Snaps the viewport to the pixel grid of the zoom level, returning
+        the snapped ranges, the sample coordinates and the grid as a
+        tuple of the pixel sizes and the index of the first pixel.
+        """
+        (x0, x1), (y0, y1) = x_range, y_range
+        xunit = float('%.12g' % ((x1-x0)/float(width)))
+        yunit = float('%.12g' % ((y1-y0)/float(height)))
+        i0, j0 = int(round(x0/xunit)), int(round(y0/yunit))
+        x_range = (i0*xunit, (i0+width)*xunit)
+        y_range = (j0*yunit, (j0+height)*yunit)
+        xs = (np.arange(i0, i0+width)+0.5)*xunit
+        ys = (np.arange(j0, j0+height)+0.5)*yunit
+        return x_range, y_range, (xs, ys), (xunit, yunit, i0, j0)
+
+    def _cached_aggregate(self, element, agg_fn, glyph, grid, width, height,
+                          aggregate_fn, pyramid=None):
+        """
+        Looks up the aggregate for the snapped viewport in the
+        aggregate_cache, computing it with the supplied
+        aggregate_fn(x_range, y_range, width, height) on a miss. When
+        panning at a fixed zoom level the overlap with the previous
+        viewport is reused and only the newly exposed regions are
+        aggregated. Aggregates answered by an AggregatePyramid are
+        approximate and are therefore keyed on the pyramid.
+        """
+        xunit, yunit, i0, j0 = grid
+        pyramid = None if pyramid is None else pyramid.version
+        zoom_key = aggregate_cache.key(element, type(self).__name__, glyph,
+                                       type(agg_fn).__name__, agg_fn.column,
+                                       xunit, yunit, width, height, pyramid)
+        cache_key = zoom_key + (i0, j0)
+        agg = aggregate_cache.get(cache_key)
+        if agg is None:
+            previous = aggregate_cache.last_viewport(zoom_key)
+            if previous is not None and glyph == 'points':
+                agg = self._pan_aggregate(previous, grid, width, height, aggregate_fn)
+            if agg is None:
+                x_range = (i0*xunit, (i0+width)*xunit)
+                y_range = (j0*yunit, (j0+height)*yunit)
+                agg = aggregate_fn(x_range, y_range, width, height)
+            else:
+                with aggregate_cache._lock:
+                    aggregate_cache.partial_hits += 1
+        aggregate_cache.set_viewport(zoom_key, (i0, j0), agg)
+        return agg
+
+    def _pan_aggregate(self, previous, grid, width, height, aggregate_fn):
+        """
+        Assembles the aggregate of a viewport from the overlap with a
+        previously aggregated viewport at the same zoom level and the
+        aggregates of the newly exposed regions. Returns None if the
+        viewports do not overlap.
+        """
+        xunit, yunit, i0, j0 = grid
+        pi0, pj0, prev = previous
+        if prev.ndim != 2:
+            return None
+
+        # Overlap in global pixel indices; the last row and column of
+        # the previous viewport are recomputed unless they also bound
+        # the new viewport since datashader maps samples falling on
+        # the upper bound into the last pixel.
+        i1, j1 = i0+width, j0+height
+        oi0, oj0 = max(i0, pi0), max(j0, pj0)
+        oi1, oj1 = min(i1, pi0+width), min(j1, pj0+height)
+        if oi1 == pi0+width and oi1 < i1: oi1 -= 1
+        if oj1 == pj0+height and oj1 < j1: oj1 -= 1
+        if oi1 <= oi0 or oj1 <= oj0:
+            return None
+
+        data = np.empty((height, width), dtype=prev.dtype)
+        data[oj0-j0:oj1-j0, oi0-i0:oi1-i0] = prev.data[oj0-pj0:oj1-pj0, oi0-pi0:oi1-pi0]
+        regions = [(i0, oi0, j0, j1), (oi1, i1, j0, j1),
+                   (oi0, oi1, j0, oj0), (oi0, oi1, oj1, j1)]
+        for (ri0, ri1, rj0, rj1) in regions:
+            if ri1 <= ri0 or rj1 <= rj0:
+                continue
+            # Extend interior regions by one pixel to avoid mapping
+            # samples on the shared edge into the region
+            ei1, ej1 = min(ri1+1, i1), min(rj1+1, j1)
+            strip = aggregate_fn((ri0*xunit, ei1*xunit), (rj0*yunit, ej1*yunit),
+                                 ei1-ri0, ej1-rj0)
+            data[rj0-j0:rj1-j0, ri0-i0:ri1-i0] = strip.data[:rj1-rj0, :ri1-ri0]
+
+        ydim, xdim = prev.dims
+        xs = (np.arange(i0, i1)+0.5)*xunit
+        ys = (np.arange(j0, j1)+0.5)*yunit
+        return xr.DataArray(data, coords={xdim: xs, ydim: ys}, dims=prev.dims,
+                            name=prev.name, attrs=prev.attrs)
+
     def _get_aggregator(self, element, add_field=True):
         agg = self.p.aggregator
         if isinstance(agg, basestring):
@@ -263,6 +792,58 @@ class aggregate(AggregationOperation):
     the linked plot.
     """
 
+    layer_workers = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+        Number of threads used to aggregate the layers of an NdOverlay
+        concurrently and to combine the partial aggregates in a tree
+        reduction. By default layers are aggregated sequentially.""")
+
+    incremental = param.Boolean(default=False, doc="""
+        Whether to incrementally update the aggregate of streamed
+        points, e.g. supplied by a Buffer stream. If the viewport is
+        unchanged and the data continues the previously aggregated
+        rows, only the newly appended rows are aggregated and merged
+        into the previous aggregate. Rows dropped from the start of a
+        sliding window are subtracted, which is supported by count and
+        sum reductions; min and max reductions only support appending
+        rows. Any other changes fall back to aggregating all rows. The
+        previous aggregates are held by the operation instance, i.e.
+        the operation has to be applied dynamically or reused.""")
+
+    # Data and aggregates of the most recent incremental aggregations
+    # held for each instance and the limits on their size
+    _streaming = weakref.WeakKeyDictionary()
+    _streaming_lock = threading.Lock()
+    _streaming_size = 16
+    _streaming_bytes = 128*1024**2
+
+    @classmethod
+    def _prepare_columns(cls, df, x, y, category=None):
+        """
+        Converts the columns of the DataFrame to the types expected by
+        datashader, i.e. datetimes on the x- and y-axes to floats and the
+        category column to a categorical. The supplied DataFrame is not
+        modified and only copied if any of the columns are converted.
+        """
+        converted = {}
+        if category and df[category].dtype.name != 'category':
+            converted[category] = df[category].astype('category')
+        for d in (x, y):
+            column = df[d.name]
+            if column.dtype.kind != 'M':
+                continue
+            elif isinstance(df, pd.DataFrame):
+                values = column.values.astype('datetime64[ns]', copy=False)
+                converted[d.name] = values.view('int64') * 1000.
+            else:
+                converted[d.name] = column.astype('datetime64[ns]').astype('int64') * 1000.
+        if not converted:
+            return df
+        # Since the converted columns change dtype they are stored in
+        # new blocks, leaving the data of the original frame untouched
+        df = df.copy(deep=False) if isinstance(df, pd.DataFrame) else df.copy()
+        for column, values in converted.items():
+            df[column] = values
+        return df
 
     @classmethod
     def get_agg_data(cls, obj, category=None):
@@ -272,6 +853,9 @@ class aggregate(AggregationOperation):
         """
         paths = []
         if isinstance(obj, Graph):
+            # Subclasses such as TriMesh and Chord define their own edgepaths
+            if obj._edgepaths is None and type(obj).edgepaths is Graph.edgepaths:
+                return cls._graph_agg_data(obj, category)
             obj = obj.edgepaths
         kdims = list(obj.kdims)
         vdims = list(obj.vdims)
@@ -318,17 +902,111 @@ class aggregate(AggregationOperation):
                 df = pd.concat(paths)
         else:
             df = paths[0] if paths else pd.DataFrame([], columns=[x.name, y.name])
-        if category and df[category].dtype.name != 'category':
-            df[category] = df[category].astype('category')
-
-        if any(df[d.name].dtype.kind == 'M' for d in (x, y)):
-            df = df.copy()
-        for d in (x, y):
-            if df[d.name].dtype.kind == 'M':
-                df[d.name] = df[d.name].astype('datetime64[ns]').astype('int64') * 1000.
+        df = cls._prepare_columns(df, x, y, category)
         return x, y, Dataset(df, kdims=kdims, vdims=vdims), glyph
 
 
+    @classmethod
+    def _graph_agg_data(cls, graph, category=None):
+        """
+        Builds a single NaN separated DataFrame of line segments
+        directly connecting the nodes of a Graph, avoiding the
+        construction and concatenation of a path per edge.
+        """
+        x, y = graph.nodes.kdims[:2]
+        segments = edge_segments(graph).astype('float64')
+        paths = np.full((len(segments), 3, 2), np.NaN)
+        paths[:, :2] = segments
+        df = pd.DataFrame(paths.reshape(-1, 2)[:-1], columns=[x.name, y.name])
+        df = cls._prepare_columns(df, x, y, category)
+        return x, y, Dataset(df, kdims=[x, y]), 'line'
+
+    @classmethod
+    def _stream_offset(cls, prev, data, columns):
+        """
+        Returns the number of rows dropped from the start of the
+        previous DataFrame if the new DataFrame consists of the
+        remaining previous rows followed by newly appended rows, or
+        None if the new data does not continue the previous data.
+        """
+        nprev, ndata = len(prev), len(data)
+        if not nprev:
+            return 0
+        elif not ndata:
+            return None
+        mask = np.ones(nprev, dtype=bool)
+        for c in columns:
+            mask &= prev[c].values == data[c].values[0]
+        for offset in mask.nonzero()[0][:8]:
+            overlap = nprev-offset
+            if overlap > ndata:
+                continue
+            if all(np.array_equal(prev[c].values[offset:], data[c].values[:overlap])
+                   for c in columns):
+                return offset
+        return None
+
+    def _streaming_state(self):
+        """
+        Returns the cache of the data and aggregates of the incremental
+        aggregations performed by this instance.
+        """
+        with self._streaming_lock:
+            state = self._streaming.get(self)
+            if state is None:
+                state = PrecomputeCache(max_entries=self._streaming_size,
+                                        max_bytes=self._streaming_bytes)
+                self._streaming[self] = state
+        return state
+
+    def _incremental_aggregate(self, data, x, y, agg_fn, x_range, y_range,
+                               width, height, element_key=None):
+        """
+        Aggregates the points in the DataFrame by merging the aggregate
+        of the rows appended since the previous call into the previous
+        aggregate, subtracting the aggregate of any dropped rows.
+        """
+        cvs = ds.Canvas(plot_width=width, plot_height=height,
+                        x_range=x_range, y_range=y_range)
+        key = (element_key, x.name, y.name, type(agg_fn).__name__, agg_fn.column,
+               tuple(x_range), tuple(y_range), width, height)
+        columns = [x.name, y.name] + ([agg_fn.column] if agg_fn.column else [])
+        is_sum = isinstance(agg_fn, rd.sum)
+        streaming = self._streaming_state()
+        state = streaming.get(key)
+
+        agg = None
+        if state is not None:
+            prev, prev_values, prev_count = state
+            offset = self._stream_offset(prev, data, columns)
+            if offset is not None and (not offset or isinstance(agg_fn, (rd.count, rd.sum))):
+                added = data.iloc[len(prev)-offset:]
+                agg = cvs.points(added, x.name, y.name, agg_fn)
+                values = agg.values
+                if isinstance(agg_fn, rd.count):
+                    values = prev_values + values
+                    if offset:
+                        values -= cvs.points(prev.iloc[:offset], x.name, y.name, agg_fn).values
+                    count = None
+                elif is_sum:
+                    count = prev_count + cvs.points(added, x.name, y.name, rd.count()).values
+                    values = np.nan_to_num(prev_values) + np.nan_to_num(values)
+                    if offset:
+                        removed = prev.iloc[:offset]
+                        count -= cvs.points(removed, x.name, y.name, rd.count()).values
+                        values -= np.nan_to_num(cvs.points(removed, x.name, y.name, agg_fn).values)
+                    values[count == 0] = np.NaN
+                else:
+                    ufunc = np.fmin if isinstance(agg_fn, rd.min) else np.fmax
+                    values, count = ufunc(prev_values, values), None
+                agg = agg.copy(data=values)
+
+        if agg is None:
+            agg = cvs.points(data, x.name, y.name, agg_fn)
+            count = cvs.points(data, x.name, y.name, rd.count()).values if is_sum else None
+        streaming.set(key, (data, agg.values.copy(), count))
+        return agg
+
     def _aggregate_ndoverlay(self, element, agg_fn):
         """
         Optimized aggregation for NdOverlay objects by aggregating each
@@ -371,33 +1049,37 @@ class aggregate(AggregationOperation):
         # into two aggregates
         column = agg_fn.column or 'Count'
         if isinstance(agg_fn, ds.mean):
-            agg_fn1 = aggregate.instance(**dict(agg_params, aggregator=ds.sum(column)))
-            agg_fn2 = aggregate.instance(**dict(agg_params, aggregator=ds.count()))
+            agg_params1 = dict(agg_params, aggregator=ds.sum(column))
+            agg_params2 = dict(agg_params, aggregator=ds.count())
         else:
-            agg_fn1 = aggregate.instance(**agg_params)
-            agg_fn2 = None
-        is_sum = isinstance(agg_fn1.aggregator, ds.sum)
-
-        # Accumulate into two aggregates and mask
-        agg, agg2, mask = None, None, None
-        mask = None
-        for v in element:
-            # Compute aggregates and mask
-            new_agg = agg_fn1.process_element(v, None)
+            agg_params1, agg_params2 = agg_params, None
+        is_sum = isinstance(aggregate.instance(**agg_params1).aggregator, ds.sum)
+
+        def aggregate_layer(layer):
+            # Layers may be aggregated concurrently and process_element
+            # assigns self.p, so each layer gets its own instances
+            new_agg = aggregate.instance(**agg_params1).process_element(layer, None)
+            new_mask = None
             if is_sum:
                 new_mask = np.isnan(new_agg.data[column].values)
                 new_agg.data = new_agg.data.fillna(0)
-            if agg_fn2:
-                new_agg2 = agg_fn2.process_element(v, None)
-
-            if agg is None:
-                agg = new_agg
-                if is_sum: mask = new_mask
-                if agg_fn2: agg2 = new_agg2
-            else:
-                agg.data += new_agg.data
-                if is_sum: mask &= new_mask
-                if agg_fn2: agg2.data += new_agg2.data
+            new_agg2 = None
+            if agg_params2:
+                new_agg2 = aggregate.instance(**agg_params2).process_element(layer, None)
+            return new_agg, new_agg2, new_mask
+
+        def combine(partial1, partial2):
+            (agg1, agg2, mask1), (new_agg1, new_agg2, new_mask) = partial1, partial2
+            agg1 = agg1.clone(agg1.data + new_agg1.data)
+            if is_sum: mask1 = mask1 & new_mask
+            if agg_params2: agg2 = agg2.clone(agg2.data + new_agg2.data)
+            return agg1, agg2, mask1
+
+        # Aggregate layers and combine them into two aggregates and mask
+        workers = self.p.layer_workers
+        executor = 'threads' if workers and workers > 1 else None
+        partials = parallel_map(aggregate_layer, element.values(), executor, workers)
+        agg, agg2, mask = tree_reduce(combine, partials, executor, workers)
 
         # Divide sum by count to compute mean
         if agg2 is not None:
@@ -422,15 +1104,22 @@ class aggregate(AggregationOperation):
              (isinstance(agg_fn, ds.count_cat) and agg_fn.column in element.kdims))):
             return self._aggregate_ndoverlay(element, agg_fn)
 
-        if element._plot_id in self._precomputed:
-            x, y, data, glyph = self._precomputed[element._plot_id]
-        else:
-            x, y, data, glyph = self.get_agg_data(element, category)
-
         if self.p.precompute:
-            self._precomputed[element._plot_id] = x, y, data, glyph
+            cache_key = precompute_cache.key(element, 'aggregate', category)
+            precomputed = precompute_cache.get(cache_key)
+            if precomputed is None:
+                precomputed = self.get_agg_data(element, category)
+                precompute_cache.set(cache_key, precomputed)
+        else:
+            precomputed = self.get_agg_data(element, category)
+        x, y, data, glyph = precomputed
         (x_range, y_range), (xs, ys), (width, height), (xtype, ytype) = self._get_sampling(element, x, y)
 
+        grid = None
+        if (self.p.cache_aggregates and xtype == ytype == 'numeric' and width and
+            height and x_range[0] != x_range[1] and y_range[0] != y_range[1]):
+            x_range, y_range, (xs, ys), grid = self._snap_to_grid(x_range, y_range, width, height)
+
         (x0, x1), (y0, y1) = x_range, y_range
         if xtype == 'datetime':
             x0, x1 = (np.array([x0, x1])/10e5).astype('datetime64[us]')
@@ -475,11 +1164,30 @@ class aggregate(AggregationOperation):
                                   dims=[y.name, x.name], coords={x.name: xs, y.name: ys})
             return self.p.element_type(xarray, **params)
 
-        cvs = ds.Canvas(plot_width=width, plot_height=height,
-                        x_range=x_range, y_range=y_range)
-
-        dfdata = PandasInterface.as_dframe(data)
-        agg = getattr(cvs, glyph)(dfdata, x.name, y.name, agg_fn)
+        dfdata = data.data
+        pyramid = self.p.pyramid
+        if (pyramid is None or glyph != 'points' or xtype != 'numeric' or
+            ytype != 'numeric' or not pyramid.matches(agg_fn, x, y)):
+            pyramid = None
+
+        def aggregate_fn(x_range, y_range, width, height):
+            if pyramid is not None:
+                agg = pyramid.query(x_range, y_range, width, height)
+                if agg is not None:
+                    return agg
+            cvs = ds.Canvas(plot_width=width, plot_height=height,
+                            x_range=x_range, y_range=y_range)
+            return getattr(cvs, glyph)(dfdata, x.name, y.name, agg_fn)
+
+        if (self.p.incremental and glyph == 'points' and isinstance(dfdata, pd.DataFrame)
+            and isinstance(agg_fn, (rd.count, rd.sum, rd.min, rd.max))):
+            agg = self._incremental_aggregate(dfdata, x, y, agg_fn, x_range, y_range,
+                                              width, height, key)
+        elif grid is None:
+            agg = aggregate_fn(x_range, y_range, width, height)
+        else:
+            agg = self._cached_aggregate(element, agg_fn, glyph, grid, width,
+                                         height, aggregate_fn, pyramid)
         if 'x_axis' in agg.coords and 'y_axis' in agg.coords:
             agg = agg.rename({'x_axis': x, 'y_axis': y})
         if xtype == 'datetime':
@@ -515,6 +1223,14 @@ class regrid(AggregationOperation):
     aggregator = param.ClassSelector(default=ds.mean(),
                                      class_=(ds.reductions.Reduction, basestring))
 
+    coarsen = param.Boolean(default=False, doc="""
+        Whether to pre-aggregate dask-backed arrays chunk by chunk by
+        integer factors before regridding, so only a much smaller array
+        has to be loaded into memory. Supports mean, min and max
+        aggregators. Since the coarsened blocks do not generally align
+        with the output pixels the result is an approximation of the
+        exact regridded array.""")
+
     expand = param.Boolean(default=False, doc="""
        Whether the x_range and y_range should be allowed to expand
        beyond the extent of the data.  Setting this value to True is
@@ -570,6 +1286,87 @@ class regrid(AggregationOperation):
             arrays[vd.name] = xarr
         return arrays
 
+    @classmethod
+    def _crop(cls, xarr, xdim, ydim, x_range, y_range):
+        """
+        Crops the DataArray to the viewport, retaining one sample
+        beyond the viewport along each edge.
+        """
+        slices = {}
+        for dim, (lower, upper) in ((xdim, x_range), (ydim, y_range)):
+            vals = xarr[dim].values
+            if vals.ndim != 1 or len(vals) < 2:
+                continue
+            descending = vals[0] > vals[-1]
+            search = vals[::-1] if descending else vals
+            i0 = max(np.searchsorted(search, lower, 'left')-1, 0)
+            i1 = min(np.searchsorted(search, upper, 'right')+1, len(vals))
+            if descending:
+                i0, i1 = len(vals)-i1, len(vals)-i0
+            if i1-i0 >= 2 and i1-i0 < len(vals):
+                slices[dim] = slice(i0, i1)
+        return xarr.isel(**slices) if slices else xarr
+
+    @staticmethod
+    def _nanmean(array, axis=None):
+        """
+        Mean ignoring NaNs, returning NaN without warning for blocks
+        which only contain NaNs.
+        """
+        count = (~np.isnan(array)).sum(axis=axis)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.nansum(array, axis=axis)/count
+
+    @staticmethod
+    def _nanmin(array, axis=None):
+        return np.fmin.reduce(array, axis=axis)
+
+    @staticmethod
+    def _nanmax(array, axis=None):
+        return np.fmax.reduce(array, axis=axis)
+
+    @classmethod
+    def _coarsen(cls, xarr, xdim, ydim, x_range, y_range, width, height, agg_fn):
+        """
+        Downsamples a dask-backed DataArray chunk by chunk by the
+        largest integer factors which keep it at least as large as the
+        output grid, so only the much smaller coarsened array has to be
+        loaded into memory for the final resampling. Partial blocks
+        along the edges are padded with NaNs rather than dropped.
+        """
+        reductions = {rd.mean: cls._nanmean, rd.min: cls._nanmin, rd.max: cls._nanmax}
+        reduction = reductions.get(type(agg_fn))
+        if reduction is None:
+            return xarr
+        factors = {}
+        for dim, (lower, upper), size in ((xdim, x_range, width), (ydim, y_range, height)):
+            vals = xarr[dim].values
+            if len(vals) < 2:
+                return xarr
+            factors[xarr.dims.index(dim)] = max(int(((upper-lower)/float(size)) //
+                                                    abs(vals[1]-vals[0])), 1)
+        if all(f == 1 for f in factors.values()):
+            return xarr
+
+        import dask.array as da
+        data = xarr.data.astype('float64')
+        coords = {}
+        for dim in (xdim, ydim):
+            axis = xarr.dims.index(dim)
+            factor = factors[axis]
+            vals = xarr[dim].values.astype('float64')
+            padding = -len(vals) % factor
+            if padding:
+                shape = list(data.shape)
+                shape[axis] = padding
+                data = da.concatenate([data, da.full(shape, np.NaN, chunks=shape)], axis=axis)
+                vals = np.concatenate([vals, np.full(padding, np.NaN)])
+            coords[dim] = np.nanmean(vals.reshape(-1, factor), axis=1)
+        chunks = {axis: max(data.chunks[axis][0]//f, 1)*f for axis, f in factors.items()}
+        data = da.coarsen(reduction, data.rechunk(chunks), factors)
+        return xr.DataArray(data, coords=coords, dims=xarr.dims, name=xarr.name,
+                            attrs=xarr.attrs)
+
 
     def _process(self, element, key=None):
         if ds_version <= '0.5.0':
@@ -619,13 +1416,39 @@ class regrid(AggregationOperation):
             if height == 0: params['ydensity'] = 1
             return element.clone((xs, ys, np.zeros((height, width))), **params)
 
+        agg_fn = self._get_aggregator(element, add_field=False)
+        if self.p.cache_aggregates:
+            cache_key = aggregate_cache.key(element, type(self).__name__, type(agg_fn).__name__,
+                                            self.p.interpolation, self.p.coarsen,
+                                            x_range, y_range, width, height)
+            regridded = aggregate_cache.get(cache_key)
+            if regridded is not None:
+                return element.clone(regridded, bounds=bbox, datatype=['xarray']+element.datatype)
+
         cvs = ds.Canvas(plot_width=width, plot_height=height,
                         x_range=x_range, y_range=y_range)
 
+        # Crop the arrays to the viewport and optionally pre-aggregate
+        # dask arrays chunk by chunk, loading all value dimensions in
+        # one pass
+        arrays = self._get_xarrays(element, coords, xtype, ytype)
+        for vd, xarr in arrays.items():
+            if any(xarr[d.name].ndim != 1 for d in (x, y)):
+                continue
+            xarr = self._crop(xarr, x.name, y.name, x_range, y_range)
+            if self.p.coarsen and hasattr(xarr.data, 'dask'):
+                xarr = self._coarsen(xarr, x.name, y.name, x_range, y_range,
+                                     width, height, agg_fn)
+            arrays[vd] = xarr
+        lazy = [vd for vd, xarr in arrays.items() if hasattr(xarr.data, 'dask')]
+        if lazy:
+            import dask
+            loaded = dask.compute(*[arrays[vd].data for vd in lazy])
+            for vd, data in zip(lazy, loaded):
+                arrays[vd] = arrays[vd].copy(data=data)
+
         # Apply regridding to each value dimension
         regridded = {}
-        arrays = self._get_xarrays(element, coords, xtype, ytype)
-        agg_fn = self._get_aggregator(element, add_field=False)
         for vd, xarr in arrays.items():
             rarray = cvs.raster(xarr, upsample_method=self.p.interpolation,
                                 downsample_method=agg_fn)
@@ -637,6 +1460,8 @@ class regrid(AggregationOperation):
                 rarray[y.name] = (rarray[y.name]/10e5).astype('datetime64[us]')
             regridded[vd] = rarray
         regridded = xr.Dataset(regridded)
+        if self.p.cache_aggregates:
+            aggregate_cache.set(cache_key, regridded)
 
         return element.clone(regridded, bounds=bbox, datatype=['xarray']+element.datatype)
 
@@ -675,19 +1500,69 @@ class trimesh_rasterize(aggregate):
                                          objects=['bilinear', None], doc="""
         The interpolation method to apply during rasterization.""")
 
+    @classmethod
+    def _wind(cls, simplices, vertices):
+        """
+        Orders the triangle vertex indices with a consistent winding,
+        matching the auto-detection of datashader.utils.mesh, and looks
+        up the coordinates of each triangle vertex in the layout
+        expected by datashader's trimesh glyph.
+        """
+        if simplices.dtype.kind != 'i':
+            simplices = simplices.astype('int64')
+        winding = [0, 1, 2]
+        if len(simplices):
+            a, b, c = vertices[simplices[0, winding]]
+            if np.cross(b-a, c-a).item() >= 0:
+                winding = [0, 2, 1]
+        indices = simplices[:, winding].astype('int64')
+        return {'indices': indices,
+                'coords': np.take(vertices, indices.ravel(), axis=0)}
+
+    def _triangulation(self, element):
+        """
+        Returns the wound triangle vertex indices and the coordinates
+        of each triangle vertex of the element.
+        """
+        simplices = np.column_stack([element.dimension_values(i) for i in range(3)])
+        vertices = element.nodes.array([0, 1]).astype('float64')
+        return self._wind(simplices, vertices)
+
+    @classmethod
+    def _mesh(cls, coords, values, x, y, vdim, simplices, vertex_weights=False):
+        """
+        Builds the mesh buffers for datashader's trimesh glyph directly
+        from arrays of the triangle vertex coordinates and values. When
+        a mesh is supplied datashader only inspects the columns of the
+        vertices and simplices to determine the weight column.
+        """
+        # A single float block avoids a consolidation copy in datashader
+        mesh = np.column_stack([coords, values.astype('float64')])
+        mesh = pd.DataFrame(mesh, columns=[x.name, y.name, vdim.name])
+        if vertex_weights:
+            verts = [x.name, y.name, vdim.name]
+        else:
+            verts = [x.name, y.name]
+            simplices = simplices+[vdim.name]
+        return {'mesh': mesh, 'simplices': pd.DataFrame(columns=simplices),
+                'vertices': pd.DataFrame(columns=verts)}
+
     def _precompute(self, element, agg):
-        from datashader.utils import mesh
-        if element.vdims and getattr(agg, 'column', None) not in element.nodes.vdims:
-            simplices = element.dframe([0, 1, 2, 3])
-            verts = element.nodes.dframe([0, 1])
-        elif element.nodes.vdims:
-            simplices = element.dframe([0, 1, 2])
-            verts = element.nodes.dframe([0, 1, 3])
-        for c, dtype in zip(simplices.columns[:3], simplices.dtypes):
-            if dtype.kind != 'i':
-                simplices[c] = simplices[c].astype('int')
-        return {'mesh': mesh(verts, simplices), 'simplices': simplices,
-                'vertices': verts}
+        x, y = element.nodes.kdims[:2]
+        triangulation = self._triangulation(element)
+        indices, coords = triangulation['indices'], triangulation['coords']
+        simplices = [d.name for d in element.kdims[:3]]
+        column = getattr(agg, 'column', None)
+        if element.vdims and column not in element.nodes.vdims:
+            vdim = element.get_dimension(column) if column in element.vdims else element.vdims[0]
+            values = np.repeat(element.dimension_values(vdim), 3)
+            return self._mesh(coords, values, x, y, vdim, simplices)
+        if column in element.nodes.vdims:
+            vdim = element.nodes.get_dimension(column)
+        else:
+            vdim = element.nodes.vdims[0]
+        values = np.take(element.nodes.dimension_values(vdim), indices.ravel())
+        return self._mesh(coords, values, x, y, vdim, simplices, vertex_weights=True)
 
 
     def _process(self, element, key=None):
@@ -717,8 +1592,13 @@ class trimesh_rasterize(aggregate):
                 vdim = element.vdims[0]
             agg = self._get_aggregator(element)
 
-        if element._plot_id in self._precomputed:
-            precomputed = self._precomputed[element._plot_id]
+        if self.p.precompute:
+            cache_key = precompute_cache.key(element, type(self).__name__,
+                                             getattr(agg, 'column', None))
+            precomputed = precompute_cache.get(cache_key)
+            if precomputed is None:
+                precomputed = self._precompute(element, agg)
+                precompute_cache.set(cache_key, precomputed)
         else:
             precomputed = self._precompute(element, agg)
 
@@ -734,8 +1614,6 @@ class trimesh_rasterize(aggregate):
         simplices = precomputed['simplices']
         pts = precomputed['vertices']
         mesh = precomputed['mesh']
-        if self.p.precompute:
-            self._precomputed = {element._plot_id: precomputed}
 
         cvs = ds.Canvas(plot_width=width, plot_height=height,
                         x_range=x_range, y_range=y_range)
@@ -753,8 +1631,39 @@ class quadmesh_rasterize(trimesh_rasterize):
     handle the actual rasterization.
     """
 
+    def _triangulation(self, element):
+        """
+        Returns the wound triangle vertex indices and the coordinates
+        of each triangle vertex of the QuadMesh. Since the
+        triangulation only depends on the coordinates it is cached by
+        their fingerprint, allowing it to be reused when the values of
+        the mesh change.
+        """
+        if self.p.precompute:
+            coords = [element.interface.coords(element, d, edges=True)
+                      for d in element.kdims]
+            fingerprints = tuple(precompute_cache._data_fingerprint(c) for c in coords)
+            cache_key = (type(self).__name__, 'triangulation') + fingerprints
+            triangulation = precompute_cache.get(cache_key)
+            if triangulation is not None:
+                return triangulation
+        vertices, simplices = element._triangulate()
+        vertices = np.column_stack(vertices).astype('float64')
+        triangulation = self._wind(np.column_stack(simplices), vertices)
+        if self.p.precompute and None not in fingerprints:
+            precompute_cache.set(cache_key, triangulation)
+        return triangulation
+
     def _precompute(self, element, agg):
-        return super(quadmesh_rasterize, self)._precompute(element.trimesh(), agg)
+        x, y = element.kdims
+        coords = self._triangulation(element)['coords']
+        column = getattr(agg, 'column', None)
+        vdim = element.get_dimension(column) if column in element.vdims else element.vdims[0]
+        # Each quad is split into two triangles sharing its value
+        zs = element.dimension_values(vdim)
+        values = np.repeat(np.concatenate([zs, zs]), 3)
+        simplices = [str(d) for d in TriMesh.kdims]
+        return self._mesh(coords, values, x, y, vdim, simplices)
 
 
 
@@ -806,9 +1715,7 @@ class rasterize(AggregationOperation):
                               if k in transform.params() and v is not None},
                              dynamic=False)
             op = transform.instance(**op_params)
-            op._precomputed = self._precomputed
             element = element.map(op, predicate)
-            self._precomputed = op._precomputed
         return element
 
 
@@ -893,6 +1800,14 @@ class shade(LinkableOperation):
         return "#{0:02x}{1:02x}{2:02x}".format(*(int(v*255) for v in rgb))
 
 
+    def _apply_spreading(self, array):
+        """
+        Hook to spread the shaded uint32 image before it is converted
+        to an RGB element.
+        """
+        return array
+
+
     @classmethod
     def to_xarray(cls, element):
         if issubclass(element.interface, XArrayInterface):
@@ -962,31 +1877,13 @@ class shade(LinkableOperation):
         with warnings.catch_warnings():
             warnings.filterwarnings('ignore', r'invalid value encountered in true_divide')
             if np.isnan(array.data).all():
-                arr = np.zeros(array.data.shape, dtype=np.uint32)
-                img = array.copy()
-                img.data = arr
+                img = np.zeros(array.data.shape, dtype=np.uint32)
             else:
-                img = tf.shade(array, **shade_opts)
+                img = self._apply_spreading(tf.shade(array, **shade_opts).data)
         params = dict(get_param_values(element), kdims=kdims,
                       bounds=bounds, vdims=RGB.vdims[:],
                       xdensity=xdensity, ydensity=ydensity)
-        return RGB(self.uint32_to_uint8(img.data), **params)
-
-
-
-class datashade(rasterize, shade):
-    """
-    Applies the aggregate and shade operations, aggregating all
-    elements in the supplied object and then applying normalization
-    and colormapping the aggregated data returning RGB elements.
-
-    See aggregate and shade operations for more details.
-    """
-
-    def _process(self, element, key=None):
-        agg = rasterize._process(self, element, key)
-        shaded = shade._process(self, agg, key)
-        return shaded
+        return RGB(self.uint32_to_uint8(img), **params)
 
 
 
@@ -1070,8 +1967,13 @@ class SpreadingOperation(LinkableOperation):
         rgb = img.reshape((flat_shape, 4)).view('uint32').reshape(shape[:2])
         return rgb
 
-    def _apply_spreading(self, array):
-        """Apply the spread function using the indicated parameters."""
+    @classmethod
+    def spread_array(cls, array, params):
+        """
+        Spreads a packed uint32 image array, reading the spreading
+        options from the attributes of the supplied params object,
+        e.g. an instance of the operation.
+        """
         raise NotImplementedError
 
     def _process(self, element, key=None):
@@ -1083,7 +1985,7 @@ class SpreadingOperation(LinkableOperation):
         rgbarray = np.dstack([element.dimension_values(vd, flat=False)
                               for vd in element.vdims])
         data = self.uint8_to_uint32(rgbarray)
-        array = self._apply_spreading(data)
+        array = self.spread_array(data, self.p)
         img = datashade.uint32_to_uint8(array)
         for i, vd in enumerate(element.vdims):
             if i < img.shape[-1]:
@@ -1107,10 +2009,11 @@ class spread(SpreadingOperation):
     px = param.Integer(default=1, doc="""
         Number of pixels to spread on all sides.""")
 
-    def _apply_spreading(self, array):
+    @classmethod
+    def spread_array(cls, array, params):
         img = tf.Image(array)
-        return tf.spread(img, px=self.p.px,
-                         how=self.p.how, shape=self.p.shape).data
+        return tf.spread(img, px=params.px,
+                         how=params.how, shape=params.shape).data
 
 
 class dynspread(SpreadingOperation):
@@ -1136,11 +2039,41 @@ class dynspread(SpreadingOperation):
         Higher values give more spreading, up to the max_px
         allowed.""")
 
-    def _apply_spreading(self, array):
+    @classmethod
+    def spread_array(cls, array, params):
         img = tf.Image(array)
-        return tf.dynspread(img, max_px=self.p.max_px,
-                            threshold=self.p.threshold,
-                            how=self.p.how, shape=self.p.shape).data
+        return tf.dynspread(img, max_px=params.max_px,
+                            threshold=params.threshold,
+                            how=params.how, shape=params.shape).data
+
+
+
+class datashade(rasterize, shade):
+    """
+    Applies the aggregate and shade operations, aggregating all
+    elements in the supplied object and then applying normalization
+    and colormapping the aggregated data returning RGB elements.
+
+    See aggregate and shade operations for more details.
+    """
+
+    spreading = param.ClassSelector(class_=SpreadingOperation, default=None, doc="""
+        A spread or dynspread operation instance to apply to the
+        shaded image. Spreading is applied to the raw shaded buffer
+        before the RGB element is constructed, avoiding the conversion
+        of the RGB channels back to a packed image required when
+        applying the spreading operation to the output.""")
+
+    def _apply_spreading(self, array):
+        spreading = self.p.spreading
+        if spreading is None:
+            return array
+        return spreading.spread_array(array, spreading)
+
+    def _process(self, element, key=None):
+        agg = rasterize._process(self, element, key)
+        shaded = shade._process(self, agg, key)
+        return shaded
 
 
 def split_dataframe(path_df):
@@ -1194,3 +2127,18 @@ class directly_connect_edges(_connect_edges, connect_edges):
 
     def _bundle(self, position_df, edges_df):
         return connect_edges.__call__(self, position_df, edges_df)
+
+    def _process(self, element, key=None):
+        if self.p.include_edge_id:
+            return super(directly_connect_edges, self)._process(element, key)
+        # Look up all node positions in one vectorized pass instead of
+        # building each edge segment individually
+        segments = edge_segments(element).astype('float64')
+        if self.p.split:
+            paths = list(segments)
+        else:
+            paths = np.full((len(segments), 3, 2), np.NaN)
+            paths[:, :2] = segments
+            paths = [paths.reshape(-1, 2)]
+        edgepaths = element.edge_type(paths, kdims=element.nodes.kdims[:2])
+        return element.clone((element.data, element.nodes, edgepaths))
@@ -4,6 +4,8 @@ examples.
 """
 from __future__ import division
 
+import weakref
+
 import numpy as np
 
 import param
@@ -18,7 +20,8 @@ from ..element.chart import Histogram, Scatter
 from ..element.raster import Image, RGB
 from ..element.path import Contours, Polygons
 from ..element.util import categorical_aggregate2d # noqa (API import)
-from ..streams import RangeXY
+from ..element.util import downsample_2d
+from ..streams import RangeXY, PlotSize
 
 column_interfaces = [ArrayInterface, DictInterface]
 if pd:
@@ -703,6 +706,101 @@ class decimate(Operation):
         return element.map(self._process_layer, Element)
 
 
+class image_pyramid(Operation):
+    """
+    Downsamples an Image or RGB to approximately the requested width
+    and height in pixels and crops it to the x_range and y_range. The
+    downsampled levels are precomputed as an image pyramid, each
+    level reducing the resolution of the previous level by a factor
+    of two, and cached for each element, so panning and zooming only
+    has to select and slice a level. By default the operation returns
+    a DynamicMap with PlotSize and RangeXY streams, ensuring only
+    arrays roughly the size of the plot are sent to the frontend.
+    """
+
+    dynamic = param.Boolean(default=True, doc="""
+       Enables dynamic processing by default.""")
+
+    link_inputs = param.Boolean(default=True, doc="""
+         By default, the link_inputs parameter is set to True so that
+         backends that support linked streams update RangeXY and
+         PlotSize streams on the inputs of the operation.""")
+
+    reduction = param.ObjectSelector(default='mean', objects=['mean', 'max', 'min', 'nearest'], doc="""
+       The reduction used to combine blocks of 2x2 pixels when
+       computing each level of the pyramid.""")
+
+    height = param.Integer(default=400, doc="""
+       The minimum height of the output image in pixels.""")
+
+    width = param.Integer(default=400, doc="""
+       The minimum width of the output image in pixels.""")
+
+    x_range  = param.NumericTuple(default=None, length=2, doc="""
+       The x_range as a tuple of min and max x-value. Auto-ranges
+       if set to None.""")
+
+    y_range  = param.NumericTuple(default=None, length=2, doc="""
+       The y_range as a tuple of min and max y-value. Auto-ranges
+       if set to None.""")
+
+    streams = param.List(default=[PlotSize, RangeXY], doc="""
+        List of streams that are applied if dynamic=True, allowing
+        for dynamic interaction with the plot.""")
+
+    # Cache of pyramid levels per element and reduction
+    _pyramids = weakref.WeakKeyDictionary()
+
+    def _get_pyramid(self, element):
+        """
+        Returns the pyramid levels for the element, each a list of the
+        downsampled arrays of the value dimensions.
+        """
+        pyramids = self._pyramids.setdefault(element, {})
+        reduction = self.p.reduction
+        if reduction not in pyramids:
+            levels = [[element.dimension_values(vd, flat=False)
+                       for vd in element.vdims]]
+            while max(levels[-1][0].shape) > 1:
+                levels.append([downsample_2d(arr, reduction) for arr in levels[-1]])
+            pyramids[reduction] = levels
+        return pyramids[reduction]
+
+    def _process(self, element, key=None):
+        if not isinstance(element, Image):
+            raise ValueError('image_pyramid can only be applied to '
+                             'Image and RGB types.')
+        pyramid = self._get_pyramid(element)
+        h, w = pyramid[0][0].shape
+        if not (h and w):
+            return element
+        l, b, r, t = element.bounds.lbrt()
+        x0, x1 = self.p.x_range or (l, r)
+        y0, y1 = self.p.y_range or (b, t)
+        x0, x1 = max(x0, l), min(x1, r)
+        y0, y1 = max(y0, b), min(y1, t)
+
+        # Select the coarsest level still matching the requested size
+        factor = min((x1-x0)/(r-l)*w/max(self.p.width, 1),
+                     (y1-y0)/(t-b)*h/max(self.p.height, 1))
+        level = int(np.floor(np.log2(factor))) if factor >= 2 else 0
+        level = min(level, len(pyramid)-1)
+        arrays = pyramid[level]
+        xunit, yunit = (r-l)/w*2**level, (t-b)/h*2**level
+
+        # Crop the level to the viewport
+        lh, lw = arrays[0].shape
+        i0 = min(max(int(np.floor((x0-l)/xunit)), 0), lw-1)
+        i1 = max(min(int(np.ceil((x1-l)/xunit)), lw), i0+1)
+        j0 = min(max(int(np.floor((y0-b)/yunit)), 0), lh-1)
+        j1 = max(min(int(np.ceil((y1-b)/yunit)), lh), j0+1)
+        xs = l + (np.arange(i0, i1)+0.5)*xunit
+        ys = b + (np.arange(j0, j1)+0.5)*yunit
+        bounds = (l+i0*xunit, b+j0*yunit, l+i1*xunit, b+j1*yunit)
+        cropped = tuple(arr[j0:j1, i0:i1] for arr in arrays)
+        return element.clone((xs, ys)+cropped, bounds=bounds)
+
+
 class interpolate_curve(Operation):
     """
     Resamples a Curve using the defined interpolation method, e.g.
@@ -1,5 +1,6 @@
 from __future__ import absolute_import, division, unicode_literals
 
+import time
 from collections import defaultdict
 
 import param
@@ -286,11 +287,59 @@ class ServerCallback(MessageCallback):
     resolves the requested attributes on the Python end and then hands
     the msg off to the general on_msg handler, which will update the
     Stream(s) attached to the callback.
+
+    Events are processed in batches, the delay between batches adapts
+    to the time it takes to process them, backing off when the
+    triggered updates are slower than the rate of incoming events.
+    Events superseded while waiting are dropped.
     """
 
+    # Minimum and maximum delay (in ms) between processing batches
+    min_timeout = 50
+
+    max_timeout = 1000
+
+    # Smoothing factor for the moving average of the execution time
+    time_smoothing = 0.5
+
     def __init__(self, plot, streams, source, **params):
         super(ServerCallback, self).__init__(plot, streams, source, **params)
         self._active = False
+        self._timeout = self.min_timeout
+        self._exec_time = None
+        self._processed = 0
+        self._dropped = 0
+
+
+    @property
+    def stats(self):
+        """
+        Returns the number of processed and dropped events, the
+        average execution time (in ms) of processing a batch, the
+        current delay (in ms) between batches and the resulting
+        effective update rate (in updates per second).
+        """
+        exec_time = self._exec_time or 0
+        return dict(processed=self._processed, dropped=self._dropped,
+                    exec_time=exec_time, timeout=self._timeout,
+                    rate=1000./(self._timeout+exec_time))
+
+
+    def _record(self, start, queued, processed):
+        """
+        Records the execution time of a processed batch of events and
+        adapts the delay before the next batch is processed.
+        """
+        elapsed = (time.time()-start)*1000
+        if self._exec_time is None:
+            self._exec_time = elapsed
+        else:
+            alpha = self.time_smoothing
+            self._exec_time = alpha*elapsed + (1-alpha)*self._exec_time
+        self._timeout = int(min(max(self.min_timeout, self._exec_time),
+                                self.max_timeout))
+        self._processed += processed
+        self._dropped += queued-processed
 
 
     @classmethod
@@ -324,7 +373,7 @@ class ServerCallback(MessageCallback):
         """
         self._queue.append((attr, old, new))
         if not self._active and self.plot.document:
-            self.plot.document.add_timeout_callback(self.process_on_change, 50)
+            self.plot.document.add_timeout_callback(self.process_on_change, self._timeout)
             self._active = True
 
 
@@ -335,7 +384,7 @@ class ServerCallback(MessageCallback):
         """
         self._queue.append((event))
         if not self._active and self.plot.document:
-            self.plot.document.add_timeout_callback(self.process_on_event, 50)
+            self.plot.document.add_timeout_callback(self.process_on_event, self._timeout)
             self._active = True
 
 
@@ -347,8 +396,10 @@ class ServerCallback(MessageCallback):
             self._active = False
             return
         # Get unique event types in the queue
+        start = time.time()
         events = list(OrderedDict([(event.event_name, event)
                                    for event in self._queue]).values())
+        queued = len(self._queue)
         self._queue = []
 
         # Process event types
@@ -358,13 +409,16 @@ class ServerCallback(MessageCallback):
                 model_obj = self.plot_handles.get(self.models[0])
                 msg[attr] = self.resolve_attr_spec(path, event, model_obj)
             self.on_msg(msg)
-        self.plot.document.add_timeout_callback(self.process_on_event, 50)
+        self._record(start, queued, len(events))
+        self.plot.document.add_timeout_callback(self.process_on_event, self._timeout)
 
 
     def process_on_change(self):
         if not self._queue:
             self._active = False
             return
+        start = time.time()
+        queued = len(self._queue)
         self._queue = []
 
         msg = {}
@@ -379,7 +433,8 @@ class ServerCallback(MessageCallback):
             msg[attr] = self.resolve_attr_spec(path, cb_obj)
 
         self.on_msg(msg)
-        self.plot.document.add_timeout_callback(self.process_on_change, 50)
+        self._record(start, queued, 1)
+        self.plot.document.add_timeout_callback(self.process_on_change, self._timeout)
 
 
     def set_server_callback(self, handle):
@@ -874,6 +929,68 @@ class ResetCallback(Callback):
         return {'resetting': True}
 
 
+class HoverLookupCallback(Callback):
+    """
+    Sends the indices of the hovered samples which have not been
+    resolved yet back to Python, where the plot looks up their hover
+    values and adds them to the hover lookup source. Unlike the other
+    callbacks it is not attached to a stream but constructed by
+    plots which enable the hover_lookup option.
+    """
+
+    models = ['hover']
+    extra_models = ['hover_lookup']
+
+    # Collects the hovered indices missing from the lookup source,
+    # line tooltips may display the sample after the hovered segment
+    _indices_code = """
+    var hit = cb_data.index;
+    var indices = hit.indices.slice();
+    for (var i = 0; i < hit.line_indices.length; i++) {
+      indices.push(hit.line_indices[i], hit.line_indices[i]+1);
+    }
+    var resolved = hover_lookup.data['index'];
+    indices = indices.filter(function (i) { return resolved.indexOf(i) < 0 });
+    """
+
+    code = _indices_code + """
+    if (!indices.length) { return };
+    data['index'] = indices;
+    """
+
+    # In server mode the hovered indices are synced via the tool tags
+    server_code = _indices_code + """
+    if (indices.length) { hover.tags = indices };
+    """
+
+    def on_msg(self, msg):
+        msg = self._process_msg(msg)
+        if msg.get('index') is not None:
+            self.plot._resolve_hover(msg['index'])
+
+    def _process_msg(self, msg):
+        index = msg.get('index')
+        if isinstance(index, dict):
+            index = [v for _, v in sorted((int(k), v) for k, v in index.items())]
+        return {'index': index}
+
+    def set_server_callback(self, handle):
+        args = {'hover': handle, 'hover_lookup': self.plot_handles['hover_lookup']}
+        handle.callback = CustomJS(args=args, code=self.server_code)
+        handle.on_change('tags', self.on_change)
+
+    def process_on_change(self):
+        if not self._queue:
+            self._active = False
+            return
+        start = time.time()
+        queued = len(self._queue)
+        self._queue = []
+        self.on_msg({'index': list(self.plot_handles['hover'].tags)})
+        self._record(start, queued, 1)
+        self.plot.document.add_timeout_callback(self.process_on_change, self._timeout)
+
+
 class CDSCallback(Callback):
     """
     A Stream callback that syncs the data on a bokeh ColumnDataSource
@@ -891,6 +1008,14 @@ class CDSCallback(Callback):
         for stream in self.streams:
             stream.update(data=data)
 
+    def on_msg(self, msg):
+        # The data was edited in the browser, so the columns last sent
+        # are no longer known to match the data displayed
+        source = self.plot_handles.get('source')
+        if source is not None:
+            self.plot._cds_fingerprints.pop(source.ref['id'], None)
+        super(CDSCallback, self).on_msg(msg)
+
     def _process_msg(self, msg):
         msg['data'] = dict(msg['data'])
         for col, values in msg['data'].items():
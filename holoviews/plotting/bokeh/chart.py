@@ -56,6 +56,8 @@ class PointPlot(LegendPlot, ColorbarPlot):
     _plot_methods = dict(single='scatter', batched='scatter')
     _batched_style_opts = line_properties + fill_properties + ['size']
 
+    _hover_by_index = True
+
     def _get_size_data(self, element, ranges, style):
         data, mapping = {}, {}
         sdim = element.get_dimension(self.size_index)
@@ -307,6 +309,14 @@ class CurvePlot(ElementPlot):
     _plot_methods = dict(single='line', batched='multi_line')
     _batched_style_opts = line_properties
 
+    _hover_by_index = True
+
+    @property
+    def _lazy_hover(self):
+        # Stepped curves are drawn with additional samples
+        return (self.interpolation == 'linear' and
+                super(CurvePlot, self)._lazy_hover)
+
     def get_data(self, element, ranges, style):
         xidx, yidx = (1, 0) if self.invert_axes else (0, 1)
         x = element.get_dimension(xidx).name
@@ -12,7 +12,7 @@ from bokeh.core.properties import value
 from bokeh.document.events import ModelChangedEvent
 from bokeh.models import (HoverTool, Renderer, Range1d, DataRange1d, Title,
                           FactorRange, FuncTickFormatter, Tool, Legend,
-                          TickFormatter, PrintfTickFormatter)
+                          TickFormatter, PrintfTickFormatter, ColumnDataSource)
 from bokeh.models.tickers import Ticker, BasicTicker, FixedTicker, LogTicker
 from bokeh.models.widgets import Panel, Tabs
 from bokeh.models.mappers import LinearColorMapper
@@ -22,16 +22,21 @@ try:
     from bokeh.models.mappers import LogColorMapper, CategoricalColorMapper
 except ImportError:
     LogColorMapper, ColorBar = None, None
+try:
+    from bokeh.models import CustomJSHover
+except ImportError:
+    CustomJSHover = None
 from bokeh.plotting.helpers import _known_tools as known_tools
 
 from ...core import DynamicMap, CompositeOverlay, Element, Dimension
-from ...core.options import abbreviated_exception, SkipRendering
+from ...core.options import Store, abbreviated_exception, SkipRendering
 from ...core import util
 from ...element import Graph, VectorField, Path, Contours
 from ...streams import Buffer
 from ...util.transform import dim
 from ..plot import GenericElementPlot, GenericOverlayPlot
 from ..util import dynamic_update, process_cmap, color_intervals, dim_range_key
+from .callbacks import HoverLookupCallback
 from .plot import BokehPlot, TOOLS
 from .styles import (
     legend_dimensions, line_properties, mpl_to_bokeh, property_prefixes,
@@ -40,7 +45,7 @@ from .styles import (
 from .util import (
     bokeh_version, decode_bytes, get_tab_title, glyph_order,
     py2js_tickformatter, recursive_model_update, theme_attr_json,
-    cds_column_replace, hold_policy, match_dim_specs
+    cds_column_replace, hold_policy, match_dim_specs, update_shared_sources
 )
 
 
@@ -71,6 +76,15 @@ class ElementPlot(BokehPlot, GenericElementPlot):
         the line color for both grids while xgrid_line_color exclusively
         customizes the x-axis grid lines.""")
 
+    hover_lookup = param.Boolean(default=False, doc="""
+        Whether to resolve hover tooltips on demand. When enabled a
+        hover tool is added to the plot but only the columns required
+        to draw the glyphs are sent to the browser, the dimension
+        values of the hovered samples are looked up by index via a
+        server or comm callback instead. Only supported by plots
+        drawing one glyph per sample, e.g. Points, Scatter and Curve
+        plots, and ignored by batched plots.""")
+
     labelled = param.List(default=['x', 'y'], doc="""
         Whether to plot the 'x' and 'y' labels.""")
 
@@ -109,6 +123,13 @@ class ElementPlot(BokehPlot, GenericElementPlot):
         The toolbar location, must be one of 'above', 'below',
         'left', 'right', None.""")
 
+    webgl_thresholds = param.Dict(default={'scatter': 100000, 'line': 100000}, doc="""
+        Number of samples above which a plot drawing the corresponding
+        glyph type automatically switches to the WebGL output backend.
+        Style options the WebGL glyphs do not support are dropped.
+        Glyph types without a threshold only use WebGL if it is
+        enabled on the renderer.""")
+
     xformatter = param.ClassSelector(
         default=None, class_=(util.basestring, TickFormatter, FunctionType), doc="""
         Formatter for ticks along the x-axis.""")
@@ -129,12 +150,25 @@ class ElementPlot(BokehPlot, GenericElementPlot):
     # Whether the plot supports streaming data
     _stream_data = True
 
+    # Styles which are not supported by the WebGL version of a glyph
+    _webgl_unsupported_styles = {'scatter': ['line_dash']}
+
+    # Whether the glyphs correspond one-to-one to the samples of the
+    # element, allowing hover values to be looked up by index
+    _hover_by_index = False
+
+    # Number of resolved hover lookups to keep in the lookup source
+    _hover_cache_size = 256
+
     def __init__(self, element, plot=None, **params):
         self.current_ranges = None
         super(ElementPlot, self).__init__(element, **params)
         self.handles = {} if plot is None else self.handles['plot']
         self.static = len(self.hmap) == 1 and len(self.keys) == len(self.hmap)
         self.callbacks = self._construct_callbacks()
+        self._hover_values = {}
+        if self._lazy_hover:
+            self.callbacks.append(HoverLookupCallback(self, [], self.hmap.last))
         self.static_source = False
         self.streaming = [s for s in self.streams if isinstance(s, Buffer)]
 
@@ -201,7 +235,7 @@ class ElementPlot(BokehPlot, GenericElementPlot):
         Initializes hover data based on Element dimension values.
         If empty initializes with no data.
         """
-        if 'hover' not in self.handles or self.static_source:
+        if 'hover' not in self.handles or self.static_source or self._lazy_hover:
             return
 
         for d in (dimensions or element.dimensions()):
@@ -209,7 +243,7 @@ class ElementPlot(BokehPlot, GenericElementPlot):
             if dim not in data:
                 data[dim] = element.dimension_values(d)
             if isinstance(data[dim], np.ndarray) and data[dim].dtype.kind == 'M':
-                data[dim+'_dt_strings'] = [d.pprint_value(v) for v in data[dim]]
+                data[dim+'_dt_strings'] = d.pprint_values(data[dim])
 
         for k, v in self.overlay_dims.items():
             dim = util.dimension_sanitizer(k.name)
@@ -217,6 +251,94 @@ class ElementPlot(BokehPlot, GenericElementPlot):
                 data[dim] = [v for _ in range(len(list(data.values())[0]))]
 
 
+    @property
+    def _lazy_hover(self):
+        return (self.hover_lookup and self._hover_by_index and
+                CustomJSHover is not None and not self.batched and
+                not isinstance(self, GenericOverlayPlot))
+
+
+    def _init_hover_lookup(self, hover, source):
+        """
+        Replaces the tooltip fields of dimensions missing from the data
+        source, or holding datetimes which have to be formatted, with
+        fields formatted by looking up the hovered index in a separate
+        ColumnDataSource, which is filled in on demand.
+        """
+        dims, _ = self._hover_opts(self.current_frame)
+        fields = {'@{%s}' % util.dimension_sanitizer(d.name): util.dimension_sanitizer(d.name)
+                  for d in dims if isinstance(d, Dimension)}
+        tooltips, columns = [], ['index']
+        for name, field in hover.tooltips:
+            column = fields.get(field)
+            values = source.data.get(column)
+            if column is None or (values is not None and not (
+                    isinstance(values, np.ndarray) and values.dtype.kind == 'M')):
+                tooltips.append((name, field))
+                continue
+            columns.append(column)
+            tooltips.append((name, '$index{%s}' % column))
+        lookup = ColumnDataSource(data={c: [] for c in columns})
+        formatter = CustomJSHover(args={'lookup': lookup}, code="""
+        var i = lookup.data['index'].indexOf(value);
+        return i < 0 ? '...' : lookup.data[format][i];
+        """)
+        hover.tooltips = tooltips
+        hover.formatters = dict(hover.formatters, **{'$index': formatter})
+        self.handles['hover_lookup'] = lookup
+
+
+    def _reset_hover_lookup(self):
+        """
+        Clears the resolved hover values when the frame changes.
+        """
+        lookup = self.handles.get('hover_lookup')
+        self._hover_values = {}
+        if lookup is None or not len(lookup.data['index']):
+            return
+        lookup.data = {k: [] for k in lookup.data}
+        if self.renderer.mode == 'server':
+            self.handles['hover'].tags = []
+
+
+    def _resolve_hover(self, indices):
+        """
+        Looks up the formatted hover dimension values of the hovered
+        samples on the current frame and streams them to the hover
+        lookup source. The dimension values are computed once per
+        frame and only indices which have not been resolved yet are
+        looked up.
+        """
+        lookup = self.handles.get('hover_lookup')
+        element = self.current_frame
+        if lookup is None or element is None:
+            return
+        resolved = set(lookup.data['index'])
+        indices = [i for i in util.unique_iterator(int(i) for i in indices)
+                   if 0 <= i < len(element) and i not in resolved]
+        if not indices:
+            return
+
+        data = {'index': indices}
+        dims, _ = self._hover_opts(element)
+        for d in dims:
+            if not isinstance(d, Dimension):
+                continue
+            column = util.dimension_sanitizer(d.name)
+            if column not in lookup.data or column in data:
+                continue
+            elif d in self.overlay_dims:
+                data[column] = [d.pprint_value(self.overlay_dims[d])]*len(indices)
+                continue
+            if column not in self._hover_values:
+                self._hover_values[column] = element.dimension_values(d)
+            values = self._hover_values[column][indices]
+            data[column] = list(d.pprint_values(values))
+        lookup.stream(data, self._hover_cache_size)
+        if self.comm is not None and self.renderer.mode != 'server':
+            self.push()
+
+
     def _merge_ranges(self, plots, xspecs, yspecs):
         """
         Given a list of other plots return axes that are shared
@@ -377,7 +499,7 @@ class ElementPlot(BokehPlot, GenericElementPlot):
             properties['tools'] = tools
         properties['toolbar_location'] = self.toolbar
 
-        if self.renderer.webgl:
+        if self.renderer.webgl or self._webgl_threshold_exceeded(element):
             properties['output_backend'] = 'webgl'
 
         with warnings.catch_warnings():
@@ -389,6 +511,36 @@ class ElementPlot(BokehPlot, GenericElementPlot):
                                          **properties)
 
 
+    def _webgl_threshold_exceeded(self, element):
+        """
+        Whether the number of samples drawn by any glyph type exceeds
+        the webgl_thresholds declared for it, in which case the plot
+        switches to the WebGL output backend.
+        """
+        if self.batched:
+            element = self.current_frame
+        backend = self.renderer.backend
+        counts, thresholds = {}, {}
+        for el in element.traverse(lambda x: x, [Element]):
+            plot_type = Store.registry[backend].get(type(el))
+            method = getattr(plot_type, '_plot_methods', {}).get('single')
+            if not isinstance(method, util.basestring):
+                continue
+            opts = Store.lookup_options(backend, el, 'plot').kwargs
+            threshold = opts.get('webgl_thresholds', plot_type.webgl_thresholds).get(method)
+            if threshold is None:
+                continue
+            counts[method] = counts.get(method, 0) + len(el)
+            thresholds[method] = min(threshold, thresholds.get(method, threshold))
+        for method, count in counts.items():
+            if count > thresholds[method]:
+                self.param.debug('Switching to WebGL output backend since %d samples '
+                                 'drawn using %s glyphs exceed the threshold of %d.'
+                                 % (count, method, thresholds[method]))
+                return True
+        return False
+
+
     def _plot_properties(self, key, plot, element):
         """
         Returns a dictionary of plot properties.
@@ -658,7 +810,7 @@ class ElementPlot(BokehPlot, GenericElementPlot):
             column = data[col]
             if (isinstance(ranges[i], FactorRange) and
                 (isinstance(column, list) or column.dtype.kind not in 'SU')):
-                data[col] = [dims[i].pprint_value(v) for v in column]
+                data[col] = dims[i].pprint_values(column).tolist()
 
 
     def get_aspect(self, xspan, yspan):
@@ -675,8 +827,8 @@ class ElementPlot(BokehPlot, GenericElementPlot):
         xdim, ydim = element.dimensions()[:2]
         xvals, yvals = [element.dimension_values(i, False)
                         for i in range(2)]
-        coords = tuple([v if vals.dtype.kind in 'SU' else dim.pprint_value(v) for v in vals]
-                  for dim, vals in [(xdim, xvals), (ydim, yvals)])
+        coords = tuple(list(vals) if vals.dtype.kind in 'SU' else dim.pprint_values(vals).tolist()
+                       for dim, vals in [(xdim, xvals), (ydim, yvals)])
         if self.invert_axes: coords = coords[::-1]
         return coords
 
@@ -828,6 +980,11 @@ class ElementPlot(BokehPlot, GenericElementPlot):
         with abbreviated_exception():
             new_style = self._apply_transforms(element, source, ranges, style, group)
         properties = dict(new_style, source=source)
+        if plot.output_backend == 'webgl':
+            method = self._plot_methods.get('batched' if self.batched else 'single')
+            unsupported = self._webgl_unsupported_styles.get(method, []) if isinstance(method, util.basestring) else []
+            properties = {k: v for k, v in properties.items()
+                          if not any(k.endswith(u) for u in unsupported)}
         if self.show_legend:
             if self.overlay_dims:
                 legend = ', '.join([d.pprint_value(v) for d, v in
@@ -935,6 +1092,10 @@ class ElementPlot(BokehPlot, GenericElementPlot):
                     tooltips.append((name, formatter))
                 hover.tooltips = tooltips
 
+        # Look up fields missing from the data source on demand
+        if self._lazy_hover and isinstance(hover.tooltips, list):
+            self._init_hover_lookup(hover, source)
+
 
     def _init_glyphs(self, plot, element, ranges, source):
         style_element = element.last if self.batched else element
@@ -1025,6 +1186,8 @@ class ElementPlot(BokehPlot, GenericElementPlot):
             current_id = element._plot_id
         self.handles['previous_id'] = current_id
         self.static_source = (self.dynamic and (current_id == previous_id))
+        if not self.static_source:
+            self._reset_hover_lookup()
         if self.batched:
             data, mapping, style = self.get_batched_data(element, ranges)
         else:
@@ -1551,6 +1714,13 @@ class OverlayPlot(GenericOverlayPlot, LegendPlot):
     multiple_legends = param.Boolean(default=False, doc="""
         Whether to split the legend for subplots into multiple legends.""")
 
+    shared_datasource = param.Boolean(default=False, doc="""
+        Whether overlaid Elements drawing the data from the same object
+        should share their Bokeh data source. Conflicting columns are
+        only detected when the plot is initialized, so sharing should
+        only be enabled if all frames of the overlaid Elements draw
+        consistent data.""")
+
     _propagate_options = ['width', 'height', 'xaxis', 'yaxis', 'labelled',
                           'bgcolor', 'fontsize', 'invert_axes', 'show_frame',
                           'show_grid', 'logx', 'logy', 'xticks', 'toolbar',
@@ -1800,6 +1970,9 @@ class OverlayPlot(GenericOverlayPlot, LegendPlot):
         for cb in self.callbacks:
             cb.initialize()
 
+        if self.top_level and self.shared_datasource:
+            self.sync_sources()
+
         if self.top_level:
             self.init_links()
 
@@ -1808,6 +1981,7 @@ class OverlayPlot(GenericOverlayPlot, LegendPlot):
         return self.handles['plot']
 
 
+    @update_shared_sources
     def update_frame(self, key, ranges=None, element=None):
         """
         Update the internal state of the Plot to represent the given
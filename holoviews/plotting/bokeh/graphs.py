@@ -246,7 +246,7 @@ class GraphPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
             if self.handles['static_source']:
                 source.trigger('data', source.data, data)
             else:
-                source.data.update(data)
+                super(GraphPlot, self)._update_datasource(source, data)
         else:
             source.graph_layout = data
 
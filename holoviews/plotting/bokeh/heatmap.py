@@ -341,7 +341,7 @@ class RadialHeatMapPlot(CompositeElementPlot, ColorbarPlot):
 
         if vals.dtype.kind not in 'SU':
             dim = element.gridded.get_dimension(dim_label)
-            return [dim.pprint_value(v) for v in vals]
+            return dim.pprint_values(vals).tolist()
 
         return vals
 
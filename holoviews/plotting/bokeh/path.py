@@ -8,6 +8,7 @@ import numpy as np
 from ...core import util
 from ...element import Polygons
 from ...util.transform import dim
+from ..util import nan_separated_paths, path_segments
 from .element import ColorbarPlot, LegendPlot
 from .styles import (expand_batched_style, line_properties, fill_properties,
                      mpl_to_bokeh, validate)
@@ -71,6 +72,9 @@ class PathPlot(ColorbarPlot):
                 data = {}
             else:
                 paths = element.split(datatype='array', dimensions=element.kdims)
+                if len(paths) > 1:
+                    joined = nan_separated_paths(paths)
+                    paths = paths if joined is None else [joined]
                 xs, ys = ([path[:, idx] for path in paths] for idx in inds)
                 data = dict(xs=xs, ys=ys)
             return data, mapping, style
@@ -90,9 +94,7 @@ class PathPlot(ColorbarPlot):
             if cdim:
                 cvals = path.dimension_values(cdim)
                 vals[dim_name].append(cvals[:-1])
-            array = path.array(path.kdims)
-            alen = len(array)
-            paths += [array[s1:s2+1] for (s1, s2) in zip(range(alen-1), range(1, alen+1))]
+            paths.append(path.array(path.kdims))
             if not hover:
                 continue
             for vd in element.vdims:
@@ -102,8 +104,9 @@ class PathPlot(ColorbarPlot):
                 vd_name = util.dimension_sanitizer(vd.name)
                 vals[vd_name].append(values)
                 if values.dtype.kind == 'M':
-                    vals[vd_name+'_dt_strings'].append([vd.pprint_value(v) for v in values])
-        xs, ys = ([path[:, idx] for path in paths] for idx in inds)
+                    vals[vd_name+'_dt_strings'].append(vd.pprint_values(values))
+        segments = path_segments(paths)
+        xs, ys = (list(np.ascontiguousarray(segments[:, :, idx])) for idx in inds)
         values = {d: np.concatenate(vs) if len(vs) else [] for d, vs in vals.items()}
         data = dict(xs=xs, ys=ys, **values)
         self._get_hover_data(data, element)
@@ -174,7 +177,7 @@ class ContourPlot(LegendPlot, PathPlot):
                 else:
                     data[dim] = element.split(datatype='array', dimensions=[d])
             elif isinstance(data[dim], np.ndarray) and data[dim].dtype.kind == 'M':
-                data[dim+'_dt_strings'] = [d.pprint_value(v) for v in data[dim]]
+                data[dim+'_dt_strings'] = d.pprint_values(data[dim])
 
         for k, v in self.overlay_dims.items():
             dim = util.dimension_sanitizer(k.name)
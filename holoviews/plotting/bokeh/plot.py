@@ -1,22 +1,29 @@
 from __future__ import absolute_import, division, unicode_literals
 
 import json
+import time
 from itertools import groupby
 from collections import defaultdict
+from functools import partial
+from threading import Lock, Thread
 
 import numpy as np
 import param
 
 from bokeh.layouts import gridplot
-from bokeh.models import (ColumnDataSource, Column, Row, Div)
+from bokeh.models import (ColumnDataSource, Column, Row, Div, CDSView,
+                          IndexFilter)
 from bokeh.models.widgets import Panel, Tabs
 from bokeh.plotting.helpers import _known_tools as known_tools
 
 from ...core import (OrderedDict, Store, AdjointLayout, NdLayout, Layout,
                      Empty, GridSpace, HoloMap, Element, DynamicMap)
 from ...core.options import SkipRendering
+from ...core.spaces import get_nested_dmaps, get_nested_streams
 from ...core.util import (basestring, wrap_tuple, unique_iterator,
-                          get_method_owner, wrap_tuple_streams)
+                          get_method_owner, wrap_tuple_streams,
+                          cancel_when, CallbackCancelled, pd,
+                          stream_parameters)
 from ...streams import Stream
 from ..links import Link
 from ..plot import (DimensionedPlot, GenericCompositePlot, GenericLayoutPlot,
@@ -25,7 +32,9 @@ from ..util import attach_streams, displayable, collate
 from .callbacks import LinkCallback
 from .util import (layout_padding, pad_plots, filter_toolboxes, make_axis,
                    update_shared_sources, empty_plot, decode_bytes,
-                   theme_attr_json, cds_column_replace)
+                   theme_attr_json, cds_column_replace, cds_column_fingerprint,
+                   cds_column_patch, cds_columns_equal, data_fingerprint,
+                   cds_column_append)
 
 TOOLS = {name: tool if isinstance(tool, basestring) else type(tool())
          for name, tool in known_tools.items()}
@@ -128,6 +137,13 @@ class BokehPlot(DimensionedPlot):
                 if plot is not None:
                     plot.document = doc
 
+    # Maximum fraction of values in a column which may change for the
+    # column to be updated using a ColumnDataSource patch
+    _patch_threshold = 0.1
+
+    # Glyphs connecting their points, which do not support CDSViews
+    _connected_glyphs = ['Line', 'Patch', 'Step', 'HArea', 'VArea']
+
     def _session_destroy(self, session_context):
         self.cleanup()
 
@@ -136,6 +152,12 @@ class BokehPlot(DimensionedPlot):
         super(BokehPlot, self).__init__(*args, **params)
         self._document = None
         self._root = root
+        self._executor_lock = Lock()
+        self._executor_request = None
+        self._executor_active = False
+        self._cds_fingerprints = {}
+        self._push_stats = dict(pushes=0, bytes=0, last=None, raw_bytes=0, last_raw=None)
+        self._saved_bytes = 0
 
 
     def get_data(self, element, ranges, style):
@@ -201,15 +223,164 @@ class BokehPlot(DimensionedPlot):
         if self.comm is None:
             raise Exception('Renderer does not have a comm.')
 
+        # Data is updated on the subplots, so collect the bytes saved
+        # by down-casting columns across all of them
+        plots = self.traverse(lambda x: x, [BokehPlot])
+        saved = sum(plot._saved_bytes for plot in plots)
+        for plot in plots:
+            plot._saved_bytes = 0
         msg = self.renderer.diff(self, binary=True)
         if msg is None:
             return
         self.comm.send(msg.header_json)
         self.comm.send(msg.metadata_json)
         self.comm.send(msg.content_json)
+        nbytes = (len(msg.header_json) + len(msg.metadata_json) +
+                  len(msg.content_json))
         for header, payload in msg.buffers:
-            self.comm.send(json.dumps(header))
+            header = json.dumps(header)
+            self.comm.send(header)
             self.comm.send(buffers=[payload])
+            nbytes += len(header) + len(payload)
+        self._push_stats['pushes'] += 1
+        self._push_stats['bytes'] += nbytes
+        self._push_stats['last'] = nbytes
+        self._push_stats['raw_bytes'] += nbytes + saved
+        self._push_stats['last_raw'] = nbytes + saved
+        if self.renderer.push_hook is not None:
+            self.renderer.push_hook(self, {'sent': nbytes, 'raw': nbytes+saved})
+
+
+    @property
+    def push_stats(self):
+        """
+        Returns the number of updates pushed via the Comm along with
+        the total number of bytes pushed and the number of bytes
+        pushed by the last update. The raw_bytes and last_raw entries
+        report the equivalent sizes had no columns been down-cast.
+        """
+        return dict(self._push_stats)
+
+
+    def refresh(self, **kwargs):
+        """
+        Refreshes the plot by rerendering it and then pushing the
+        updated data. When running on a bokeh server any triggered
+        DynamicMaps declaring an executor are evaluated on a
+        background thread and the plot is refreshed with the result
+        on the next tick of the server event loop.
+        """
+        if self.renderer.mode == 'server' and self.document is not None:
+            requests = self._executor_requests()
+            if requests:
+                self._submit_refresh(requests, kwargs)
+                return
+        super(BokehPlot, self).refresh(**kwargs)
+
+
+    def _executor_requests(self):
+        """
+        Returns the DynamicMaps declaring an executor with triggered
+        streams along with the key and arguments required to evaluate
+        their callbacks, capturing the current state of the streams
+        including whether a transient stream disables memoization.
+        """
+        key = self.current_key if self.current_key else self.keys[0]
+        key_map = dict(zip([d.name for d in self.dimensions], key))
+        hmaps = self.traverse(lambda x: x.hmap, [lambda x: isinstance(getattr(x, 'hmap', None), DynamicMap)])
+        requests, seen = [], set()
+        for hmap in hmaps:
+            for dmap in get_nested_dmaps(hmap):
+                if (id(dmap) in seen or dmap.executor is None or
+                    not any(s._triggering for s in dmap.streams)):
+                    continue
+                seen.add(id(dmap))
+                # Stream parameters in the current key may be stale
+                stream_params = stream_parameters(dmap.streams)
+                dkey = tuple(None if kd in stream_params else key_map.get(kd.name)
+                             for kd in dmap.kdims)
+                dkey = wrap_tuple_streams(dkey, dmap.kdims, dmap.streams)
+                args, kwargs = dmap._callback_arguments(*dkey)
+                memoize = not any(s.transient and s._triggering
+                                  for s in get_nested_streams(dmap))
+                requests.append((dmap, dkey, args, kwargs, memoize))
+        return requests
+
+
+    def _submit_refresh(self, requests, kwargs):
+        """
+        Submits the requests to the background thread, replacing any
+        pending request which has not been started yet.
+        """
+        with self._executor_lock:
+            if self._executor_request is not None:
+                for dmap, _, _, _, _ in self._executor_request[1]:
+                    dmap._record_superseded()
+            self._executor_request = (time.time(), requests, kwargs)
+            if self._executor_active:
+                return
+            self._executor_active = True
+        thread = Thread(target=self._executor_worker)
+        thread.daemon = True
+        thread.start()
+
+
+    def _executor_worker(self):
+        """
+        Evaluates the latest request on a background thread and
+        schedules the refresh with the results on the server event
+        loop, dropping the results if they were superseded by a newer
+        request in the meantime. Callbacks are evaluated on a clone of
+        the DynamicMap callback, memoizing results only if the streams
+        allowed it when the request was submitted.
+        """
+        superseded = lambda: self._executor_request is not None
+        while True:
+            with self._executor_lock:
+                request = self._executor_request
+                self._executor_request = None
+                if request is None or self.document is None:
+                    self._executor_active = False
+                    return
+            start, requests, kwargs = request
+            results = []
+            try:
+                with cancel_when(superseded):
+                    for dmap, key, args, kws, memoize in requests:
+                        callback = dmap.callback.clone()
+                        callback._memoized = dict(dmap.callback._memoized)
+                        callback._stream_memoization = callback.memoize and memoize
+                        retval = callback(*args, **kws)
+                        results.append((dmap, key, dmap._style(retval)))
+            except CallbackCancelled:
+                results = None
+            except Exception as e:
+                self.param.warning('DynamicMap callback evaluated by the '
+                                   'executor raised %r, the plot was not '
+                                   'updated.' % e)
+                continue
+            if results is None or superseded():
+                for dmap, _, _, _, _ in requests:
+                    dmap._record_superseded()
+                continue
+            self.document.add_next_tick_callback(
+                partial(self._apply_results, start, results, kwargs))
+
+
+    def _apply_results(self, start, results, kwargs):
+        """
+        Refreshes the plot with the results computed by the executor.
+        """
+        for dmap, key, retval in results:
+            with dmap._results_lock:
+                dmap._results[key] = retval
+        try:
+            super(BokehPlot, self).refresh(**kwargs)
+        finally:
+            for dmap, key, _ in results:
+                with dmap._results_lock:
+                    dmap._results.pop(key, None)
+                dmap._record_latency(time.time()-start)
 
 
     def set_root(self, root):
@@ -227,9 +398,34 @@ class BokehPlot(DimensionedPlot):
         Initializes a data source to be passed into the bokeh glyph.
         """
         data = {k: decode_bytes(vs) for k, vs in data.items()}
+        data, _ = self._reduce_precision(data)
         return ColumnDataSource(data=data)
 
 
+    def _reduce_precision(self, data):
+        """
+        Down-casts float64 columns to float32 if enabled on the
+        renderer, returning the new data and the number of bytes
+        saved on each column.
+        """
+        saved = {}
+        if not self.renderer.float32:
+            return data, saved
+        reduced = {}
+        for k, values in data.items():
+            if isinstance(values, np.ndarray) and values.dtype == np.float64:
+                reduced[k] = values.astype(np.float32)
+                saved[k] = values.nbytes - reduced[k].nbytes
+            elif (isinstance(values, list) and values and
+                  all(isinstance(v, np.ndarray) and v.dtype == np.float64
+                      for v in values)):
+                reduced[k] = [v.astype(np.float32) for v in values]
+                saved[k] = sum(v.nbytes for v in values)//2
+            else:
+                reduced[k] = values
+        return reduced, saved
+
+
     def _update_datasource(self, source, data):
         """
         Update datasource with data for a new frame.
@@ -238,6 +434,7 @@ class BokehPlot(DimensionedPlot):
             return
 
         data = {k: decode_bytes(vs) for k, vs in data.items()}
+        data, saved = self._reduce_precision(data)
         empty = all(len(v) == 0 for v in data.values())
         if (self.streaming and self.streaming[0].data is self.current_frame.data
             and self._stream_data and not empty):
@@ -245,12 +442,78 @@ class BokehPlot(DimensionedPlot):
             if stream._triggering:
                 data = {k: v[-stream._chunk_length:] for k, v in data.items()}
                 source.stream(data, stream.length)
+                self._saved_bytes += sum(data[k].nbytes for k in saved
+                                         if isinstance(data[k], np.ndarray))
             return
 
+        fingerprints = self._cds_fingerprints.setdefault(source.ref['id'], {})
+        appended = cds_column_append(source, data)
+        if appended is not None:
+            # Patch the existing rows and stream the appended rows
+            length = len(list(source.data.values())[0])
+            patches = {}
+            for k, values in data.items():
+                if cds_columns_equal(source.data[k], values[:length]):
+                    continue
+                patches[k] = cds_column_patch(source.data[k], values[:length],
+                                              self._patch_threshold)
+                if not patches[k]:
+                    break
+            else:
+                self._patch_datasource(source, patches, data, saved)
+                source.stream(appended)
+                fingerprints.update({k: cds_column_fingerprint(v) for k, v in data.items()})
+                self._saved_bytes += sum(appended[k].nbytes for k in saved)
+                return
+
         if cds_column_replace(source, data):
             source.data = data
-        else:
-            source.data.update(data)
+            self._saved_bytes += sum(saved.values())
+            fingerprints.clear()
+            fingerprints.update({k: cds_column_fingerprint(v) for k, v in data.items()})
+            return
+
+        # Only send columns which changed since they were last sent,
+        # patching columns where only a few values changed
+        changed, patches, new_fingerprints = {}, {}, {}
+        for k, values in data.items():
+            fingerprint = new_fingerprints[k] = cds_column_fingerprint(values)
+            current = source.data.get(k)
+            if fingerprint is not None and current is not None:
+                previous = fingerprints.get(k)
+                if previous is None and current is not values:
+                    previous = cds_column_fingerprint(current)
+                if fingerprint == previous:
+                    continue
+                if current is not values:
+                    patch = cds_column_patch(current, values, self._patch_threshold)
+                    if patch:
+                        patches[k] = patch
+                        continue
+            changed[k] = values
+
+        self._patch_datasource(source, patches, data, saved)
+        if changed:
+            source.data.update(changed)
+            self._saved_bytes += sum(saved.get(k, 0) for k in changed)
+        fingerprints.update(new_fingerprints)
+
+
+    def _patch_datasource(self, source, patches, data, saved):
+        """
+        Applies the patches to the datasource, accounting for the bytes
+        saved on the patched values of down-cast columns.
+        """
+        if not patches:
+            return
+        self._saved_bytes += sum(saved[k]*len(patch)//len(data[k])
+                                 for k, patch in patches.items() if k in saved)
+        # Patching modifies columns in place, so copy them to avoid
+        # modifying the data of the previously displayed element
+        for k in patches:
+            dict.__setitem__(source.data, k, source.data[k].copy())
+        source.patch(patches)
+
 
     def _update_callbacks(self, plot):
         """
@@ -364,41 +627,47 @@ class BokehPlot(DimensionedPlot):
 
     def sync_sources(self):
         """
-        Syncs data sources between Elements, which draw data
-        from the same object.
+        Syncs data sources between Elements, which draw data from the
+        same object or, if static, from objects holding identical
+        data. The columns of all plots in a group are merged into a
+        single source, plots with conflicting columns keep their own
+        source. If nothing is dynamic, plots drawing a subset of the
+        rows of another plot's DataFrame reference its source through
+        a CDSView instead of copying the subset.
         """
-        get_sources = lambda x: (id(x.current_frame.data), x)
         filter_fn = lambda x: (x.shared_datasource and x.current_frame is not None and
                                not isinstance(x.current_frame.data, np.ndarray)
                                and 'source' in x.handles)
-        data_sources = self.traverse(get_sources, [filter_fn])
-        grouped_sources = groupby(sorted(data_sources, key=lambda x: x[0]), lambda x: x[0])
+        groups = OrderedDict()
+        for plot in self.traverse(lambda x: x, [filter_fn]):
+            groups.setdefault(self._source_key(plot), []).append(plot)
+
         shared_sources = []
         source_cols = {}
-        plots = []
-        for _, group in grouped_sources:
-            group = list(group)
-            if len(group) > 1:
-                source_data = {}
-                for _, plot in group:
-                    source_data.update(plot.handles['source'].data)
-                new_source = ColumnDataSource(source_data)
-                for _, plot in group:
-                    renderer = plot.handles.get('glyph_renderer')
-                    for callback in plot.callbacks:
-                        callback.reset()
-                    if renderer is None:
-                        continue
-                    elif 'data_source' in renderer.properties():
-                        renderer.update(data_source=new_source)
-                    else:
-                        renderer.update(source=new_source)
-                    if hasattr(renderer, 'view'):
-                        renderer.view.update(source=new_source)
-                    plot.handles['source'] = plot.handles['cds'] = new_source
-                    plots.append(plot)
-                shared_sources.append(new_source)
-                source_cols[id(new_source)] = [c for c in new_source.data]
+        plots, unshared = [], []
+        for group in groups.values():
+            source_data, merged = {}, []
+            for plot in group:
+                data = plot.handles['source'].data
+                if any(k in source_data and not cds_columns_equal(source_data[k], v)
+                       for k, v in data.items()):
+                    unshared.append(plot)
+                    continue
+                source_data.update(data)
+                merged.append(plot)
+            if len(merged) < 2:
+                unshared += merged
+                continue
+            new_source = ColumnDataSource(source_data)
+            for plot in merged:
+                self._share_source(plot, new_source)
+                plots.append(plot)
+            shared_sources.append(new_source)
+            source_cols[id(new_source)] = [c for c in new_source.data]
+
+        if not self.dynamic and len(self.keys) == 1:
+            plots += self._share_subsets(unshared, plots+unshared)
+
         for plot in plots:
             if plot.hooks and plot.finalize_hooks:
                 self.warning("Supply either hooks or finalize_hooks not both; "
@@ -411,6 +680,81 @@ class BokehPlot(DimensionedPlot):
         self.handles['shared_sources'] = shared_sources
         self.handles['source_cols'] = source_cols
 
+
+    @staticmethod
+    def _source_key(plot):
+        """
+        Returns the key used to group plots sharing a data source.
+        """
+        data = plot.current_frame.data
+        if getattr(plot, 'static', False) and not plot.dynamic:
+            fingerprint = data_fingerprint(data)
+            if fingerprint is not None:
+                return fingerprint
+        return id(data)
+
+
+    @staticmethod
+    def _share_source(plot, source, view=None):
+        """
+        Replaces the data source of a plot's glyph renderer.
+        """
+        renderer = plot.handles.get('glyph_renderer')
+        for callback in plot.callbacks:
+            callback.reset()
+        if renderer is not None:
+            if 'data_source' in renderer.properties():
+                renderer.update(data_source=source)
+            else:
+                renderer.update(source=source)
+            if view is not None:
+                renderer.view = view
+            elif hasattr(renderer, 'view'):
+                renderer.view.update(source=source)
+        plot.handles['source'] = plot.handles['cds'] = source
+
+
+    def _share_subsets(self, candidates, plots):
+        """
+        Makes plots displaying a subset of the rows of the DataFrame
+        displayed by another plot reference the other plot's source
+        through a CDSView. Only applies to glyphs which do not connect
+        their points and plots without callbacks, since the indices
+        of selections would refer to the shared source.
+        """
+        if pd is None:
+            return []
+        bases = [p for p in plots if isinstance(p.current_frame.data, pd.DataFrame)
+                 and p.current_frame.data.index.is_unique]
+        subsets = []
+        for plot in candidates:
+            renderer = plot.handles.get('glyph_renderer')
+            data = plot.current_frame.data
+            if (plot.callbacks or not isinstance(data, pd.DataFrame) or
+                not hasattr(renderer, 'view') or
+                type(renderer.glyph).__name__ in self._connected_glyphs):
+                continue
+            columns = plot.handles['source'].data
+            for base in bases:
+                base_data = base.current_frame.data
+                if base is plot or len(base_data) <= len(data):
+                    continue
+                positions = base_data.index.get_indexer(data.index)
+                base_columns = base.handles['source'].data
+                if (positions < 0).any() or not all(
+                        isinstance(base_columns.get(k), np.ndarray) and
+                        len(base_columns[k]) == len(base_data) and
+                        cds_columns_equal(base_columns[k][positions], v)
+                        for k, v in columns.items()):
+                    continue
+                source = base.handles['source']
+                view = CDSView(source=source, filters=[IndexFilter(positions.tolist())])
+                self._share_source(plot, source, view)
+                subsets.append(plot)
+                break
+        return subsets
+
+
     def init_links(self):
         links = LinkCallback.find_links(self)
         callbacks = []
@@ -25,7 +25,7 @@ from ...core import Store, HoloMap
 from ..plot import Plot, GenericElementPlot
 from ..renderer import Renderer, MIME_TYPES, HTML_TAGS
 from .widgets import BokehScrubberWidget, BokehSelectionWidget, BokehServerWidgets
-from .util import attach_periodic, compute_plot_size, bokeh_version
+from .util import attach_periodic, attach_scheduler, compute_plot_size, bokeh_version
 
 NOTEBOOK_DIV = """
 {plot_div}
@@ -104,6 +104,18 @@ class BokehRenderer(Renderer):
     webgl = param.Boolean(default=False, doc="""
         Whether to render plots with WebGL if available""")
 
+    float32 = param.Boolean(default=False, doc="""
+        Whether to down-cast float64 columns to float32 before they
+        are sent to the browser, halving the size of the transferred
+        buffers. Values of large magnitude, e.g. datetimes converted
+        to milliseconds since the epoch, may lose precision.""")
+
+    push_hook = param.Callable(default=None, doc="""
+        Optional callback invoked after a plot pushed an update via
+        its Comm. It is passed the plot and a dictionary containing
+        the number of bytes which were 'sent' and the number of 'raw'
+        bytes which would have been sent without down-casting.""")
+
     widgets = {'scrubber': BokehScrubberWidget,
                'widgets': BokehSelectionWidget,
                'server': BokehServerWidgets}
@@ -268,6 +280,7 @@ class BokehRenderer(Renderer):
             plot.document = doc
 
         plot.traverse(lambda x: attach_periodic(x), [GenericElementPlot])
+        plot.traverse(lambda x: attach_scheduler(x), [GenericElementPlot])
         doc.add_root(root)
         return doc
 
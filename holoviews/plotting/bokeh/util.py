@@ -1,12 +1,15 @@
 from __future__ import absolute_import, division, unicode_literals
 
 import re
+import hashlib
 import time
 import sys
 import datetime as dt
 
 from collections import defaultdict
 from contextlib import contextmanager
+from functools import partial
+from numbers import Number
 
 import param
 import bokeh
@@ -386,6 +389,121 @@ def cds_column_replace(source, data):
     return bool(untouched and current_length and new_length and current_length[0] != new_length[0])
 
 
+def cds_column_fingerprint(values):
+    """
+    Computes a fingerprint of a ColumnDataSource column, used to
+    determine whether the column changed since it was last sent
+    without keeping a copy of large arrays. Arrays are fingerprinted
+    by a SHA-1 digest of their bytes, while lists of scalars are
+    copied so fingerprints compare the actual values. Returns None if
+    no fingerprint can be computed for the column.
+    """
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind == 'O' or not values.ndim:
+            return None
+        data = np.ascontiguousarray(values).view(np.uint8)
+        return (values.dtype.str, values.shape, hashlib.sha1(data).hexdigest())
+    elif isinstance(values, list):
+        if not all(v is None or isinstance(v, (basestring, Number)) for v in values):
+            return None
+        return ('list', tuple((type(v), v) for v in values))
+    return None
+
+
+def cds_columns_equal(a, b):
+    """
+    Whether two ColumnDataSource columns hold identical values.
+    """
+    if a is b:
+        return True
+    elif isinstance(a, np.ndarray) and isinstance(b, np.ndarray):
+        if a.shape != b.shape or a.dtype != b.dtype:
+            return False
+        try:
+            equal = a == b
+            if a.dtype.kind in 'fc':
+                equal |= np.isnan(a) & np.isnan(b)
+            return bool(np.all(equal))
+        except Exception:
+            return False
+    elif isinstance(a, list) and isinstance(b, list):
+        fingerprint = cds_column_fingerprint(a)
+        return fingerprint is not None and fingerprint == cds_column_fingerprint(b)
+    return False
+
+
+def data_fingerprint(data):
+    """
+    Computes a fingerprint of the data held by an Element, allowing
+    plots of distinct objects holding identical data to share a
+    ColumnDataSource. Returns None if no fingerprint can be computed.
+    """
+    if pd and isinstance(data, pd.DataFrame):
+        fingerprints = []
+        for k in data.columns:
+            values = data[k].values
+            if values.dtype.kind == 'O':
+                values = values.tolist()
+            fingerprints.append((k, cds_column_fingerprint(values)))
+        if any(f is None for _, f in fingerprints):
+            return None
+        return ('DataFrame',) + tuple(fingerprints)
+    elif isinstance(data, dict):
+        fingerprints = tuple((k, cds_column_fingerprint(v)) for k, v in data.items())
+        if any(f is None for _, f in fingerprints):
+            return None
+        return ('dict',) + tuple(sorted(fingerprints, key=lambda x: str(x[0])))
+    return None
+
+
+def cds_column_append(source, data):
+    """
+    Returns the rows which extend the columns of a ColumnDataSource,
+    suitable for ColumnDataSource.stream, if the new data has the same
+    columns and dtypes but more rows. The existing rows of the new data
+    are not compared with the current columns. Returns None if the new
+    data does not extend the existing columns.
+    """
+    current = source.data
+    if not data or set(current) != set(data):
+        return None
+    lengths = set()
+    for k, new in data.items():
+        old = current[k]
+        if not (isinstance(old, np.ndarray) and isinstance(new, np.ndarray)):
+            return None
+        elif old.ndim != 1 or new.ndim != 1 or old.dtype != new.dtype:
+            return None
+        lengths.add((len(old), len(new)))
+    if len(lengths) != 1:
+        return None
+    (old_length, new_length), = lengths
+    if not old_length or new_length <= old_length:
+        return None
+    return {k: v[old_length:] for k, v in data.items()}
+
+
+def cds_column_patch(old, new, threshold=0.1):
+    """
+    Computes a list of (index, value) patches which transform the old
+    column into the new column, suitable for ColumnDataSource.patch.
+    Returns None if the columns cannot be patched or if the fraction
+    of changed values exceeds the threshold.
+    """
+    if not (isinstance(old, np.ndarray) and isinstance(new, np.ndarray)):
+        return None
+    elif (old.ndim != 1 or old.shape != new.shape or old.dtype != new.dtype
+          or new.dtype.kind not in 'iufb' or not len(new)):
+        return None
+    changed = old != new
+    if new.dtype.kind == 'f':
+        changed &= ~(np.isnan(old) & np.isnan(new))
+    indexes = np.flatnonzero(changed)
+    if not len(indexes) or len(indexes) > threshold*len(new):
+        return None
+    return [(int(i), v) for i, v in zip(indexes, new[indexes].tolist())]
+
+
 @contextmanager
 def hold_policy(document, policy, server=False):
     """
@@ -457,7 +575,7 @@ def categorize_array(array, dim):
     (i.e. string) values and applies escaping for colons, which bokeh
     treats as a categorical suffix.
     """
-    return np.array([dim.pprint_value(x) for x in array])
+    return dim.pprint_values(array)
 
 
 class periodic(object):
@@ -536,6 +654,22 @@ def attach_periodic(plot):
     return plot.hmap.traverse(append_refresh, [DynamicMap])
 
 
+def attach_scheduler(plot):
+    """
+    Schedules deferred (rate limited) stream events on the event loop
+    of the plot's document.
+    """
+    for stream in plot.streams:
+        stream._scheduler = partial(schedule_timeout, plot.document)
+
+
+def schedule_timeout(document, delay, callback):
+    """
+    Schedules a callback on a bokeh document after a delay in seconds.
+    """
+    document.add_timeout_callback(callback, delay*1000)
+
+
 def date_to_integer(date):
     """
     Converts datetime types to bokeh's integer format.
@@ -8,6 +8,7 @@ from matplotlib.collections import PatchCollection, LineCollection
 from ...core import util
 from ...core.options import abbreviated_exception
 from ...element import Polygons
+from ..util import path_segments
 from .element import ColorbarPlot
 from .util import polygons_to_path_patches
 
@@ -43,16 +44,11 @@ class PathPlot(ColorbarPlot):
             if self.invert_axes:
                 paths = [p[:, ::-1] for p in paths]
             return (paths,), style, {}
-        paths, cvals = [], []
-        for path in element.split(datatype='array'):
-            length = len(path)
-            for (s1, s2) in zip(range(length-1), range(1, length+1)):
-                if cdim:
-                    cvals.append(path[s1, cidx])
-                paths.append(path[s1:s2+1, :2])
+        segments = path_segments(element.split(datatype='array'))
+        paths = segments[:, :, :2]
         if cdim:
             self._norm_kwargs(element, ranges, style, cdim)
-            style['array'] = np.array(cvals)
+            style['array'] = segments[:, 0, cidx]
         if 'c' in style:
             style['array'] = style.pop('c')
         if 'vmin' in style:
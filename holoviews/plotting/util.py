@@ -984,6 +984,40 @@ def get_directed_graph_paths(element, arrow_length):
     return arrows
 
 
+def path_segments(paths):
+    """
+    Splits a list of paths, each an array of vertices of shape (N, D),
+    into an array of line segments of shape (M, 2, D), where M is the
+    total number of segments, i.e. the number of vertices minus one
+    for each non-empty path.
+    """
+    ndims = paths[0].shape[1] if paths and np.ndim(paths[0]) == 2 else 2
+    paths = [p for p in paths if len(p)]
+    if not paths:
+        return np.empty((0, 2, ndims))
+    vertices = np.concatenate(paths)
+    starts = np.ones(len(vertices), dtype=bool)
+    starts[np.cumsum([len(p) for p in paths])-1] = False
+    starts = np.flatnonzero(starts)
+    return np.stack([vertices[starts], vertices[starts+1]], axis=1)
+
+
+def nan_separated_paths(paths):
+    """
+    Joins a list of paths, each an array of vertices of shape (N, D),
+    into a single array of vertices with paths separated by a row of
+    NaNs. Returns None if the paths cannot be NaN separated, e.g.
+    because they contain datetimes.
+    """
+    paths = [p for p in paths if len(p)]
+    if not paths or any(p.dtype.kind not in 'iuf' for p in paths):
+        return None
+    separator = np.full((1, paths[0].shape[1]), np.NaN)
+    joined = [separator]*(len(paths)*2-1)
+    joined[::2] = paths
+    return np.concatenate(joined).astype('float')
+
+
 def rgb2hex(rgb):
     """
     Convert RGB(A) tuple to hex.
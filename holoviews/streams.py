@@ -4,11 +4,14 @@ generate and respond to events, originating either in Python on the
 server-side or in Javascript in the Jupyter notebook (client-side).
 """
 
+import time
 import uuid
 import weakref
 from numbers import Number
 from collections import defaultdict
 from contextlib import contextmanager
+from functools import partial
+from threading import Lock, Timer
 
 import param
 import numpy as np
@@ -65,6 +68,18 @@ class Stream(param.Parameterized):
     determine whether a stream is active by checking whether the
     stream values match the default (usually None).
 
+    The trigger_policy option allows rate limiting high frequency
+    events, coalescing multiple events into a single trigger with the
+    merged stream contents. A 'throttle' policy triggers at most once
+    per trigger_interval (in seconds), a 'debounce' policy triggers
+    once no events have been received for the trigger_interval and a
+    'latest' policy drops events received while the subscribers are
+    still processing a previous event, triggering once more with the
+    latest contents when they complete. Since events can only arrive
+    while subscribers are processing when they are triggered from
+    multiple threads or re-entrantly, the 'latest' policy triggers
+    every event immediately in single-threaded code outside a server.
+
     The Stream class is meant for subclassing and subclasses should
     generally add one or more parameters but may also override the
     transform and reset method to preprocess parameters before they
@@ -81,6 +96,12 @@ class Stream(param.Parameterized):
     # e.g. Stream._callbacks['bokeh'][Stream] = Callback
     _callbacks = defaultdict(dict)
 
+    # Policies available to rate limit stream events
+    _trigger_policies = [None, 'throttle', 'debounce', 'latest']
+
+    # Lock guarding the rate limiting state of all streams
+    _rate_lock = Lock()
+
 
     @classmethod
     def define(cls, name, **kwargs):
@@ -133,6 +154,123 @@ class Stream(param.Parameterized):
         Passing multiple streams at once to trigger can be useful when a
         subscriber may be set multiple times across streams but only
         needs to be called once.
+
+        If any of the streams declares a trigger_policy (or has a
+        DynamicMap declaring a max_rate as its source) the trigger is
+        rate limited and events may be coalesced into a single
+        deferred trigger.
+        """
+        policy, interval = cls._rate_limit(streams)
+        if policy is None:
+            cls._trigger(streams)
+            return
+
+        key = tuple(id(stream) for stream in streams)
+        state = streams[0]._rate_states.setdefault(
+            key, dict(last=0, deadline=0, scheduled=False,
+                      running=False, pending=False))
+        now, delay = time.time(), None
+        with cls._rate_lock:
+            if policy == 'latest':
+                if state['running']:
+                    state['pending'] = True
+                    return
+                state['running'] = True
+            elif policy == 'debounce':
+                state['deadline'] = now + interval
+                if state['scheduled']:
+                    return
+                state['scheduled'] = True
+                delay = interval
+            elif state['scheduled']:
+                return
+            elif (state['last'] + interval) > now:
+                state['scheduled'] = True
+                delay = state['last'] + interval - now
+            else:
+                state['last'] = now
+
+        if policy == 'latest':
+            cls._trigger_latest(streams, state)
+        elif delay is None:
+            cls._trigger(streams)
+        else:
+            cls._schedule(streams, delay, partial(cls._trigger_scheduled,
+                                                  streams, state, policy))
+
+    @classmethod
+    def _rate_limit(cls, streams):
+        """
+        Returns the rate limiting policy and interval which apply to
+        the supplied streams.
+        """
+        policies = []
+        for stream in streams:
+            if stream.trigger_policy is not None:
+                policies.append((stream.trigger_policy, stream.trigger_interval))
+                continue
+            max_rate = getattr(stream.source, 'max_rate', None)
+            if max_rate:
+                policies.append(('throttle', 1./max_rate))
+        if not policies:
+            return None, None
+        return policies[0][0], max(interval for _, interval in policies)
+
+    @classmethod
+    def _schedule(cls, streams, delay, callback):
+        """
+        Schedules the callback to be called after the delay (in
+        seconds) using the scheduler declared on the streams, which
+        allows plotting backends to execute deferred triggers on their
+        event loop. By default a background Timer thread is used.
+        """
+        scheduler = next((s._scheduler for s in streams
+                          if s._scheduler is not None), None)
+        if scheduler is None:
+            timer = Timer(delay, callback)
+            timer.daemon = True
+            timer.start()
+        else:
+            scheduler(delay, callback)
+
+    @classmethod
+    def _trigger_scheduled(cls, streams, state, policy):
+        "Triggers a deferred event unless it has been debounced again."
+        now, delay = time.time(), None
+        with cls._rate_lock:
+            if policy == 'debounce' and state['deadline'] > now:
+                delay = state['deadline'] - now
+            else:
+                state['scheduled'] = False
+                state['last'] = now
+        if delay is None:
+            cls._trigger(streams)
+        else:
+            cls._schedule(streams, delay, partial(cls._trigger_scheduled,
+                                                  streams, state, policy))
+
+    @classmethod
+    def _trigger_latest(cls, streams, state):
+        """
+        Triggers the streams, triggering again if any events were
+        received while the subscribers were being processed.
+        """
+        pending = True
+        try:
+            while pending:
+                cls._trigger(streams)
+                with cls._rate_lock:
+                    pending = state['running'] = state['pending']
+                    state['pending'] = False
+        except Exception:
+            with cls._rate_lock:
+                state['running'] = state['pending'] = False
+            raise
+
+    @classmethod
+    def _trigger(cls, streams):
+        """
+        Triggers the subscribers of the supplied streams immediately.
         """
         # Union of stream contents
         items = [stream.contents.items() for stream in streams]
@@ -190,7 +328,8 @@ class Stream(param.Parameterized):
 
 
     def __init__(self, rename={}, source=None, subscribers=[], linked=False,
-                 transient=False, **params):
+                 transient=False, trigger_policy=None, trigger_interval=0.1,
+                 **params):
         """
         The rename argument allows multiple streams with similar event
         state to be used by remapping parameter names.
@@ -201,7 +340,32 @@ class Stream(param.Parameterized):
 
         Some streams are configured to automatically link to the source
         plot, to disable this set linked=False
+
+        The trigger_policy may be one of 'throttle', 'debounce' or
+        'latest' to rate limit events, coalescing events received
+        within the trigger_interval (in seconds). The 'throttle' and
+        'debounce' policies require a positive trigger_interval, while
+        the 'latest' policy ignores it and only has an effect if events
+        arrive while the subscribers are still processing, e.g. on a
+        server or when events are triggered from multiple threads.
         """
+        if trigger_policy not in self._trigger_policies:
+            raise ValueError('trigger_policy must be one of %s, not %r.'
+                             % (self._trigger_policies, trigger_policy))
+        if (not isinstance(trigger_interval, Number) or isinstance(trigger_interval, bool)
+            or not trigger_interval >= 0):
+            raise ValueError('trigger_interval must be a non-negative number '
+                             'of seconds, not %r.' % (trigger_interval,))
+        if trigger_policy in ('throttle', 'debounce') and trigger_interval == 0:
+            raise ValueError('The %r trigger_policy requires a positive '
+                             'trigger_interval.' % trigger_policy)
+        self.trigger_policy = trigger_policy
+        self.trigger_interval = trigger_interval
+
+        # Rate limiting state and optional scheduler used to execute
+        # deferred triggers, e.g. on the event loop of a server
+        self._rate_states = {}
+        self._scheduler = None
 
         # Source is stored as a weakref to allow it to be garbage collected
         self._source = None if source is None else weakref.ref(source)
@@ -306,7 +470,8 @@ class Stream(param.Parameterized):
         params = {k: v for k, v in self.get_param_values() if k != 'name'}
         return self.__class__(rename=mapping,
                               source=(self._source() if self._source else None),
-                              linked=self.linked, **params)
+                              linked=self.linked, trigger_policy=self.trigger_policy,
+                              trigger_interval=self.trigger_interval, **params)
 
     @property
     def source(self):
@@ -1,8 +1,10 @@
 """
 Test cases for Dimension and Dimensioned object behaviour.
 """
+import pickle
 from unittest import SkipTest
 from holoviews.core import Dimensioned, Dimension
+from holoviews.core.util import disable_constant
 from holoviews.element.comparison import ComparisonTestCase
 from ..utils import LoggingComparisonTestCase
 
@@ -44,6 +46,10 @@ class DimensionNameLabelTest(LoggingComparisonTestCase):
         self.log_handler.assertEndsWith('WARNING', substr)
         self.assertEqual(dim.label, 'Another test')
 
+    def test_dimension_label_pickle_roundtrip(self):
+        dim = pickle.loads(pickle.dumps(Dimension('test', label='A test')))
+        self.assertEqual(dim.label, 'A test')
+
     def test_dimension_invalid_name(self):
         regexp = 'Dimension name must only be passed as the positional argument'
         with self.assertRaisesRegexp(KeyError, regexp):
@@ -226,6 +232,41 @@ class DimensionCloneTest(ComparisonTestCase):
         self.assertEqual(clone.label, 'A test')
 
 
+class DimensionPprintValuesTest(ComparisonTestCase):
+
+    def assert_pprint_values(self, dim, values):
+        expected = [dim.pprint_value(v) for v in values]
+        self.assertEqual(list(dim.pprint_values(values)), expected)
+
+    def test_pprint_values_float(self):
+        self.assert_pprint_values(Dimension('test'), np.array([1.5, np.nan, 1.5, 3.]))
+
+    def test_pprint_values_int(self):
+        self.assert_pprint_values(Dimension('test'), np.array([3, 1, 3, 2]))
+
+    def test_pprint_values_strings(self):
+        self.assert_pprint_values(Dimension('test'), np.array(['B', 'A', 'B'], dtype=object))
+
+    def test_pprint_values_mixed_objects(self):
+        self.assert_pprint_values(Dimension('test'), np.array([1, 1.5, 'A', None], dtype=object))
+
+    def test_pprint_values_datetime(self):
+        dates = np.array(['2017-01-01T12:30:01.5', '1999-12-31'], dtype='datetime64[ns]')
+        self.assert_pprint_values(Dimension('test'), dates)
+
+    def test_pprint_values_datetime_nat(self):
+        dates = np.array(['2017-01-01T12:30:01', 'NaT'], dtype='datetime64[s]')
+        self.assertEqual(list(Dimension('test').pprint_values(dates)),
+                         ['2017-01-01 12:30:01', 'NaT'])
+
+    def test_pprint_values_value_format(self):
+        dim = Dimension('test', value_format=lambda x: '%.1f' % x)
+        self.assert_pprint_values(dim, np.array([1, 2, 1.25]))
+
+    def test_pprint_values_empty(self):
+        self.assertEqual(len(Dimension('test').pprint_values([])), 0)
+
+
 class DimensionDefaultTest(ComparisonTestCase):
 
     def test_validate_default_against_values(self):
@@ -291,3 +332,39 @@ class DimensionedTest(ComparisonTestCase):
         dimensioned = Dimensioned('Arbitrary Data', kdims=['x'])
         redimensioned = dimensioned.redim.cyclic(x=True)
         self.assertEqual(redimensioned.kdims[0].cyclic, True)
+
+    def test_dimensioned_get_dimension_by_label(self):
+        dimensioned = Dimensioned('Arbitrary Data', kdims=[('x', 'X Label')], vdims=['y'])
+        self.assertIs(dimensioned.get_dimension('X Label'), dimensioned.kdims[0])
+
+    def test_dimensioned_get_dimension_index_by_label(self):
+        dimensioned = Dimensioned('Arbitrary Data', kdims=['x'], vdims=[('y', 'Y Label')])
+        self.assertEqual(dimensioned.get_dimension_index('Y Label'), 1)
+
+    def test_dimensioned_get_dimension_index_not_found(self):
+        dimensioned = Dimensioned('Arbitrary Data', kdims=['x'], vdims=['y'])
+        with self.assertRaisesRegexp(Exception, 'Dimension z not found'):
+            dimensioned.get_dimension_index('z')
+
+    def test_dimensioned_dimensions_returns_copy(self):
+        dimensioned = Dimensioned('Arbitrary Data', kdims=['x'], vdims=['y'])
+        dims = dimensioned.dimensions()
+        dims.append(Dimension('z'))
+        self.assertEqual(dimensioned.dimensions(label=True), ['x', 'y'])
+
+    def test_dimensioned_lookup_updated_on_kdims_change(self):
+        dimensioned = Dimensioned('Arbitrary Data', kdims=['x'], vdims=['y'])
+        self.assertEqual(dimensioned.dimensions('key', label=True), ['x'])
+        self.assertIs(dimensioned.get_dimension('z'), None)
+        with disable_constant(dimensioned):
+            dimensioned.kdims = [Dimension('z')]
+        self.assertEqual(dimensioned.dimensions('key', label=True), ['z'])
+        self.assertEqual(dimensioned.get_dimension('z'), Dimension('z'))
+        self.assertEqual(dimensioned.get_dimension_index('y'), 1)
+
+    def test_dimensioned_lookup_updated_on_inplace_change(self):
+        dimensioned = Dimensioned('Arbitrary Data', kdims=['x'], vdims=['y'])
+        self.assertEqual(dimensioned.dimensions(label=True), ['x', 'y'])
+        dimensioned.vdims[0] = Dimension('z')
+        self.assertEqual(dimensioned.dimensions(label=True), ['x', 'z'])
+        self.assertEqual(dimensioned.get_dimension_index('z'), 1)
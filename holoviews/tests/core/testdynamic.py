@@ -1,5 +1,8 @@
+import sys
 import uuid
 from collections import deque
+from unittest import SkipTest
+import threading
 import time
 
 import numpy as np
@@ -780,6 +783,159 @@ class TestPeriodicStreamUpdate(ComparisonTestCase):
         self.assertEqual((end - start) < 5, True)
 
 
+class DynamicMapAsyncCallbacks(ComparisonTestCase):
+
+    def setUp(self):
+        if sys.version_info < (3, 5):
+            raise SkipTest('async def callbacks require Python >= 3.5')
+        namespace = {'Curve': Curve}
+        exec("async def callback(x):\n"
+             "    return Curve([1, 2, x])", namespace)
+        self.callback = namespace['callback']
+
+    def test_async_callback_evaluated(self):
+        dmap = DynamicMap(self.callback, kdims=['x'])
+        self.assertEqual(dmap[3], Curve([1, 2, 3]))
+
+    def test_async_callback_with_stream(self):
+        xval = Stream.define('x', x=0)()
+        dmap = DynamicMap(self.callback, streams=[xval])
+        xval.event(x=2)
+        self.assertEqual(dmap[()], Curve([1, 2, 2]))
+
+    def test_async_callback_memoized(self):
+        calls = []
+        namespace = {'Curve': Curve, 'calls': calls}
+        exec("async def callback(x):\n"
+             "    calls.append(x)\n"
+             "    return Curve([1, 2, x])", namespace)
+        xval = Stream.define('x', x=0)()
+        dmap = DynamicMap(namespace['callback'], streams=[xval])
+        dmap[()]
+        dmap[()]
+        self.assertEqual(calls, [0])
+
+
+class DynamicMapLatency(ComparisonTestCase):
+
+    def test_latency_no_calls(self):
+        dmap = DynamicMap(lambda x: Curve([x]), kdims=['x'])
+        self.assertEqual(dmap.latency, dict(calls=0, last=None, max=None,
+                                            mean=None, superseded=0))
+
+    def test_latency_records_calls(self):
+        dmap = DynamicMap(lambda x: Curve([x]), kdims=['x'])
+        dmap[0]
+        dmap[1]
+        latency = dmap.latency
+        self.assertEqual(latency['calls'], 2)
+        self.assertTrue(latency['max'] >= latency['last'] >= 0)
+
+
+class DynamicMapPrefetch(ComparisonTestCase):
+
+    def setUp(self):
+        self.calls = []
+        def callback(x):
+            self.calls.append(x)
+            return Curve([1, 2, x])
+        self.callback = callback
+
+    def _wait(self, dmap):
+        state = dmap._prefetch_state()
+        for _ in range(100):
+            if not state['threads']:
+                break
+            time.sleep(0.01)
+
+    def test_prefetch_keys_step(self):
+        dim = Dimension('x', range=(0, 10), step=1)
+        dmap = DynamicMap(self.callback, kdims=[dim], prefetch=2)
+        self.assertEqual(dmap._prefetch_keys((5,)), [(6,), (4,), (7,), (3,)])
+
+    def test_prefetch_keys_step_clipped_to_range(self):
+        dim = Dimension('x', range=(0, 10), step=1)
+        dmap = DynamicMap(self.callback, kdims=[dim], prefetch=2)
+        self.assertEqual(dmap._prefetch_keys((0,)), [(1,), (2,)])
+
+    def test_prefetch_keys_values(self):
+        dim = Dimension('x', values=['a', 'b', 'c', 'd'])
+        dmap = DynamicMap(self.callback, kdims=[dim], prefetch=1)
+        self.assertEqual(dmap._prefetch_keys(('b',)), [('c',), ('a',)])
+
+    def test_prefetch_keys_multiple_dimensions(self):
+        dims = [Dimension('x', values=[0, 1, 2]), Dimension('y', values=[0, 1, 2])]
+        dmap = DynamicMap(lambda x, y: Curve([x, y]), kdims=dims, prefetch=1)
+        self.assertEqual(dmap._prefetch_keys((1, 1)),
+                         [(2, 1), (0, 1), (1, 2), (1, 0)])
+
+    def test_prefetch_keys_unbounded_skipped(self):
+        dmap = DynamicMap(self.callback, kdims=[Dimension('x', step=1)], prefetch=1)
+        self.assertEqual(dmap._prefetch_keys((0,)), [])
+
+    def test_prefetch_disabled_by_default(self):
+        dim = Dimension('x', range=(0, 10), step=1)
+        dmap = DynamicMap(self.callback, kdims=[dim])
+        dmap[0]
+        self._wait(dmap)
+        self.assertEqual(self.calls, [0])
+
+    def test_prefetch_neighbor_served_without_callback(self):
+        dim = Dimension('x', range=(0, 10), step=1)
+        dmap = DynamicMap(self.callback, kdims=[dim], prefetch=1)
+        dmap[0]
+        self._wait(dmap)
+        self.assertEqual(self.calls, [0, 1])
+        self.assertEqual(dmap[1], Curve([1, 2, 1]))
+        self._wait(dmap)
+        self.assertEqual(self.calls, [0, 1, 2])
+        self.assertEqual(list(dmap.data.keys()), [(0,), (1,)])
+
+    def test_prefetch_frames_budget(self):
+        dim = Dimension('x', range=(0, 10), step=1)
+        dmap = DynamicMap(self.callback, kdims=[dim], prefetch=3,
+                          prefetch_frames=2)
+        dmap[0]
+        self._wait(dmap)
+        self.assertEqual(self.calls, [0, 1, 2, 3])
+        self.assertEqual(list(dmap._prefetch_state()['frames'].keys()), [(2,), (3,)])
+
+    def test_prefetch_reset_clears_frames(self):
+        dim = Dimension('x', range=(0, 10), step=1)
+        dmap = DynamicMap(self.callback, kdims=[dim], prefetch=1)
+        dmap[0]
+        self._wait(dmap)
+        dmap.reset()
+        self.assertEqual(len(dmap._prefetch_state()['frames']), 0)
+
+    def test_prefetch_does_not_modify_callback_state(self):
+        dim = Dimension('x', range=(0, 10), step=1)
+        dmap = DynamicMap(self.callback, kdims=[dim], prefetch=1)
+        dmap[0]
+        self._wait(dmap)
+        self.assertEqual(self.calls, [0, 1])
+        self.assertEqual(dmap.callback.kwargs, {'x': 0})
+        self.assertEqual(len(dmap.callback._memoized), 1)
+
+    def test_prefetch_reset_discards_in_flight_frames(self):
+        release = threading.Event()
+        def callback(x):
+            if x == 1:
+                release.wait(1)
+            self.calls.append(x)
+            return Curve([1, 2, x])
+        dim = Dimension('x', range=(0, 10), step=1)
+        dmap = DynamicMap(callback, kdims=[dim], prefetch=1)
+        dmap[0]
+        dmap.reset()
+        release.set()
+        self._wait(dmap)
+        self.assertEqual(len(dmap._prefetch_state()['frames']), 0)
+        dmap.prefetch = 0
+        dmap[1]
+        self.assertEqual(self.calls, [0, 1, 1])
+
+
 class DynamicCollate(ComparisonTestCase):
 
     def test_dynamic_collate_layout(self):
@@ -241,3 +241,11 @@ class HoloMapTest(ComparisonTestCase):
                         for i in range(10)}, kdims=['z'])
         mapped = hmap.map(lambda x: x if x.range(1)[1] > 0 else None, Dataset)
         self.assertEqual(hmap[1:10], mapped)
+
+    def test_holomap_map_threads_executor(self):
+        hmap = HoloMap({i: Dataset({'x':self.xs, 'y': self.ys * i},
+                                   kdims=['x'], vdims=['y'])
+                        for i in range(10)}, kdims=['z'])
+        fn = lambda x: x.redim(y='y2')
+        mapped = hmap.map(fn, Dataset, executor='threads', workers=2)
+        self.assertEqual(mapped, hmap.map(fn, Dataset))
@@ -19,7 +19,7 @@ from holoviews.core.util import (
     sanitize_identifier_fn, find_range, max_range, wrap_tuple_streams,
     deephash, merge_dimensions, get_path, make_path_unique, compute_density,
     date_range, dt_to_int, compute_edges, isfinite, cross_index, closest_match,
-    dimension_range
+    dimension_range, tree_reduce
 )
 from holoviews import Dimension, Element
 from holoviews.streams import PointerXY
@@ -853,3 +853,22 @@ class TestClosestMatch(ComparisonTestCase):
         self.assertEqual(closest_match(spec, specs), None)
         spec = ('Scatter', 'Foo', 'Bar', 5)
         self.assertEqual(closest_match(spec, specs), None)
+
+
+class TestTreeReduce(ComparisonTestCase):
+
+    def test_tree_reduce_preserves_order(self):
+        items = ['a', 'b', 'c', 'd', 'e']
+        self.assertEqual(tree_reduce(lambda x, y: x+y, items), 'abcde')
+
+    def test_tree_reduce_threads(self):
+        items = ['a', 'b', 'c', 'd', 'e']
+        reduced = tree_reduce(lambda x, y: x+y, items, 'threads', 2)
+        self.assertEqual(reduced, 'abcde')
+
+    def test_tree_reduce_single_item(self):
+        self.assertEqual(tree_reduce(lambda x, y: x+y, [1]), 1)
+
+    def test_tree_reduce_empty(self):
+        with self.assertRaises(ValueError):
+            tree_reduce(lambda x, y: x+y, [])
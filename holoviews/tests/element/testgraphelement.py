@@ -11,6 +11,7 @@ from holoviews.element.chart import Points
 from holoviews.element.graphs import (
     Graph, Nodes, TriMesh, Chord, circular_layout, connect_edges,
     connect_edges_pd)
+from holoviews.element.util import edge_segments
 from holoviews.element.comparison import ComparisonTestCase
 
 
@@ -74,6 +75,29 @@ class GraphTests(ComparisonTestCase):
             paths.append(np.array([start[:2], end[:2]]))
         self.assertEqual(segments, paths)
 
+    def test_graph_edge_segments_array(self):
+        segments = edge_segments(self.graph)
+        nodes = np.column_stack(self.nodes)
+        expected = np.stack([nodes[self.source, :2], nodes[self.target, :2]], axis=1)
+        self.assertEqual(segments, expected)
+
+    def test_graph_edge_segments_missing_node_dropped(self):
+        graph = Graph((([0, 1, 2], [1, 9, 0]), [(0, 0, 0), (1, 1, 1), (2, 0, 2)]))
+        segments = connect_edges_pd(graph)
+        self.assertEqual(segments, [np.array([[0, 0], [1, 1]]),
+                                    np.array([[2, 0], [0, 0]])])
+
+    def test_graph_edge_segments_missing_node_raises(self):
+        graph = Graph((([0, 1, 2], [1, 9, 0]), [(0, 0, 0), (1, 1, 1), (2, 0, 2)]))
+        with self.assertRaises(ValueError):
+            connect_edges(graph)
+
+    def test_graph_edge_segments_string_index(self):
+        graph = Graph(((['A', 'C'], ['B', 'A']), [(0, 0, 'A'), (1, 1, 'B'), (2, 0, 'C')]))
+        segments = connect_edges(graph)
+        self.assertEqual(segments, [np.array([[0, 0], [1, 1]]),
+                                    np.array([[2, 0], [0, 0]])])
+
     def test_constructor_with_nodes_and_paths(self):
         paths = Graph(((self.source, self.target), self.nodes)).edgepaths
         graph = Graph(((self.source, self.target), self.nodes, paths.data))
@@ -1,3 +1,6 @@
+import os
+import shutil
+import tempfile
 from unittest import SkipTest
 from nose.plugins.attrib import attr
 
@@ -6,12 +9,14 @@ from holoviews import (Dimension, Curve, Points, Image, Dataset, RGB, Path,
                        Graph, TriMesh, QuadMesh, NdOverlay, Contours)
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.core.util import pd
+from holoviews.streams import Buffer
 
 try:
     import datashader as ds
     from holoviews.operation.datashader import (
         aggregate, regrid, ds_version, stack, directly_connect_edges,
-        shade, rasterize
+        shade, rasterize, datashade, spread, dynspread, precompute_cache,
+        aggregate_cache, AggregatePyramid
     )
 except:
     ds_version = None
@@ -150,6 +155,32 @@ class DatashaderAggregateTests(ComparisonTestCase):
                         width=2, height=2)
         self.assertEqual(img, expected)
 
+    def test_aggregate_ndoverlay_layer_workers(self):
+        rs = np.random.RandomState(1)
+        ndoverlay = NdOverlay({i: Points(rs.rand(100, 3), vdims='z') for i in range(5)})
+        for agg_fn in [ds.count(), ds.sum('z'), ds.mean('z')]:
+            kwargs = dict(dynamic=False, x_range=(0, 1), y_range=(0, 1), width=4,
+                          height=4, aggregator=agg_fn)
+            img = aggregate(ndoverlay, layer_workers=3, **kwargs)
+            self.assertEqual(img, aggregate(ndoverlay, **kwargs))
+
+    def test_aggregate_ndoverlay_layer_workers_separate_instances(self):
+        rs = np.random.RandomState(1)
+        ndoverlay = NdOverlay({i: Points(rs.rand(100, 3), vdims='z') for i in range(5)})
+        process_element = aggregate.process_element
+        instances = []
+        def record(op, element, key, **params):
+            instances.append(op)
+            return process_element(op, element, key, **params)
+        aggregate.process_element = record
+        try:
+            aggregate(ndoverlay, layer_workers=3, dynamic=False, x_range=(0, 1),
+                      y_range=(0, 1), width=4, height=4, aggregator=ds.mean('z'))
+        finally:
+            aggregate.process_element = process_element
+        self.assertEqual(len(instances), 10)
+        self.assertEqual(len(set(map(id, instances))), 10)
+
     def test_aggregate_path(self):
         path = Path([[(0.2, 0.3), (0.4, 0.7)], [(0.4, 0.7), (0.8, 0.99)]])
         expected = Image(([0.25, 0.75], [0.25, 0.75], [[1, 0], [2, 1]]),
@@ -158,6 +189,47 @@ class DatashaderAggregateTests(ComparisonTestCase):
                         width=2, height=2)
         self.assertEqual(img, expected)
 
+    def test_aggregate_graph(self):
+        nodes = [(0.2, 0.3, 0), (0.4, 0.7, 1), (0.8, 0.99, 2)]
+        graph = Graph((([0, 1], [1, 2]), nodes))
+        expected = Image(([0.25, 0.75], [0.25, 0.75], [[1, 0], [2, 1]]),
+                         vdims=['Count'])
+        img = aggregate(graph, dynamic=False,  x_range=(0, 1), y_range=(0, 1),
+                        width=2, height=2)
+        self.assertEqual(img, expected)
+
+    def test_aggregate_graph_matches_edgepaths(self):
+        rs = np.random.RandomState(1)
+        nodes = (rs.rand(20), rs.rand(20), np.arange(20))
+        graph = Graph(((rs.randint(0, 20, 50), rs.randint(0, 20, 50)), nodes))
+        kwargs = dict(dynamic=False, x_range=(0, 1), y_range=(0, 1), width=10, height=10)
+        self.assertEqual(aggregate(graph, **kwargs), aggregate(graph.edgepaths, **kwargs))
+
+    def test_aggregate_data_prepared_once_with_precompute(self):
+        precompute_cache.clear()
+        points = Points([(0.2, 0.3), (0.4, 0.7), (0, 0.99)])
+        kwargs = dict(dynamic=False, width=2, height=2, precompute=True)
+        aggregate(points, **kwargs)
+        aggregate(points, **kwargs)
+        self.assertEqual(precompute_cache.stats['misses'], 1)
+        self.assertEqual(precompute_cache.stats['hits'], 1)
+        precompute_cache.clear()
+
+    def test_aggregate_data_category_does_not_modify_element(self):
+        df = pd.DataFrame({'x': [0., 1.], 'y': [0., 1.], 'cat': ['A', 'B']})
+        points = Points(df, vdims=['cat'])
+        _, _, data, _ = aggregate.get_agg_data(points, 'cat')
+        self.assertEqual(data.data['cat'].dtype.name, 'category')
+        self.assertEqual(points.data['cat'].dtype.name, 'object')
+
+    def test_aggregate_data_datetimes_does_not_modify_element(self):
+        dates = pd.date_range('2018-01-01', periods=3)
+        df = pd.DataFrame({'x': dates, 'y': [0., 1., 2.]})
+        curve = Curve(df)
+        _, _, data, _ = aggregate.get_agg_data(curve)
+        self.assertEqual(data.data['x'].values, dates.values.view('int64')*1000.)
+        self.assertEqual(curve.data['x'].dtype.kind, 'M')
+
     def test_aggregate_contours_with_vdim(self):
         contours = Contours([[(0.2, 0.3, 1), (0.4, 0.7, 1)], [(0.4, 0.7, 2), (0.8, 0.99, 2)]], vdims='z')
         img = rasterize(contours, dynamic=False)
@@ -177,6 +249,300 @@ class DatashaderAggregateTests(ComparisonTestCase):
         self.assertEqual(img, expected)
 
 
+@attr(optional=1)
+class DatashaderPrecomputeCacheTests(ComparisonTestCase):
+    """
+    Tests for the shared datashader precompute cache
+    """
+
+    def setUp(self):
+        if ds_version is None:
+            raise SkipTest('Precompute cache tests require datashader')
+        self.limits = (precompute_cache.max_entries, precompute_cache.max_bytes)
+        precompute_cache.clear()
+
+    def tearDown(self):
+        precompute_cache.max_entries, precompute_cache.max_bytes = self.limits
+        precompute_cache.clear()
+
+    def _aggregate(self, element):
+        return aggregate(element, dynamic=False, x_range=(0, 1), y_range=(0, 1),
+                         width=2, height=2, precompute=True)
+
+    def test_precompute_cache_shared_between_equal_data(self):
+        data = [(0.2, 0.3), (0.4, 0.7), (0, 0.99)]
+        img1 = self._aggregate(Points(data))
+        img2 = self._aggregate(Points(list(data)))
+        self.assertEqual(img1, img2)
+        self.assertEqual(precompute_cache.stats['entries'], 1)
+        self.assertEqual(precompute_cache.stats['misses'], 1)
+        self.assertEqual(precompute_cache.stats['hits'], 1)
+
+    def test_precompute_cache_distinct_data(self):
+        self._aggregate(Points([(0.2, 0.3), (0.4, 0.7)]))
+        self._aggregate(Points([(0.2, 0.3), (0.4, 0.8)]))
+        self.assertEqual(precompute_cache.stats['entries'], 2)
+        self.assertEqual(precompute_cache.stats['hits'], 0)
+
+    def test_precompute_cache_not_populated_without_precompute(self):
+        aggregate(Points([(0.2, 0.3)]), dynamic=False, width=2, height=2)
+        self.assertEqual(precompute_cache.stats['entries'], 0)
+        self.assertEqual(precompute_cache.stats['misses'], 0)
+
+    def test_precompute_cache_not_keyed_without_precompute(self):
+        points = Points([(0.2, 0.3)])
+        aggregate(points, dynamic=False, width=2, height=2)
+        self.assertNotIn(points, precompute_cache._fingerprints)
+
+    def test_precompute_cache_evicts_least_recently_used(self):
+        precompute_cache.max_entries = 2
+        points = [Points([(0.1*i, 0.5)]) for i in range(3)]
+        self._aggregate(points[0])
+        self._aggregate(points[1])
+        self._aggregate(points[0])
+        self._aggregate(points[2])
+        self.assertEqual(precompute_cache.stats['evictions'], 1)
+        self._aggregate(points[0])
+        self.assertEqual(precompute_cache.stats['hits'], 2)
+        self._aggregate(points[1])
+        self.assertEqual(precompute_cache.stats['misses'], 4)
+
+    def test_precompute_cache_memory_budget(self):
+        precompute_cache.max_bytes = 1000
+        self._aggregate(Points(np.random.rand(10, 2)))
+        self._aggregate(Points(np.random.rand(1000, 2)))
+        stats = precompute_cache.stats
+        self.assertEqual(stats['entries'], 1)
+        self.assertTrue(stats['nbytes'] <= 1000)
+
+
+@attr(optional=1)
+class DatashaderAggregateCacheTests(ComparisonTestCase):
+    """
+    Tests for the viewport aggregate cache
+    """
+
+    def setUp(self):
+        if ds_version is None:
+            raise SkipTest('Aggregate cache tests require datashader')
+        aggregate_cache.clear()
+        self.points = Points(np.random.RandomState(1).rand(1000, 2))
+
+    def tearDown(self):
+        aggregate_cache.clear()
+
+    def _aggregate(self, x_range, y_range, **kwargs):
+        return aggregate(self.points, dynamic=False, x_range=x_range, y_range=y_range,
+                         width=20, height=10, cache_aggregates=True, **kwargs)
+
+    def test_aggregate_cache_snaps_to_pixel_grid(self):
+        img = self._aggregate((0.0201, 0.5201), (0, 0.5))
+        self.assertEqual(img.bounds.lbrt(), (0.025, 0, 0.525, 0.5))
+
+    def test_aggregate_cache_returning_viewport(self):
+        img1 = self._aggregate((0, 0.5), (0, 0.5))
+        self._aggregate((0, 0.25), (0, 0.25))
+        img2 = self._aggregate((0, 0.5), (0, 0.5))
+        self.assertEqual(img1, img2)
+        self.assertEqual(aggregate_cache.stats['hits'], 1)
+        self.assertEqual(aggregate_cache.stats['partial_hits'], 0)
+
+    def test_aggregate_cache_pan_matches_full_aggregate(self):
+        for x_range, y_range in [((0.2, 0.7), (0.1, 0.6)), ((0.1, 0.6), (0.2, 0.7)),
+                                 ((0.3, 0.8), (0, 0.5)), ((0.05, 0.55), (0.3, 0.8))]:
+            aggregate_cache.clear()
+            self._aggregate((0.1, 0.6), (0.1, 0.6))
+            panned = self._aggregate(x_range, y_range)
+            self.assertEqual(aggregate_cache.stats['partial_hits'], 1)
+            aggregate_cache.clear()
+            self.assertEqual(panned, self._aggregate(x_range, y_range))
+
+    def test_aggregate_cache_pan_without_overlap(self):
+        self._aggregate((0, 0.25), (0, 0.25))
+        self._aggregate((0.5, 0.75), (0.5, 0.75))
+        self.assertEqual(aggregate_cache.stats['partial_hits'], 0)
+        self.assertEqual(aggregate_cache.stats['entries'], 2)
+
+    def test_aggregate_cache_distinct_aggregators(self):
+        self._aggregate((0, 0.5), (0, 0.5))
+        self._aggregate((0, 0.5), (0, 0.5), aggregator=ds.any())
+        self.assertEqual(aggregate_cache.stats['hits'], 0)
+        self.assertEqual(aggregate_cache.stats['entries'], 2)
+
+
+@attr(optional=1)
+class DatashaderPyramidTests(ComparisonTestCase):
+    """
+    Tests for pre-aggregated pyramids
+    """
+
+    def setUp(self):
+        if ds_version is None:
+            raise SkipTest('Pyramid tests require datashader')
+        xs, ys = np.meshgrid(np.linspace(0, 1, 33), np.linspace(0, 1, 33))
+        zs = np.random.RandomState(1).rand(*xs.shape)
+        self.points = Points((xs.flat, ys.flat, zs.flat), vdims='z')
+
+    def _compare(self, aggregator, **kwargs):
+        pyramid = AggregatePyramid(self.points, aggregator=aggregator,
+                                   levels=3, tile_size=4)
+        params = dict(dict(x_range=(0, 1), y_range=(0, 1), width=4, height=4),
+                      **kwargs)
+        img = aggregate(self.points, dynamic=False, aggregator=aggregator,
+                        pyramid=pyramid, **params)
+        expected = aggregate(self.points, dynamic=False, aggregator=aggregator, **params)
+        self.assertEqual(img, expected)
+        return pyramid
+
+    def test_pyramid_count(self):
+        pyramid = self._compare(ds.count())
+        self.assertEqual(sorted(set(k[0] for k in pyramid.tiles)), [0, 1, 2])
+        self.assertEqual(pyramid.tiles[(0, 0, 0)].sum(), 33*33)
+
+    def test_pyramid_sum(self):
+        self._compare(ds.sum('z'))
+
+    def test_pyramid_min(self):
+        self._compare(ds.min('z'))
+
+    def test_pyramid_max_intermediate_level(self):
+        self._compare(ds.max('z'), x_range=(0.5, 1), width=4)
+
+    def test_pyramid_deep_zoom_falls_back(self):
+        pyramid = self._compare(ds.count(), x_range=(0, 0.25), y_range=(0, 0.25), width=16)
+        self.assertEqual(pyramid.query((0, 0.25), (0, 0.25), 16, 16), None)
+
+    def test_pyramid_non_matching_aggregator_falls_back(self):
+        pyramid = AggregatePyramid(self.points, levels=2, tile_size=4)
+        img = aggregate(self.points, dynamic=False, aggregator=ds.max('z'),
+                        pyramid=pyramid, x_range=(0, 1), y_range=(0, 1),
+                        width=4, height=4)
+        expected = aggregate(self.points, dynamic=False, aggregator=ds.max('z'),
+                             x_range=(0, 1), y_range=(0, 1), width=4, height=4)
+        self.assertEqual(img, expected)
+
+    def test_pyramid_aggregates_cached_separately(self):
+        aggregate_cache.clear()
+        other = Points(self.points.array()[::2], vdims='z')
+        pyramid = AggregatePyramid(other, levels=2, tile_size=4)
+        params = dict(dynamic=False, x_range=(0, 1), y_range=(0, 1),
+                      width=4, height=4, cache_aggregates=True)
+        approximate = aggregate(self.points, pyramid=pyramid, **params)
+        exact = aggregate(self.points, **params)
+        self.assertEqual(approximate, aggregate(self.points, pyramid=pyramid, dynamic=False,
+                                                x_range=(0, 1), y_range=(0, 1),
+                                                width=4, height=4))
+        self.assertEqual(exact, aggregate(self.points, dynamic=False, x_range=(0, 1),
+                                          y_range=(0, 1), width=4, height=4))
+        self.assertNotEqual(approximate.data['Count'].sum(), exact.data['Count'].sum())
+        pyramid.build(self.points)
+        self.assertEqual(aggregate(self.points, pyramid=pyramid, **params), exact)
+        aggregate_cache.clear()
+
+    def test_pyramid_save_load(self):
+        pyramid = AggregatePyramid(self.points, aggregator=ds.sum('z'),
+                                   levels=2, tile_size=4)
+        tmpdir = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(tmpdir, 'pyramid.npz')
+            pyramid.save(filename)
+            loaded = AggregatePyramid.load(filename)
+        finally:
+            shutil.rmtree(tmpdir)
+        self.assertIsInstance(loaded.aggregator, ds.sum)
+        self.assertEqual(loaded.aggregator.column, 'z')
+        self.assertEqual(loaded.extent, pyramid.extent)
+        self.assertEqual(sorted(loaded.tiles), sorted(pyramid.tiles))
+        for key, tile in pyramid.tiles.items():
+            self.assertEqual(loaded.tiles[key], tile)
+
+
+@attr(optional=1)
+class DatashaderIncrementalAggregateTests(ComparisonTestCase):
+    """
+    Tests for incremental aggregation of streamed data
+    """
+
+    def setUp(self):
+        if ds_version is None:
+            raise SkipTest('Incremental aggregation tests require datashader')
+        if pd is None:
+            raise SkipTest('Incremental aggregation tests require pandas')
+        self.rs = np.random.RandomState(1)
+
+    def _chunk(self, n=20):
+        return pd.DataFrame(self.rs.rand(n, 3), columns=['x', 'y', 'z'])
+
+    def _stream(self, aggregator, length):
+        buffer = Buffer(self._chunk(0), length=length, index=False)
+        op = aggregate.instance(incremental=True)
+        for _ in range(5):
+            buffer.send(self._chunk())
+            points = Points(buffer.data, vdims='z')
+            kwargs = dict(dynamic=False, x_range=(0, 1), y_range=(0, 1),
+                          width=5, height=5, aggregator=aggregator)
+            self.assertEqual(op(points, **kwargs), aggregate(points, **kwargs))
+        self.assertEqual(aggregate._streaming[op].stats['hits'], 4)
+
+    def test_stream_offset_append(self):
+        prev = self._chunk()
+        data = pd.concat([prev, self._chunk()])
+        self.assertEqual(aggregate._stream_offset(prev, data, ['x', 'y']), 0)
+
+    def test_stream_offset_sliding_window(self):
+        prev = self._chunk()
+        data = pd.concat([prev.iloc[5:], self._chunk(5)])
+        self.assertEqual(aggregate._stream_offset(prev, data, ['x', 'y']), 5)
+
+    def test_stream_offset_unrelated_data(self):
+        self.assertEqual(aggregate._stream_offset(self._chunk(), self._chunk(), ['x', 'y']), None)
+
+    def test_incremental_count_append(self):
+        self._stream(ds.count(), 1000)
+
+    def test_incremental_count_sliding_window(self):
+        self._stream(ds.count(), 50)
+
+    def test_incremental_sum_sliding_window(self):
+        self._stream(ds.sum('z'), 50)
+
+    def test_incremental_max_append(self):
+        self._stream(ds.max('z'), 1000)
+
+    def test_incremental_min_sliding_window(self):
+        self._stream(ds.min('z'), 50)
+
+    def test_incremental_unrelated_streams(self):
+        buffers = [Buffer(self._chunk(0), length=1000, index=False) for _ in range(2)]
+        ops = [aggregate.instance(incremental=True) for _ in range(2)]
+        stream_offset = aggregate.__dict__['_stream_offset']
+        offsets = []
+        def record(cls, prev, data, columns):
+            offset = stream_offset.__func__(cls, prev, data, columns)
+            offsets.append(offset)
+            return offset
+        aggregate._stream_offset = classmethod(record)
+        try:
+            for _ in range(3):
+                for buffer, op in zip(buffers, ops):
+                    buffer.send(self._chunk())
+                    points = Points(buffer.data, vdims='z')
+                    op(points, dynamic=False, x_range=(0, 1), y_range=(0, 1),
+                       width=5, height=5)
+        finally:
+            aggregate._stream_offset = stream_offset
+        self.assertEqual(offsets, [0, 0, 0, 0])
+
+    def test_incremental_state_memory_limit(self):
+        op = aggregate.instance(incremental=True)
+        op._streaming_bytes = 1024
+        points = Points(self._chunk(100), vdims='z')
+        op(points, dynamic=False, x_range=(0, 1), y_range=(0, 1), width=5, height=5)
+        self.assertEqual(aggregate._streaming[op].stats['entries'], 0)
+        op(points.iloc[:20], dynamic=False, x_range=(0, 1), y_range=(0, 1), width=5, height=5)
+        self.assertEqual(aggregate._streaming[op].stats['entries'], 1)
+
+
 @attr(optional=1)
 class DatashaderShadeTests(ComparisonTestCase):
 
@@ -210,6 +576,20 @@ class DatashaderShadeTests(ComparisonTestCase):
                        vdims=RGB.vdims+[Dimension('A', range=(0, 1))])
         self.assertEqual(shaded, expected)
 
+    def test_datashade_fused_spread(self):
+        points = Points(np.random.RandomState(1).rand(100, 2))
+        kwargs = dict(dynamic=False, x_range=(0, 1), y_range=(0, 1), width=20, height=20)
+        spreading = spread.instance(px=2, dynamic=False)
+        self.assertEqual(datashade(points, spreading=spreading, **kwargs),
+                         spreading(datashade(points, **kwargs)))
+
+    def test_datashade_fused_dynspread(self):
+        points = Points(np.random.RandomState(1).rand(100, 2))
+        kwargs = dict(dynamic=False, x_range=(0, 1), y_range=(0, 1), width=20, height=20)
+        spreading = dynspread.instance(max_px=3, threshold=0.8, dynamic=False)
+        self.assertEqual(datashade(points, spreading=spreading, **kwargs),
+                         spreading(datashade(points, **kwargs)))
+
 
 
 @attr(optional=1)
@@ -291,6 +671,72 @@ class DatashaderRegridTests(ComparisonTestCase):
         expected = Image(np.zeros((0, 0)), bounds=(0, 0, 0, 0), xdensity=1, ydensity=1)
         self.assertEqual(regridded, expected)
 
+    def test_regrid_cropped_viewport_matches_full_raster(self):
+        xs = np.linspace(0.005, 0.995, 100)
+        arr = np.random.RandomState(1).rand(100, 100)
+        img = Image((xs, xs, arr), datatype=['xarray'])
+        regridded = regrid(img, x_range=(0.2, 0.6), y_range=(0.1, 0.5), width=10,
+                           height=10, dynamic=False)
+        cvs = ds.Canvas(plot_width=10, plot_height=10, x_range=(0.2, 0.6), y_range=(0.1, 0.5))
+        expected = cvs.raster(img.data['z'], agg=ds.mean('z'))
+        self.assertEqual(regridded.dimension_values(2, flat=False),
+                         expected.values)
+
+    def test_regrid_dask_matches_numpy(self):
+        try:
+            import dask.array as da
+        except ImportError:
+            raise SkipTest('Test requires dask')
+        xs, ys = np.linspace(0, 4, 700), np.linspace(0, 2.5, 500)
+        arr = np.random.RandomState(1).rand(500, 700)
+        img = Image((xs, ys, arr), datatype=['xarray'])
+        dask_img = img.clone(img.data.chunk({'x': 100, 'y': 100}))
+        self.assertTrue(isinstance(dask_img.data['z'].data, da.Array))
+        for agg in ['mean', 'min', 'max']:
+            kwargs = dict(width=50, height=30, x_range=(1.03, 3.97), y_range=(0.51, 2.2),
+                          dynamic=False, aggregator=agg)
+            self.assertEqual(regrid(dask_img, **kwargs), regrid(img, **kwargs))
+
+    def test_regrid_dask_coarsened(self):
+        try:
+            import dask.array as da
+        except ImportError:
+            raise SkipTest('Test requires dask')
+        xs = np.linspace(0.0025, 0.9975, 200)
+        arr = np.random.RandomState(1).rand(200, 200)
+        img = Image((xs, xs, arr), datatype=['xarray'])
+        dask_img = img.clone(img.data.chunk({'x': 50, 'y': 50}))
+        self.assertTrue(isinstance(dask_img.data['z'].data, da.Array))
+        for agg in ['mean', 'max']:
+            kwargs = dict(width=10, height=10, dynamic=False, aggregator=agg)
+            self.assertEqual(regrid(dask_img, coarsen=True, **kwargs), regrid(img, **kwargs))
+
+    def test_regrid_dask_coarsened_keeps_edge_samples(self):
+        try:
+            import dask.array  # noqa (Test dask is available)
+        except ImportError:
+            raise SkipTest('Test requires dask')
+        xs = np.linspace(0.5, 104.5, 105)
+        arr = np.ones((105, 105))
+        arr[:, 100:] = 2
+        img = Image((xs, xs, arr), datatype=['xarray'])
+        dask_img = img.clone(img.data.chunk({'x': 50, 'y': 50}))
+        regridded = regrid(dask_img, coarsen=True, width=10, height=10, dynamic=False)
+        values = regridded.dimension_values(2, flat=False)
+        self.assertTrue((values[:, -1] > 1).all())
+        self.assertEqual(values[:, :-1], np.ones((10, 9)))
+
+    def test_regrid_cache_aggregates(self):
+        img = Image(np.random.RandomState(1).rand(20, 20), bounds=(0, 0, 1, 1))
+        aggregate_cache.clear()
+        try:
+            kwargs = dict(width=5, height=5, dynamic=False, cache_aggregates=True)
+            regridded = regrid(img, **kwargs)
+            self.assertEqual(regrid(img, **kwargs), regridded)
+            self.assertEqual(aggregate_cache.stats['hits'], 1)
+        finally:
+            aggregate_cache.clear()
+
 
 
 @attr(optional=1)
@@ -398,6 +844,34 @@ class DatashaderRasterizeTests(ComparisonTestCase):
                       bounds=(-.5, -.5, 1.5, 1.5))
         self.assertEqual(img, image)
 
+    def test_rasterize_trimesh_second_node_vdim(self):
+        simplices = [(0, 1, 2), (3, 2, 1)]
+        vertices = [(0., 0., 1, 0), (0., 1., 2, 0), (1., 0, 3, 0), (1, 1, 4, 0)]
+        trimesh = TriMesh((simplices, Points(vertices, vdims=['node_z', 'w'])))
+        img = rasterize(trimesh, width=3, height=3, dynamic=False, aggregator=ds.mean('w'))
+        image = Image(np.array([[0., 0., np.NaN], [0., 0., np.NaN], [np.NaN, np.NaN, np.NaN]]),
+                      bounds=(0, 0, 1, 1), vdims='w')
+        self.assertEqual(img, image)
+
+    def test_rasterize_quadmesh_triangulation_cached(self):
+        qmesh = QuadMesh(([0, 1], [0, 1], np.array([[0, 1], [2, 3]])))
+        self.assertIs(qmesh._triangulate(), qmesh._triangulate())
+
+    def test_rasterize_quadmesh_reuses_triangulation(self):
+        precompute_cache.clear()
+        qmesh1 = QuadMesh(([0, 1], [0, 1], np.array([[0, 1], [2, 3]])))
+        qmesh2 = QuadMesh(([0, 1], [0, 1], np.array([[4, 5], [6, 7]])))
+        kwargs = dict(width=3, height=3, dynamic=False, precompute=True,
+                      aggregator=ds.mean('z'))
+        rasterize(qmesh1, **kwargs)
+        hits = precompute_cache.hits
+        img = rasterize(qmesh2, **kwargs)
+        self.assertEqual(precompute_cache.hits, hits+1)
+        image = Image(np.array([[6., 7., np.NaN], [4, 5, np.NaN], [np.NaN, np.NaN, np.NaN]]),
+                      bounds=(-.5, -.5, 1.5, 1.5))
+        self.assertEqual(img, image)
+        precompute_cache.clear()
+
     def test_rasterize_points(self):
         points = Points([(0.2, 0.3), (0.4, 0.7), (0, 0.99)])
         img = rasterize(points, dynamic=False,  x_range=(0, 1), y_range=(0, 1),
@@ -495,3 +969,7 @@ class GraphBundlingTests(ComparisonTestCase):
     def test_directly_connect_paths(self):
         direct = directly_connect_edges(self.graph)._split_edgepaths
         self.assertEqual(direct, self.graph.edgepaths)
+
+    def test_directly_connect_paths_split(self):
+        direct = directly_connect_edges(self.graph, split=True)
+        self.assertEqual(direct.edgepaths, self.graph.edgepaths)
@@ -3,7 +3,7 @@ import datetime as dt
 import numpy as np
 from nose.plugins.attrib import attr
 
-from holoviews import (HoloMap, NdOverlay, NdLayout, GridSpace, Image,
+from holoviews import (HoloMap, NdOverlay, NdLayout, GridSpace, Image, RGB,
                        Contours, Polygons, Points, Histogram, Curve, Area,
                        QuadMesh, Dataset)
 from holoviews.core.data.grid import GridInterface
@@ -11,7 +11,8 @@ from holoviews.core.util import pd
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.operation.element import (operation, transform, threshold,
                                          gradient, contours, histogram,
-                                         interpolate_curve)
+                                         interpolate_curve, image_pyramid)
+from holoviews.element.util import downsample_2d
 
 class OperationTests(ComparisonTestCase):
     """
@@ -43,6 +44,18 @@ class OperationTests(ComparisonTestCase):
         op_hmap = operation(hmap, op=lambda x, k: x.clone(x.data*2))
         self.assertEqual(op_hmap.last, hmap.last.clone(hmap.last.data*2, group='Operation'))
 
+    def test_operation_holomap_threads_executor(self):
+        hmap = HoloMap({i: Image(np.random.rand(10, 10)) for i in range(10)})
+        op_hmap = operation(hmap, op=lambda x, k: x.clone(x.data*k),
+                            executor='threads', workers=2)
+        self.assertEqual(op_hmap, operation(hmap, op=lambda x, k: x.clone(x.data*k)))
+
+    def test_operation_holomap_processes_executor(self):
+        hmap = HoloMap({i: Image(np.random.rand(10, 10)) for i in range(10)})
+        op_hmap = histogram(hmap, num_bins=5, executor='processes',
+                            workers=2, chunksize=3)
+        self.assertEqual(op_hmap, histogram(hmap, num_bins=5))
+
     def test_image_transform(self):
         img = Image(np.random.rand(10, 10))
         op_img = transform(img, operator=lambda x: x*2)
@@ -211,6 +224,57 @@ class OperationTests(ComparisonTestCase):
         hist = Histogram(([1.,  4., 7.5], [0, 3, 6, 9]), vdims=['y'])
         self.assertEqual(op_hist, hist)
 
+    def test_downsample_2d_mean(self):
+        arr = np.arange(16.).reshape(4, 4)
+        self.assertEqual(downsample_2d(arr), np.array([[2.5, 4.5], [10.5, 12.5]]))
+
+    def test_downsample_2d_max_odd_shape(self):
+        arr = np.arange(9).reshape(3, 3)
+        self.assertEqual(downsample_2d(arr, 'max'), np.array([[4, 5], [7, 8]]))
+
+    def test_downsample_2d_mean_ignores_nans(self):
+        arr = np.array([[np.NaN, 1], [3, np.NaN]])
+        self.assertEqual(downsample_2d(arr), np.array([[2.]]))
+
+    def test_downsample_2d_nearest(self):
+        arr = np.arange(16).reshape(4, 4)
+        self.assertEqual(downsample_2d(arr, 'nearest'), np.array([[0, 2], [8, 10]]))
+
+    def test_image_pyramid_selects_level(self):
+        img = Image(np.random.rand(64, 64), bounds=(0, 0, 64, 64))
+        pyramid = image_pyramid(img, dynamic=False, width=16, height=16)
+        self.assertEqual(pyramid.dimension_values(2, flat=False).shape, (16, 16))
+        self.assertEqual(pyramid.bounds.lbrt(), (0, 0, 64, 64))
+
+    def test_image_pyramid_crops_to_range(self):
+        arr = np.arange(64*64.).reshape(64, 64)
+        img = Image(arr, bounds=(0, 0, 64, 64))
+        pyramid = image_pyramid(img, dynamic=False, width=16, height=16,
+                                x_range=(8, 24), y_range=(32, 48))
+        self.assertEqual(pyramid.bounds.lbrt(), (8, 32, 24, 48))
+        self.assertEqual(pyramid.dimension_values(2, flat=False),
+                         img[8:24, 32:48].dimension_values(2, flat=False))
+
+    def test_image_pyramid_level_cached(self):
+        img = Image(np.random.rand(64, 64))
+        image_pyramid(img, dynamic=False, width=16, height=16)
+        levels = image_pyramid._pyramids[img]['mean']
+        self.assertEqual([lvl[0].shape for lvl in levels],
+                         [(64, 64), (32, 32), (16, 16), (8, 8), (4, 4), (2, 2), (1, 1)])
+        image_pyramid(img, dynamic=False, width=8, height=8, x_range=(0, 0.5))
+        self.assertIs(image_pyramid._pyramids[img]['mean'], levels)
+
+    def test_image_pyramid_rgb(self):
+        rgb = RGB(np.random.rand(32, 32, 3))
+        pyramid = image_pyramid(rgb, dynamic=False, width=8, height=8)
+        self.assertEqual(pyramid.vdims, rgb.vdims)
+        self.assertEqual(pyramid.dimension_values(2, flat=False).shape, (8, 8))
+
+    def test_image_pyramid_dynamic(self):
+        img = Image(np.random.rand(64, 64))
+        dmap = image_pyramid(img, width=16, height=16)
+        self.assertEqual(dmap[()].dimension_values(2, flat=False).shape, (16, 16))
+
     def test_interpolate_curve_pre(self):
         interpolated = interpolate_curve(Curve([0, 0.5, 1]), interpolation='steps-pre')
         curve = Curve([(0, 0), (0, 0.5), (1, 0.5), (1, 1), (2, 1)])
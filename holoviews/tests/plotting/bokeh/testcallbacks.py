@@ -1,22 +1,26 @@
+import time
 from collections import deque, namedtuple
 
 import numpy as np
 
 from holoviews.core import DynamicMap, NdOverlay
 from holoviews.core.options import Store
-from holoviews.element import Points, Polygons, Box, Curve, Table
+from holoviews.element import Points, Polygons, Box, Curve, Table, Bars
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.streams import (PointDraw, PolyDraw, PolyEdit, BoxEdit,
                                PointerXY, PointerX, PlotReset, Selection1D,
-                               RangeXY, PlotSize, CDSStream)
+                               RangeXY, PlotSize, CDSStream, Stream)
 import pyviz_comms as comms
 
 try:
+    from bokeh.document import Document
     from bokeh.events import Tap
-    from bokeh.models import Range1d, Plot, ColumnDataSource, Selection, PolyEditTool
+    from bokeh.models import (
+        Range1d, Plot, ColumnDataSource, Selection, PolyEditTool, HoverTool
+    )
     from holoviews.plotting.bokeh.callbacks import (
         Callback, PointDrawCallback, PolyDrawCallback, PolyEditCallback,
-        BoxEditCallback, Selection1DCallback
+        BoxEditCallback, Selection1DCallback, HoverLookupCallback
     )
     from holoviews.plotting.bokeh.renderer import BokehRenderer
     bokeh_server_renderer = BokehRenderer.instance(mode='server')
@@ -129,6 +133,82 @@ class TestResetCallback(CallbackTestCase):
         self.assertIs(stream.source, curve)
 
         
+class TestHoverLookupCallback(CallbackTestCase):
+
+    def test_hover_lookup_omits_hover_columns(self):
+        points = Points([(0, 1, 2), (1, 2, 3)], vdims='z').options(hover_lookup=True)
+        plot = bokeh_renderer.get_plot(points)
+        self.assertEqual(sorted(plot.handles['source'].data), ['x', 'y'])
+        self.assertEqual(plot.handles['hover'].tooltips,
+                         [('x', '@{x}'), ('y', '@{y}'), ('z', '$index{z}')])
+        self.assertEqual(plot.handles['hover_lookup'].data, {'index': [], 'z': []})
+
+    def test_hover_lookup_formats_datetime_columns(self):
+        xs = np.array(['2018-01-01', '2018-01-02'], dtype='datetime64[ns]')
+        points = Points((xs, [1, 2], [3, 4]), vdims='z').options(hover_lookup=True)
+        plot = bokeh_server_renderer.get_plot(points)
+        self.assertEqual(plot.handles['hover'].tooltips,
+                         [('x', '$index{x}'), ('y', '@{y}'), ('z', '$index{z}')])
+        plot._resolve_hover([1])
+        self.assertEqual(plot.handles['hover_lookup'].data,
+                         {'index': [1], 'x': ['2018-01-02 00:00:00'], 'z': ['4']})
+
+    def test_hover_lookup_ignores_unknown_fields(self):
+        points = Points([(0, 1, 2), (1, 2, 3)], vdims='z').options(hover_lookup=True)
+        plot = bokeh_server_renderer.get_plot(points)
+        hover = HoverTool(tooltips=[('z', '@{z}'), ('A', '@{A}')])
+        plot._init_hover_lookup(hover, plot.handles['source'])
+        self.assertEqual(hover.tooltips, [('z', '$index{z}'), ('A', '@{A}')])
+        self.assertEqual(sorted(plot.handles['hover_lookup'].data), ['index', 'z'])
+
+    def test_hover_lookup_resolves_values(self):
+        points = Points([(0, 1, 2), (1, 2, 3)], vdims='z').options(hover_lookup=True)
+        plot = bokeh_server_renderer.get_plot(points)
+        tooltips = plot.handles['hover'].tooltips
+        callback = [cb for cb in plot.callbacks if isinstance(cb, HoverLookupCallback)][0]
+        callback.on_msg({'index': [1, 2]})
+        self.assertEqual(plot.handles['hover_lookup'].data, {'index': [1], 'z': ['3']})
+        self.assertEqual(plot.handles['hover'].tooltips, tooltips)
+
+    def test_hover_lookup_skips_resolved_indices(self):
+        points = Points([(0, 1, 2), (1, 2, 3)], vdims='z').options(hover_lookup=True)
+        plot = bokeh_server_renderer.get_plot(points)
+        plot._resolve_hover([1])
+        plot._resolve_hover([0, 1])
+        self.assertEqual(plot.handles['hover_lookup'].data, {'index': [1, 0], 'z': ['3', '2']})
+        self.assertEqual(list(plot._hover_values), ['z'])
+
+    def test_hover_lookup_cache_bounded(self):
+        points = Points([(i, i, i) for i in range(5)], vdims='z').options(hover_lookup=True)
+        plot = bokeh_server_renderer.get_plot(points)
+        plot._hover_cache_size = 2
+        for i in range(4):
+            plot._resolve_hover([i])
+        self.assertEqual(plot.handles['hover_lookup'].data['index'], [2, 3])
+
+    def test_hover_lookup_reset_on_frame_update(self):
+        stream = PointerX(x=0)
+        dmap = DynamicMap(lambda x: Curve([(0, x, 1), (1, x, 2)], vdims=['y', 'z']),
+                          streams=[stream]).options(hover_lookup=True)
+        plot = bokeh_server_renderer.get_plot(dmap)
+        plot._resolve_hover([0])
+        self.assertEqual(plot.handles['hover_lookup'].data, {'index': [0], 'z': ['1']})
+        stream.event(x=1)
+        self.assertEqual(plot.handles['hover_lookup'].data, {'index': [], 'z': []})
+        self.assertEqual(plot._hover_values, {})
+
+    def test_hover_lookup_unsupported_glyphs(self):
+        curve = Curve([(0, 1, 2), (1, 2, 3)], vdims=['y', 'z'])
+        plot = bokeh_renderer.get_plot(curve.options(hover_lookup=True, tools=['hover'],
+                                                   interpolation='steps-mid'))
+        self.assertNotIn('hover_lookup', plot.handles)
+        self.assertIn('z', plot.handles['source'].data)
+        bars = Bars([('A', 1, 2), ('B', 2, 3)], vdims=['y', 'z'])
+        plot = bokeh_renderer.get_plot(bars.options(hover_lookup=True, tools=['hover']))
+        self.assertNotIn('hover_lookup', plot.handles)
+        self.assertIn('z', plot.handles['source'].data)
+
+
 class TestEditToolCallbacks(CallbackTestCase):
 
     def test_point_draw_callback(self):
@@ -141,6 +221,20 @@ class TestEditToolCallbacks(CallbackTestCase):
         callback.on_msg({'data': data})
         self.assertEqual(point_draw.element, Points(data))
 
+    def test_point_draw_callback_invalidates_sent_columns(self):
+        stream = Stream.define(str('Test'), i=0)()
+        dmap = DynamicMap(lambda i: Points([(0, 1), (1, 2)]), streams=[stream])
+        PointDraw(source=dmap)
+        plot = bokeh_server_renderer.get_plot(dmap)
+        callback = [cb for cb in plot.callbacks if isinstance(cb, PointDrawCallback)][0]
+        source = plot.handles['source']
+        stream.event(i=1)
+        data = {'x': np.array([0, 5]), 'y': np.array([1, 2])}
+        source.data = data
+        callback.on_msg({'data': data})
+        stream.event(i=2)
+        self.assertEqual(source.data['x'], np.array([0, 1]))
+
     def test_point_draw_callback_initialized_server(self):
         points = Points([(0, 1)])
         PointDraw(source=points)
@@ -332,6 +426,30 @@ class TestServerCallbacks(CallbackTestCase):
         msg = Callback.resolve_attr_spec('cb_obj.x', event, plot)
         self.assertEqual(msg, {'id': plot.ref['id'], 'value': 42})
 
+    def test_server_callback_drops_superseded_events(self):
+        points = Points([1, 2, 3])
+        RangeXY(source=points)
+        plot = bokeh_server_renderer.get_plot(points, doc=Document())
+        callback = plot.callbacks[0]
+        callback._queue = [('start', 0, 1), ('end', 2, 3), ('start', 1, 2)]
+        callback.process_on_change()
+        stats = callback.stats
+        self.assertEqual(stats['processed'], 1)
+        self.assertEqual(stats['dropped'], 2)
+        self.assertEqual(callback._queue, [])
+
+    def test_server_callback_backs_off_slow_updates(self):
+        points = Points([1, 2, 3])
+        stream = RangeXY(source=points)
+        stream.add_subscriber(lambda **kwargs: time.sleep(0.1))
+        plot = bokeh_server_renderer.get_plot(points, doc=Document())
+        callback = plot.callbacks[0]
+        callback._queue = [('start', 0, 1)]
+        callback.process_on_change()
+        stats = callback.stats
+        self.assertGreaterEqual(stats['timeout'], 100)
+        self.assertLess(stats['rate'], 5)
+
     def test_selection1d_resolves(self):
         points = Points([1, 2, 3])
         Selection1D(source=points)
@@ -2,17 +2,20 @@ from unittest import SkipTest
 from collections import OrderedDict
 
 import numpy as np
+import pandas as pd
 
 from bokeh.core.properties import value
 from holoviews.core import Dimension, DynamicMap, NdOverlay
-from holoviews.element import Curve, Image, Scatter, Labels
-from holoviews.streams import Stream
+from holoviews.element import Curve, Image, Scatter, Labels, Points, Table
+from holoviews.streams import Stream, Pipe
 from holoviews.plotting.util import process_cmap
 
 from .testplot import TestBokehPlot, bokeh_renderer
 
 try:
     from bokeh.document import Document
+    from bokeh.document.events import (ColumnDataChangedEvent, ColumnsPatchedEvent,
+                                       ColumnsStreamedEvent)
     from bokeh.models import FuncTickFormatter, PrintfTickFormatter, NumeralTickFormatter
 except:
     pass
@@ -221,6 +224,164 @@ class TestElementPlot(TestBokehPlot):
         self.assertEqual(source.data['image'][0].mean(), 2)
         self.assertNotIn(source, plot.current_handles)
 
+    def _column_update_plot(self, ys):
+        stream = Stream.define(str('Test'), i=0)()
+        dmap = DynamicMap(lambda i: Curve((np.arange(20), ys[i])), streams=[stream])
+        doc = Document()
+        plot = bokeh_renderer.get_plot(dmap, doc=doc)
+        doc.add_root(plot.state)
+        doc.hold()
+        plot.comm = None
+        return plot, stream, doc
+
+    def test_update_datasource_sends_changed_columns_only(self):
+        ys = [np.arange(20.), np.arange(20.)*2]
+        plot, stream, doc = self._column_update_plot(ys)
+        stream.event(i=1)
+        events = [e.hint for e in doc._held_events]
+        self.assertEqual(len(events), 1)
+        self.assertIsInstance(events[0], ColumnDataChangedEvent)
+        self.assertEqual(events[0].cols, ['y'])
+        self.assertEqual(plot.handles['source'].data['y'], ys[1])
+
+    def test_update_datasource_unchanged_columns_not_sent(self):
+        ys = [np.arange(20.), np.arange(20.)]
+        plot, stream, doc = self._column_update_plot(ys)
+        stream.event(i=1)
+        self.assertEqual(doc._held_events, [])
+
+    def test_update_datasource_patches_sparse_changes(self):
+        ys = [np.arange(20.), np.arange(20.)]
+        ys[1][3] = 10
+        plot, stream, doc = self._column_update_plot(ys)
+        stream.event(i=1)
+        events = [e.hint for e in doc._held_events]
+        self.assertEqual(len(events), 1)
+        self.assertIsInstance(events[0], ColumnsPatchedEvent)
+        self.assertEqual(events[0].patches, {'y': [(3, 10.0)]})
+        self.assertEqual(plot.handles['source'].data['y'], ys[1])
+        self.assertEqual(ys[0][3], 3)
+
+    def _pipe_update_plot(self, element, data):
+        pipe = Pipe(data=data)
+        dmap = DynamicMap(element, streams=[pipe])
+        doc = Document()
+        plot = bokeh_renderer.get_plot(dmap, doc=doc)
+        doc.add_root(plot.state)
+        doc.hold()
+        plot.comm = None
+        return plot, pipe, doc
+
+    def test_update_datasource_streams_appended_rows(self):
+        df = pd.DataFrame({'x': np.arange(10.), 'y': np.arange(10.)*2})
+        plot, pipe, doc = self._pipe_update_plot(Points, df)
+        new_df = pd.DataFrame({'x': np.arange(12.), 'y': np.arange(12.)*2})
+        pipe.send(new_df)
+        events = [e.hint for e in doc._held_events]
+        self.assertEqual(len(events), 1)
+        self.assertIsInstance(events[0], ColumnsStreamedEvent)
+        self.assertEqual(events[0].data, {'x': np.array([10., 11.]), 'y': np.array([20., 22.])})
+        self.assertEqual(plot.handles['source'].data['y'], new_df.y.values)
+
+    def test_update_datasource_patches_and_streams_rows(self):
+        df = pd.DataFrame({'x': np.arange(20.), 'y': np.arange(20.)})
+        plot, pipe, doc = self._pipe_update_plot(Curve, df)
+        new_df = pd.DataFrame({'x': np.arange(21.), 'y': np.arange(21.)})
+        new_df.loc[3, 'y'] = 10
+        pipe.send(new_df)
+        events = [e.hint for e in doc._held_events]
+        self.assertEqual(len(events), 2)
+        self.assertIsInstance(events[0], ColumnsPatchedEvent)
+        self.assertEqual(events[0].patches, {'y': [(3, 10.0)]})
+        self.assertIsInstance(events[1], ColumnsStreamedEvent)
+        self.assertEqual(plot.handles['source'].data['y'], new_df.y.values)
+        self.assertEqual(df.y.values[3], 3)
+
+    def test_update_datasource_replaces_on_schema_change(self):
+        df = pd.DataFrame({'x': np.arange(10.), 'y': np.arange(10.)})
+        plot, pipe, doc = self._pipe_update_plot(Table, df)
+        new_df = pd.DataFrame({'x': np.arange(12), 'y': np.arange(12.)})
+        pipe.send(new_df)
+        events = [e.hint for e in doc._held_events]
+        self.assertNotIn(ColumnsStreamedEvent, [type(e) for e in events])
+        self.assertEqual(plot.handles['source'].data['x'], new_df.x.values)
+
+    def test_push_stats(self):
+        class TestComm(object):
+            def send(self, data=None, buffers=[]):
+                pass
+        ys = [np.arange(20.), np.arange(20.)*2]
+        plot, stream, doc = self._column_update_plot(ys)
+        plot.comm = TestComm()
+        stream.event(i=1)
+        plot.push()
+        stats = plot.push_stats
+        self.assertEqual(stats['pushes'], 1)
+        self.assertTrue(stats['last'] > 0)
+        self.assertEqual(stats['bytes'], stats['last'])
+
+    def test_float32_downcasting(self):
+        bokeh_renderer.float32 = True
+        try:
+            plot = bokeh_renderer.get_plot(Curve((np.arange(5), np.arange(5.)/3)))
+        finally:
+            bokeh_renderer.float32 = False
+        data = plot.handles['source'].data
+        self.assertEqual(data['x'].dtype, np.int64)
+        self.assertEqual(data['y'].dtype, np.float32)
+
+    def test_push_stats_raw_bytes(self):
+        pushes = []
+        class TestComm(object):
+            def send(self, data=None, buffers=[]):
+                pass
+        ys = [np.arange(20.), np.arange(20.)*2]
+        bokeh_renderer.float32 = True
+        bokeh_renderer.push_hook = lambda plot, stats: pushes.append(stats)
+        try:
+            plot, stream, doc = self._column_update_plot(ys)
+            plot.comm = TestComm()
+            stream.event(i=1)
+            plot.push()
+        finally:
+            bokeh_renderer.float32 = False
+            bokeh_renderer.push_hook = None
+        stats = plot.push_stats
+        self.assertEqual(stats['last_raw'], stats['last']+80)
+        self.assertEqual(stats['raw_bytes'], stats['last_raw'])
+        self.assertEqual(pushes, [{'sent': stats['last'], 'raw': stats['last_raw']}])
+
+    def _push_raw_bytes(self, callback, ys):
+        class TestComm(object):
+            def send(self, data=None, buffers=[]):
+                pass
+        stream = Stream.define(str('Test'), i=0)()
+        dmap = DynamicMap(lambda i: callback(ys[i]), streams=[stream])
+        bokeh_renderer.float32 = True
+        try:
+            doc = Document()
+            plot = bokeh_renderer.get_plot(dmap, doc=doc)
+            doc.add_root(plot.state)
+            doc.hold()
+            plot.comm = TestComm()
+            stream.event(i=1)
+            plot.push()
+        finally:
+            bokeh_renderer.float32 = False
+        stats = plot.push_stats
+        return stats['last_raw'] - stats['last']
+
+    def test_push_stats_raw_bytes_overlay(self):
+        ys = [np.arange(20.), np.arange(20.)*2]
+        callback = lambda y: Curve((np.arange(20), y)) * Curve((np.arange(20), y*2))
+        self.assertEqual(self._push_raw_bytes(callback, ys), 160)
+
+    def test_push_stats_raw_bytes_patch(self):
+        y = np.arange(20.)
+        ys = [y, np.where(y == 3, 10, y)]
+        callback = lambda y: Curve((np.arange(20), y))
+        self.assertEqual(self._push_raw_bytes(callback, ys), 4)
+
     def test_stream_cleanup(self):
         stream = Stream.define(str('Test'), test=1)()
         dmap = DynamicMap(lambda test: Curve([]), streams=[stream])
@@ -2,12 +2,16 @@ from __future__ import absolute_import
 
 import numpy as np
 from holoviews.core.data import Dataset
+from holoviews.core.spaces import DynamicMap
 from holoviews.element import Graph, Nodes, TriMesh, Chord, circular_layout
+from holoviews.streams import Pipe
 from holoviews.util.transform import dim
 
 try:
     from bokeh.models import (NodesAndLinkedEdges, EdgesAndLinkedNodes, Patches)
     from bokeh.models.mappers import CategoricalColorMapper, LinearColorMapper
+    from bokeh.document import Document
+    from bokeh.document.events import ColumnsPatchedEvent
 except:
     pass
 
@@ -31,6 +35,23 @@ class TestBokehGraphPlot(TestBokehPlot):
         self.graph3 = Graph(((self.source, self.target), self.node_info2))
         self.graph4 = Graph(((self.source, self.target, self.weights),), vdims='Weight')
 
+    def test_graph_update_patches_edges(self):
+        source, target = np.arange(20), np.zeros(20, dtype=int)
+        pipe = Pipe(data=(source, target))
+        dmap = DynamicMap(lambda data: Graph((data,)), streams=[pipe])
+        doc = Document()
+        plot = bokeh_renderer.get_plot(dmap, doc=doc)
+        doc.add_root(plot.state)
+        doc.hold()
+        plot.comm = None
+        new_target = target.copy()
+        new_target[5] = 1
+        pipe.send((source, new_target))
+        events = [e.hint for e in doc._held_events]
+        self.assertEqual(len(events), 1)
+        self.assertIsInstance(events[0], ColumnsPatchedEvent)
+        self.assertEqual(events[0].patches, {'end': [(5, 1)]})
+
     def test_plot_simple_graph(self):
         plot = bokeh_renderer.get_plot(self.graph)
         node_source = plot.handles['scatter_1_source']
@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 
 from holoviews.core import (HoloMap, GridSpace, Layout, Empty, Dataset,
                             NdOverlay, DynamicMap, Dimension)
@@ -11,6 +12,7 @@ try:
     from bokeh.layouts import Column, Row
     from bokeh.models import Div, ToolbarBox, GlyphRenderer, Tabs, Panel
     from bokeh.plotting import Figure
+    from holoviews.plotting.bokeh.chart import PointPlot
 except:
     pass
 
@@ -207,6 +209,36 @@ class TestLayoutPlot(TestBokehPlot):
         self.assertEqual(data['C'], np.full_like(hmap1[1].dimension_values(0), np.NaN))
         self.assertEqual(data['D'], np.full_like(hmap1[1].dimension_values(0), np.NaN))
 
+    def test_layout_shared_source_identical_data(self):
+        df = pd.DataFrame({'x': np.arange(10.), 'y': np.arange(10.)*2})
+        layout = (Points(df) + Points(df.copy())).opts(plot=dict(shared_datasource=True))
+        plot = bokeh_renderer.get_plot(layout)
+        sources = plot.handles.get('shared_sources', [])
+        self.assertEqual(len(sources), 1)
+        for subplot in plot.traverse(lambda x: x, [PointPlot]):
+            self.assertIs(subplot.handles['source'], sources[0])
+
+    def test_layout_shared_source_conflicting_columns(self):
+        df = pd.DataFrame({'x': np.arange(10.), 'y': np.arange(10.)*2, 'z': np.arange(10.)})
+        points = Points(df, vdims=['z'])
+        layout = (points.options(size_index='z', scaling_factor=2) +
+                  points.options(size_index='z', scaling_factor=4))
+        layout = layout.opts(plot=dict(shared_datasource=True))
+        plot = bokeh_renderer.get_plot(layout)
+        self.assertEqual(plot.handles.get('shared_sources', []), [])
+        sources = [p.handles['source'] for p in plot.traverse(lambda x: x, [PointPlot])]
+        self.assertIsNot(sources[0], sources[1])
+
+    def test_layout_shared_source_subset_view(self):
+        df = pd.DataFrame({'x': np.arange(10.), 'y': np.arange(10.)*2})
+        layout = (Points(df) + Points(df[df.x > 5])).opts(plot=dict(shared_datasource=True))
+        plot = bokeh_renderer.get_plot(layout)
+        subplot1, subplot2 = plot.traverse(lambda x: x, [PointPlot])
+        self.assertIs(subplot1.handles['source'], subplot2.handles['source'])
+        view = subplot2.handles['glyph_renderer'].view
+        self.assertIs(view.source, subplot1.handles['source'])
+        self.assertEqual(view.filters[0].indices, [6, 7, 8, 9])
+
     def test_shared_axes(self):
         curve = Curve(range(10))
         img = Image(np.random.rand(10,10))
@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 
 from holoviews.core import NdOverlay, HoloMap, DynamicMap, Overlay
 from holoviews.core.options import Cycle
@@ -202,6 +203,33 @@ class TestOverlayPlot(TestBokehPlot):
         self.assertEqual(y_range.start, 0)
         self.assertEqual(y_range.end, 19.655978889110628)
 
+    def test_overlay_shared_datasource(self):
+        data = {'x': np.arange(10.), 'y': np.arange(10.)*2}
+        overlay = (Points(data) * Curve(data)).options(shared_datasource=True)
+        plot = bokeh_renderer.get_plot(overlay)
+        sources = plot.handles['shared_sources']
+        self.assertEqual(len(sources), 1)
+        for subplot in plot.subplots.values():
+            self.assertIs(subplot.handles['source'], sources[0])
+
+    def test_overlay_shared_datasource_disabled_by_default(self):
+        data = {'x': np.arange(10.), 'y': np.arange(10.)*2}
+        plot = bokeh_renderer.get_plot(Points(data) * Curve(data))
+        source1, source2 = [p.handles['source'] for p in plot.subplots.values()]
+        self.assertIsNot(source1, source2)
+
+    def test_dynamic_overlay_frames_diverging_after_init(self):
+        data = pd.DataFrame({'x': np.arange(3.), 'y': np.arange(3.)})
+        def callback(i):
+            curve_data = data.assign(y=data.y*i) if i else data
+            return Points(data) * Curve(curve_data)
+        plot = bokeh_renderer.get_plot(DynamicMap(callback, kdims='i').redim.range(i=(0, 2)))
+        plot.update((2,))
+        points, curve = [p.handles['source'] for p in plot.subplots.values()]
+        self.assertIsNot(points, curve)
+        self.assertEqual(points.data['y'], np.arange(3.))
+        self.assertEqual(curve.data['y'], np.arange(3.)*2)
+
 
 class TestLegends(TestBokehPlot):
 
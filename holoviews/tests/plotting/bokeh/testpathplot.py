@@ -65,6 +65,22 @@ class TestPathPlot(TestBokehPlot):
         self.assertEqual(len(source.data['ys']), 0)
         self.assertEqual(len(source.data['Intensity']), 0)
 
+    def test_path_uncolored_nan_separated(self):
+        path = Path([[(0, 1), (1, 2)], [(3, 4), (4, 5)]])
+        plot = bokeh_renderer.get_plot(path)
+        source = plot.handles['source']
+        self.assertEqual(source.data['xs'], [np.array([0, 1, np.NaN, 3, 4])])
+        self.assertEqual(source.data['ys'], [np.array([1, 2, np.NaN, 4, 5])])
+
+    def test_path_colored_multiple_paths_split(self):
+        path = Path([{'x': [0, 1, 2], 'y': [1, 2, 3], 'c': [0, 1, 2]},
+                     {'x': [3, 4], 'y': [4, 5], 'c': [3, 4]}], vdims='c').options(color_index='c')
+        plot = bokeh_renderer.get_plot(path)
+        source = plot.handles['source']
+        self.assertEqual(source.data['xs'], [np.array([0, 1]), np.array([1, 2]), np.array([3, 4])])
+        self.assertEqual(source.data['ys'], [np.array([1, 2]), np.array([2, 3]), np.array([4, 5])])
+        self.assertEqual(source.data['c'], np.array([0, 1, 3]))
+
     def test_path_colored_and_split_with_extra_vdims(self):
         xs = [1, 2, 3, 4]
         ys = xs[::-1]
@@ -487,3 +487,25 @@ class TestPointPlot(TestBokehPlot):
                    "and declare a size_index; ignoring the size_index.\n"
                    % plot.name)
         self.assertEqual(log_msg, warning)
+
+    def test_points_webgl_threshold_exceeded(self):
+        points = Points(np.random.rand(20, 2)).options(webgl_thresholds={'scatter': 10})
+        plot = bokeh_renderer.get_plot(points)
+        self.assertEqual(plot.state.output_backend, 'webgl')
+
+    def test_points_webgl_threshold_not_exceeded(self):
+        points = Points(np.random.rand(5, 2)).options(webgl_thresholds={'scatter': 10})
+        plot = bokeh_renderer.get_plot(points)
+        self.assertEqual(plot.state.output_backend, 'canvas')
+
+    def test_points_overlay_webgl_threshold_sums_samples(self):
+        points = Points(np.random.rand(6, 2)).options(webgl_thresholds={'scatter': 10})
+        plot = bokeh_renderer.get_plot(points * points)
+        self.assertEqual(plot.state.output_backend, 'webgl')
+
+    def test_points_webgl_drops_unsupported_styles(self):
+        points = Points(np.random.rand(20, 2)).options(
+            webgl_thresholds={'scatter': 10}, line_dash='dashed')
+        plot = bokeh_renderer.get_plot(points)
+        glyph = plot.handles['glyph']
+        self.assertEqual(glyph.line_dash, [])
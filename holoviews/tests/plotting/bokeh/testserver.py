@@ -1,11 +1,16 @@
+import time
 from unittest import SkipTest
 
+import numpy as np
+
 from holoviews.core.spaces import DynamicMap
 from holoviews.core.options import Store
 from holoviews.element import Curve, Polygons, Path, HLine
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.plotting import Renderer
-from holoviews.streams import RangeXY, PlotReset
+from holoviews.streams import RangeXY, PlotReset, PointerX
+
+from ...utils import LoggingComparisonTestCase
 
 try:
     from bokeh.application.handlers import FunctionHandler
@@ -24,9 +29,10 @@ except:
     bokeh_renderer = None
 
 
-class TestBokehServerSetup(ComparisonTestCase):
+class TestBokehServerSetup(LoggingComparisonTestCase):
 
     def setUp(self):
+        super(TestBokehServerSetup, self).setUp()
         self.previous_backend = Store.current_backend
         if not bokeh_renderer:
             raise SkipTest("Bokeh required to test plot instantiation")
@@ -81,6 +87,92 @@ class TestBokehServerSetup(ComparisonTestCase):
         self.assertIn(cb.on_event, plot._event_callbacks['reset'])
 
 
+    def _run_executor(self, plot, doc):
+        for _ in range(50):
+            if not plot._executor_active:
+                break
+            time.sleep(0.05)
+        for cb in list(doc.session_callbacks):
+            cb.callback()
+
+    def test_threaded_executor_does_not_memoize_transient_events(self):
+        calls = []
+        def callback(x):
+            calls.append(x)
+            return Curve([1, 2, x])
+        stream = PointerX(x=0, transient=True)
+        dmap = DynamicMap(callback, streams=[stream], executor='threads')
+        doc = Document()
+        bokeh_renderer.server_doc(dmap, doc)
+        plot = bokeh_renderer.last_plot
+        for _ in range(2):
+            stream.event(x=1)
+            self._run_executor(plot, doc)
+        self.assertEqual(calls, [0, 1, 1])
+
+    def test_threaded_executor_uses_current_stream_dimensions(self):
+        calls = []
+        def callback(x):
+            calls.append(x)
+            return Curve([1, 2, x])
+        stream = PointerX(x=0)
+        dmap = DynamicMap(callback, kdims=['x'], streams=[stream], executor='threads')
+        doc = Document()
+        bokeh_renderer.server_doc(dmap, doc)
+        plot = bokeh_renderer.last_plot
+        for x in range(1, 3):
+            stream.event(x=x)
+            self._run_executor(plot, doc)
+        self.assertEqual(calls, [0, 1, 2])
+        self.assertEqual(plot.handles['source'].data['y'], np.array([1, 2, 2]))
+
+    def test_threaded_executor_warns_on_callback_error(self):
+        def callback(x):
+            if x == 1:
+                raise ValueError('Invalid x')
+            return Curve([1, 2, x])
+        stream = PointerX(x=0)
+        dmap = DynamicMap(callback, streams=[stream], executor='threads')
+        doc = Document()
+        bokeh_renderer.server_doc(dmap, doc)
+        plot = bokeh_renderer.last_plot
+        stream.event(x=1)
+        self._run_executor(plot, doc)
+        self.log_handler.assertContains('WARNING', 'evaluated by the executor raised')
+        self.assertEqual(plot.handles['source'].data['y'], np.array([1, 2, 0]))
+
+    def test_threaded_executor_drops_superseded_events(self):
+        calls = []
+        def callback(x):
+            calls.append(x)
+            time.sleep(0.1)
+            return Curve([1, 2, x])
+        stream = PointerX(x=0)
+        dmap = DynamicMap(callback, streams=[stream], executor='threads')
+        doc = Document()
+        bokeh_renderer.server_doc(dmap, doc)
+        plot = bokeh_renderer.last_plot
+        for x in range(1, 6):
+            stream.event(x=x)
+        self._run_executor(plot, doc)
+        self.assertEqual(calls[-1], 5)
+        self.assertLess(len(calls), 6)
+        self.assertEqual(plot.handles['source'].data['y'], np.array([1, 2, 5]))
+        self.assertTrue(dmap.latency['superseded'] > 0)
+
+    def test_rate_limited_stream_scheduled_on_server_doc(self):
+        stream = PointerX(x=0)
+        dmap = DynamicMap(lambda x: Curve([1, 2, x]), streams=[stream], max_rate=1)
+        doc = Document()
+        bokeh_renderer.server_doc(dmap, doc)
+        plot = bokeh_renderer.last_plot
+        stream.event(x=1)
+        stream.event(x=2)
+        self.assertEqual(plot.handles['source'].data['y'], np.array([1, 2, 1]))
+        self.assertEqual(len(doc.session_callbacks), 1)
+        list(doc.session_callbacks)[0].callback()
+        self.assertEqual(plot.handles['source'].data['y'], np.array([1, 2, 2]))
+
 
 class TestBokehServerRun(ComparisonTestCase):
 
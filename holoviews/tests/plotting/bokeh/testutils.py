@@ -1,10 +1,15 @@
 from unittest import SkipTest
 from nose.plugins.attrib import attr
+
+import numpy as np
+
 from holoviews.core import Store
 from holoviews.element.comparison import ComparisonTestCase
 
 try:
-    from holoviews.plotting.bokeh.util import filter_batched_data, glyph_order
+    from holoviews.plotting.bokeh.util import (
+        filter_batched_data, glyph_order, cds_column_fingerprint, cds_columns_equal
+    )
     from holoviews.plotting.bokeh.styles import expand_batched_style
     bokeh_renderer = Store.renderers['bokeh']
 except:
@@ -83,3 +88,23 @@ class TestBokehUtilsInstantiation(ComparisonTestCase):
         order = glyph_order(['scatter_1', 'patch_1', 'rect_1'],
                             ['scatter', 'patch'])
         self.assertEqual(order, ['scatter_1', 'patch_1', 'rect_1'])
+
+    def test_cds_column_fingerprint_list_values(self):
+        self.assertNotEqual(cds_column_fingerprint([-1, 3]),
+                            cds_column_fingerprint([-2, 3]))
+        self.assertNotEqual(cds_column_fingerprint([1, 3]),
+                            cds_column_fingerprint([True, 3]))
+        self.assertEqual(cds_column_fingerprint(['a', 1]),
+                         cds_column_fingerprint(['a', 1]))
+
+    def test_cds_column_fingerprint_nested_list(self):
+        self.assertIs(cds_column_fingerprint([np.array([1, 2])]), None)
+
+    def test_cds_columns_equal_lists(self):
+        self.assertTrue(cds_columns_equal(['a', -1], ['a', -1]))
+        self.assertFalse(cds_columns_equal(['a', -1], ['a', -2]))
+
+    def test_cds_columns_equal_arrays(self):
+        self.assertTrue(cds_columns_equal(np.array([1., np.nan]), np.array([1., np.nan])))
+        self.assertFalse(cds_columns_equal(np.array([1., 2.]), np.array([1., 3.])))
+        self.assertFalse(cds_columns_equal(np.array([1, 2]), np.array([1., 2.])))
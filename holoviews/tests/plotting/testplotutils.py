@@ -16,7 +16,7 @@ from holoviews.plotting.util import (
     compute_overlayable_zorders, get_min_distance, process_cmap,
     initialize_dynamic, split_dmap_overlay, _get_min_distance_numpy,
     bokeh_palette_to_palette, mplcmap_to_palette, color_intervals,
-    get_range, get_axis_padding)
+    get_range, get_axis_padding, path_segments, nan_separated_paths)
 from holoviews.streams import PointerX
 
 try:
@@ -613,6 +613,29 @@ class TestPlotUtils(ComparisonTestCase):
         dist = _get_min_distance_numpy(Points((X.flatten(), Y.flatten())))
         self.assertEqual(dist, 1.0)
 
+    def test_path_segments(self):
+        paths = [np.array([[0, 1], [1, 2], [2, 3]]), np.array([[4, 5], [5, 6]])]
+        segments = path_segments(paths)
+        self.assertEqual(segments, np.array([[[0, 1], [1, 2]], [[1, 2], [2, 3]],
+                                             [[4, 5], [5, 6]]]))
+
+    def test_path_segments_skips_empty_and_single_vertex_paths(self):
+        paths = [np.empty((0, 3)), np.array([[0, 1, 2]]), np.array([[0, 1, 2], [1, 2, 3]])]
+        self.assertEqual(path_segments(paths), np.array([[[0, 1, 2], [1, 2, 3]]]))
+
+    def test_path_segments_empty(self):
+        self.assertEqual(path_segments([np.empty((0, 3))]).shape, (0, 2, 3))
+
+    def test_nan_separated_paths(self):
+        paths = [np.array([[0, 1], [1, 2]]), np.array([[4, 5.], [5, 6]])]
+        self.assertEqual(nan_separated_paths(paths),
+                         np.array([[0, 1], [1, 2], [np.NaN, np.NaN], [4, 5], [5, 6]]))
+
+    def test_nan_separated_paths_datetime(self):
+        dates = np.array(['2018-01-01', '2018-01-02'], dtype='datetime64[ns]')
+        paths = [np.column_stack([dates, dates]), np.column_stack([dates, dates])]
+        self.assertIs(nan_separated_paths(paths), None)
+
 
 class TestRangeUtilities(ComparisonTestCase):
 
@@ -1,6 +1,7 @@
 """
 Unit test of the streams system
 """
+import time
 from collections import defaultdict
 from unittest import SkipTest
 
@@ -475,6 +476,99 @@ class TestSubscribers(ComparisonTestCase):
         self.assertEqual(subscriber2.call_count, 1)
 
 
+class TestStreamRateLimiting(ComparisonTestCase):
+
+    def setUp(self):
+        self.scheduled = []
+
+    def _scheduler(self, delay, callback):
+        self.scheduled.append((delay, callback))
+
+    def test_invalid_trigger_policy(self):
+        with self.assertRaises(ValueError):
+            PointerX(trigger_policy='invalid')
+
+    def test_negative_trigger_interval(self):
+        with self.assertRaises(ValueError):
+            PointerX(trigger_policy='latest', trigger_interval=-1)
+
+    def test_zero_trigger_interval_debounced_policies(self):
+        for policy in ['throttle', 'debounce']:
+            with self.assertRaises(ValueError):
+                PointerX(trigger_policy=policy, trigger_interval=0)
+
+    def test_zero_trigger_interval_latest_policy(self):
+        stream = PointerX(trigger_policy='latest', trigger_interval=0)
+        self.assertEqual(stream.trigger_interval, 0)
+
+    def test_throttle_coalesces_events(self):
+        subscriber = TestSubscriber()
+        stream = PointerXY(subscribers=[subscriber], trigger_policy='throttle',
+                           trigger_interval=10)
+        stream._scheduler = self._scheduler
+        stream.event(x=1, y=1)
+        self.assertEqual(subscriber.call_count, 1)
+        stream.event(x=2)
+        stream.event(y=3)
+        self.assertEqual(subscriber.call_count, 1)
+        self.assertEqual(len(self.scheduled), 1)
+        self.scheduled[0][1]()
+        self.assertEqual(subscriber.call_count, 2)
+        self.assertEqual(subscriber.kwargs, dict(x=2, y=3))
+
+    def test_debounce_defers_trigger(self):
+        subscriber = TestSubscriber()
+        stream = PointerX(subscribers=[subscriber], trigger_policy='debounce',
+                          trigger_interval=0.001)
+        stream._scheduler = self._scheduler
+        stream.event(x=1)
+        stream.event(x=2)
+        self.assertEqual(subscriber.call_count, 0)
+        self.assertEqual(len(self.scheduled), 1)
+        time.sleep(0.01)
+        self.scheduled[0][1]()
+        self.assertEqual(subscriber.call_count, 1)
+        self.assertEqual(subscriber.kwargs, dict(x=2))
+
+    def test_debounce_reschedules_on_new_events(self):
+        subscriber = TestSubscriber()
+        stream = PointerX(subscribers=[subscriber], trigger_policy='debounce',
+                          trigger_interval=10)
+        stream._scheduler = self._scheduler
+        stream.event(x=1)
+        self.scheduled[0][1]()
+        self.assertEqual(subscriber.call_count, 0)
+        self.assertEqual(len(self.scheduled), 2)
+
+    def test_latest_retriggers_once_with_latest_contents(self):
+        values = []
+        stream = PointerX(trigger_policy='latest')
+        def subscriber(x):
+            values.append(x)
+            if x == 1:
+                stream.event(x=2)
+                stream.event(x=3)
+        stream.add_subscriber(subscriber)
+        stream.event(x=1)
+        self.assertEqual(values, [1, 3])
+
+    def test_dynamicmap_max_rate_throttles_streams(self):
+        stream = PointerX()
+        DynamicMap(lambda x: Points([x]), streams=[stream], max_rate=4)
+        self.assertEqual(Stream._rate_limit([stream]), ('throttle', 0.25))
+
+    def test_stream_policy_overrides_dynamicmap_max_rate(self):
+        stream = PointerX(trigger_policy='debounce', trigger_interval=1)
+        DynamicMap(lambda x: Points([x]), streams=[stream], max_rate=4)
+        self.assertEqual(Stream._rate_limit([stream]), ('debounce', 1))
+
+    def test_rename_preserves_trigger_policy(self):
+        stream = PointerX(trigger_policy='throttle', trigger_interval=1)
+        renamed = stream.rename(x='x1')
+        self.assertEqual(renamed.trigger_policy, 'throttle')
+        self.assertEqual(renamed.trigger_interval, 1)
+
+
 class TestStreamSource(ComparisonTestCase):
 
     def tearDown(self):